@@ -1,11 +1,12 @@
 import { Toaster } from "@/components/ui/sonner";
 import { TooltipProvider } from "@/components/ui/tooltip";
 import NotFound from "@/pages/NotFound";
-import { Route, Switch } from "wouter";
+import { useEffect } from "react";
+import { Route, Switch, useLocation } from "wouter";
 import ErrorBoundary from "./components/ErrorBoundary";
 import { ThemeProvider } from "./contexts/ThemeContext";
 import { I18nextProvider } from "react-i18next";
-import i18n from "./i18n/config";
+import i18n, { preloadSectionsForPath } from "./i18n/config";
 import Home from "./pages/Home";
 import Products from "./pages/Products";
 import ProductDetail from "./pages/ProductDetail";
@@ -36,6 +37,13 @@ import ResetPassword from "./pages/ResetPassword";
 import ForgotPassword from "./pages/ForgotPassword";
 
 function Router() {
+  const [location] = useLocation();
+
+  // Fetch the locale sections the next page needs before it renders its keys
+  useEffect(() => {
+    void preloadSectionsForPath(location);
+  }, [location]);
+
   // make sure to consider if you need authentication for certain routes
   return (
     <Switch>
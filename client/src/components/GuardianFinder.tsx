@@ -5,7 +5,7 @@ import { Link } from "wouter";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { Card } from "@/components/ui/card";
-import { getLocalized } from "@/lib/localized";
+import { getLocalized, productLang } from "@/lib/localized";
 
 export default function GuardianFinder() {
   const { t } = useTranslation();
@@ -13,7 +13,7 @@ export default function GuardianFinder() {
   const [showResults, setShowResults] = useState(false);
   
   const { data: recommendations, isLoading, refetch } = trpc.products.getGuardianRecommendations.useQuery(
-    { birthdate },
+    { birthdate, lang: productLang() },
     { enabled: false }
   );
 
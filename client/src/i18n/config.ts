@@ -1,50 +1,131 @@
 import i18n from 'i18next';
 import { initReactI18next } from 'react-i18next';
 import LanguageDetector from 'i18next-browser-languagedetector';
-import en from './locales/en.json';
-import zh from './locales/zh.json';
-import de from './locales/de.json';
-import fr from './locales/fr.json';
-import es from './locales/es.json';
-import it from './locales/it.json';
-import pt from './locales/pt.json';
-import ru from './locales/ru.json';
-import ja from './locales/ja.json';
-import ko from './locales/ko.json';
-import ar from './locales/ar.json';
-import hi from './locales/hi.json';
-import th from './locales/th.json';
-import vi from './locales/vi.json';
-import id from './locales/id.json';
-import tr from './locales/tr.json';
-import zhHant from './locales/zh-Hant.json';
+import chunks from './chunks.json';
+import { SUPPORTED_LANGUAGES } from '@shared/const';
+
+/**
+ * Locale files are split per top-level section by scripts/build-locale-chunks.py
+ * and served from /locales/<lng>/<section>.<hash>.json. Only the active language
+ * (plus the en fallback) is fetched, and only the sections a page needs:
+ * core sections at startup, route sections on navigation, and anything else
+ * the first time t() misses a key in that section.
+ *
+ * Non-en chunks are compiled sparse (only values that differ from en), so the
+ * en chunk of every section is always loaded alongside and serves as fallback.
+ */
+type ChunkManifest = {
+  base: string;
+  core: string[];
+  languages: Record<string, Record<string, string>>;
+};
+
+const manifest = chunks as ChunkManifest;
+const ROOT_NAMESPACE = '_root';
+const FALLBACK_LNG = 'en';
+
+const ROUTE_SECTIONS: Array<[string, string[]]> = [
+  ['/wobifa888', ['admin']],
+  ['/products/', ['product_detail', 'products', 'fortuneUpload']],
+  ['/products', ['products', 'categories', 'destiny']],
+  ['/cart', ['cart', 'checkout']],
+  ['/checkout', ['checkout', 'cart']],
+  ['/account', ['account', 'cart']],
+  ['/orders/', ['account', 'checkout']],
+  ['/report/', ['reportView']],
+  ['/', ['hero', 'home', 'serviceCards', 'aboutUs', 'categories', 'guardianFinder']],
+];
+
+const loaded = new Map<string, Promise<void>>();
+const requestedSections = new Set<string>();
+
+function manifestLanguage(lng: string | undefined): string {
+  if (lng && manifest.languages[lng]) return lng;
+  const base = lng?.split('-')[0];
+  if (base && manifest.languages[base]) return base;
+  return FALLBACK_LNG;
+}
+
+function loadChunk(lng: string, section: string): Promise<void> {
+  const digest = manifest.languages[lng]?.[section];
+  if (!digest) return Promise.resolve();
+
+  const cacheKey = `${lng}/${section}`;
+  const pending = loaded.get(cacheKey);
+  if (pending) return pending;
+
+  const request = fetch(`${manifest.base}${lng}/${section}.${digest}.json`)
+    .then((res) => {
+      if (!res.ok) throw new Error(`HTTP ${res.status}`);
+      return res.json();
+    })
+    .then((data) => {
+      i18n.addResourceBundle(lng, 'translation', section === ROOT_NAMESPACE ? data : { [section]: data }, true, true);
+    })
+    .catch((error) => {
+      loaded.delete(cacheKey);
+      console.error(`[i18n] Failed to load ${cacheKey}`, error);
+    });
+  loaded.set(cacheKey, request);
+  return request;
+}
+
+type LocaleUpdate = { lng: string; section: string; data: Record<string, unknown> };
+
+// Sections pushed by scripts/watch-locales.py --push during development. Each section
+// replaces the loaded one wholesale (not deep-merged), so deleted keys disappear too.
+// The root section is spread over the top level of the bundle, where a shallow merge
+// would keep deleted keys, so its old string keys are dropped and the bundle re-added.
+function replaceRootSection(lng: string, data: Record<string, unknown>) {
+  const sections: Record<string, unknown> = {};
+  for (const [key, value] of Object.entries(i18n.getResourceBundle(lng, 'translation') ?? {})) {
+    if (typeof value === 'object' && value !== null) sections[key] = value;
+  }
+  i18n.removeResourceBundle(lng, 'translation');
+  i18n.addResourceBundle(lng, 'translation', { ...sections, ...data }, false, true);
+}
+
+if (import.meta.hot) {
+  import.meta.hot.on('i18n:update', (updates: LocaleUpdate[]) => {
+    const active = new Set([manifestLanguage(i18n.language), FALLBACK_LNG]);
+    for (const { lng, section, data } of updates) {
+      if (!active.has(lng)) continue;
+      if (section === ROOT_NAMESPACE) replaceRootSection(lng, data);
+      else i18n.addResourceBundle(lng, 'translation', { [section]: data }, false, true);
+    }
+  });
+}
+
+export function loadLocaleSections(sections: string[], lng: string = i18n.language): Promise<void> {
+  sections.forEach((section) => requestedSections.add(section));
+  const languages = Array.from(new Set([manifestLanguage(lng), FALLBACK_LNG]));
+  return Promise.all(languages.flatMap((l) => sections.map((section) => loadChunk(l, section)))).then(() => undefined);
+}
+
+export function sectionsForPath(pathname: string): string[] {
+  const match = ROUTE_SECTIONS.find(([prefix]) => (prefix === '/' ? pathname === '/' : pathname.startsWith(prefix)));
+  return match ? match[1] : [];
+}
+
+export function preloadSectionsForPath(pathname: string): Promise<void> {
+  return loadLocaleSections([...manifest.core, ...sectionsForPath(pathname)]);
+}
 
 i18n
   .use(LanguageDetector)
   .use(initReactI18next)
   .init({
-    resources: {
-      en: { translation: en },
-      zh: { translation: zh },
-      de: { translation: de },
-      fr: { translation: fr },
-      es: { translation: es },
-      it: { translation: it },
-      pt: { translation: pt },
-      ru: { translation: ru },
-      ja: { translation: ja },
-      ko: { translation: ko },
-      ar: { translation: ar },
-      hi: { translation: hi },
-      th: { translation: th },
-      vi: { translation: vi },
-      id: { translation: id },
-      tr: { translation: tr },
-      'zh-Hant': { translation: zhHant },
-    },
-    fallbackLng: 'en',
-    supportedLngs: ['en', 'zh', 'zh-Hant', 'de', 'fr', 'es', 'it', 'pt', 'ru', 'ja', 'ko', 'ar', 'hi', 'th', 'vi', 'id', 'tr'],
+    resources: {},
+    partialBundledLanguages: true,
+    fallbackLng: FALLBACK_LNG,
+    supportedLngs: [...SUPPORTED_LANGUAGES],
     nonExplicitSupportedLngs: true,
+    // A missing key usually means its section has not been fetched yet
+    saveMissing: true,
+    missingKeyHandler: (_lngs, _ns, key) => {
+      const section = key.includes('.') ? key.split('.')[0] : ROOT_NAMESPACE;
+      void loadLocaleSections([section]);
+    },
     interpolation: {
       escapeValue: false,
     },
@@ -64,4 +145,13 @@ i18n
     debug: false,
   });
 
+// Keys of sections already loaded in the previous language would otherwise
+// resolve silently to the en fallback, so fetch all of them again.
+i18n.on('languageChanged', (lng) => {
+  void loadLocaleSections([...manifest.core, ...requestedSections], lng);
+});
+
+/** Resolves once the core and current-route sections are available. */
+export const i18nReady = preloadSectionsForPath(window.location.pathname);
+
 export default i18n;
@@ -1,4 +1,5 @@
 import i18n from 'i18next';
+import { SUPPORTED_LANGUAGES, type SupportedLanguage } from '@shared/const';
 
 /**
  * Extract localized text from a JSON multilingual field.
@@ -9,11 +10,14 @@ import i18n from 'i18next';
  * This function returns the text for the current language,
  * falling back to 'en' then 'zh' if the current language is not available.
  * 
- * If the value is a plain string (not JSON), it returns it as-is for backward compatibility.
+ * If the value is a plain string (not JSON), it returns it as-is. Product queries
+ * that pass `lang: productLang()` already receive plain strings resolved
+ * server-side, so those values skip JSON parsing entirely.
  */
 export function getLocalized(value: string | null | undefined): string {
   if (!value) return '';
-  
+  if (value[0] !== '{') return value;
+
   // Try to parse as JSON
   try {
     const obj = JSON.parse(value);
@@ -38,3 +42,9 @@ export function getLocalized(value: string | null | undefined): string {
   
   return value;
 }
+
+/** Language to request pre-resolved product text in (the active i18next language). */
+export function productLang(): SupportedLanguage {
+  const lang = i18n.resolvedLanguage || i18n.language;
+  return (SUPPORTED_LANGUAGES as readonly string[]).includes(lang) ? (lang as SupportedLanguage) : 'en';
+}
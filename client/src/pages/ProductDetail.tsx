@@ -12,7 +12,7 @@ import OptimizedImage from "@/components/OptimizedImage";
 import ImageLightbox from "@/components/ImageLightbox";
 import FortuneServiceUpload from "@/components/FortuneServiceUpload";
 import { toast } from "sonner";
-import { getLocalized } from "@/lib/localized";
+import { getLocalized, productLang } from "@/lib/localized";
 
 export default function ProductDetail() {
   const { t, i18n } = useTranslation();
@@ -63,7 +63,7 @@ export default function ProductDetail() {
   const [newReviewRating, setNewReviewRating] = useState(5); // 新评价评分
   const [newReviewComment, setNewReviewComment] = useState(''); // 新评价内容
 
-  const { data: product, isLoading } = trpc.products.getBySlug.useQuery({ slug: slug! });
+  const { data: product, isLoading } = trpc.products.getBySlug.useQuery({ slug: slug!, lang: productLang() });
   const addToCartMutation = trpc.cart.add.useMutation();
   const submitReviewMutation = trpc.products.submitReview.useMutation();
   const utils = trpc.useUtils();
@@ -9,7 +9,7 @@ import { Search, Sparkles, SlidersHorizontal, ShoppingCart } from "lucide-react"
 import OptimizedImage from "@/components/OptimizedImage";
 import { Link } from "wouter";
 import { useTranslation } from "react-i18next";
-import { getLocalized } from "@/lib/localized";
+import { getLocalized, productLang } from "@/lib/localized";
 
 export default function Products() {
   const { t } = useTranslation();
@@ -46,6 +46,7 @@ export default function Products() {
     categoryId,
     // blessedOnly: true, // 移除此限制,允许显示所有产品包括命理服务
     limit: 50,
+    lang: productLang(),
   });
 
   // 获取启蕴信物的子分类(parentId = 1)
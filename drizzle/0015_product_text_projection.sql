@@ -0,0 +1,17 @@
+CREATE TABLE `product_texts` (
+	`id` int AUTO_INCREMENT NOT NULL,
+	`productId` int NOT NULL,
+	`lang` varchar(10) NOT NULL,
+	`name` text NOT NULL,
+	`shortDescription` text,
+	`description` text,
+	`blessingDescription` text,
+	`suitableFor` text,
+	`efficacy` text,
+	`wearingGuide` text,
+	`sourceHash` varchar(64) NOT NULL,
+	`updatedAt` timestamp NOT NULL DEFAULT (now()) ON UPDATE CURRENT_TIMESTAMP,
+	CONSTRAINT `product_texts_id` PRIMARY KEY(`id`)
+);
+--> statement-breakpoint
+CREATE UNIQUE INDEX `product_texts_product_lang_idx` ON `product_texts` (`productId`,`lang`);
\ No newline at end of file
@@ -0,0 +1,13 @@
+CREATE TABLE `review_language_audits` (
+	`reviewId` int NOT NULL,
+	`declared` varchar(10),
+	`detected` varchar(10),
+	`code` varchar(20) NOT NULL,
+	`script` varchar(16) NOT NULL,
+	`share` int NOT NULL,
+	`fixed` boolean NOT NULL DEFAULT false,
+	`auditedAt` timestamp NOT NULL DEFAULT (now()),
+	CONSTRAINT `review_language_audits_reviewId` PRIMARY KEY(`reviewId`)
+);
+--> statement-breakpoint
+CREATE INDEX `review_language_audits_code_idx` ON `review_language_audits` (`code`);
\ No newline at end of file
@@ -1,4 +1,4 @@
-import { int, mysqlEnum, mysqlTable, text, timestamp, varchar, decimal, boolean, json } from "drizzle-orm/mysql-core";
+import { int, mysqlEnum, mysqlTable, text, timestamp, varchar, decimal, boolean, json, index, uniqueIndex } from "drizzle-orm/mysql-core";
 
 /**
  * 用户表 - 核心认证和权限管理
@@ -88,6 +88,31 @@ export const products = mysqlTable("products", {
 export type Product = typeof products.$inferSelect;
 export type InsertProduct = typeof products.$inferInsert;
 
+/**
+ * 产品多语言文本投影表
+ * 由 products 的多语言 JSON 字段按回退链(语言 -> 基础语言 -> en -> zh)预先解析而来,
+ * 每个产品每种语言一行,写入产品时同步刷新(见 server/productText.ts)
+ */
+export const productTexts = mysqlTable("product_texts", {
+  id: int("id").autoincrement().primaryKey(),
+  productId: int("productId").notNull(),
+  lang: varchar("lang", { length: 10 }).notNull(),
+  name: text("name").notNull(),
+  shortDescription: text("shortDescription"),
+  description: text("description"),
+  blessingDescription: text("blessingDescription"),
+  suitableFor: text("suitableFor"),
+  efficacy: text("efficacy"),
+  wearingGuide: text("wearingGuide"),
+  sourceHash: varchar("sourceHash", { length: 64 }).notNull(), // 源字段哈希,未变化时跳过重写
+  updatedAt: timestamp("updatedAt").defaultNow().onUpdateNow().notNull(),
+}, (table) => [
+  uniqueIndex("product_texts_product_lang_idx").on(table.productId, table.lang),
+]);
+
+export type ProductText = typeof productTexts.$inferSelect;
+export type InsertProductText = typeof productTexts.$inferInsert;
+
 /**
  * 产品图片表
  */
@@ -282,6 +307,26 @@ export const reviews = mysqlTable("reviews", {
 export type Review = typeof reviews.$inferSelect;
 export type InsertReview = typeof reviews.$inferInsert;
 
+/**
+ * 评价语言审计结果
+ * 由 scripts/audit-reviews.py 按 id 区间流式写入,每次审计先清掉区间内的旧结果;
+ * 只记录声明语言与正文文字/语言不符的评价,fixed 表示已按 detected 改写 reviews.language
+ */
+export const reviewLanguageAudits = mysqlTable("review_language_audits", {
+  reviewId: int("reviewId").primaryKey(),
+  declared: varchar("declared", { length: 10 }), // 审计时 reviews.language 的值
+  detected: varchar("detected", { length: 10 }), // 推断的语言,无法确定时为空
+  code: varchar("code", { length: 20 }).notNull(), // wrong_script / no_kana / wrong_language
+  script: varchar("script", { length: 16 }).notNull(), // 正文的主体文字
+  share: int("share").notNull(), // 主体文字的加权占比(百分比)
+  fixed: boolean("fixed").default(false).notNull(),
+  auditedAt: timestamp("auditedAt").defaultNow().notNull(),
+}, (table) => [
+  index("review_language_audits_code_idx").on(table.code),
+]);
+
+export type ReviewLanguageAudit = typeof reviewLanguageAudits.$inferSelect;
+
 /**
  * 优惠券使用记录表
  */
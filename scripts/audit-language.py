@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+按 Unicode 文字检查语言文件和商品多语言字段是否是声明的语言
+
+用法:
+    python3 scripts/audit-language.py                     全部语言文件，按语言汇总并列出每条问题
+    python3 scripts/audit-language.py --products          同时检查 products 表的多语言 JSON 列（默认 DATABASE_URL）
+    python3 scripts/audit-language.py --lang ja --lang th --summary
+    python3 scripts/audit-language.py --json              机器可读输出
+
+能发现 ja / ko / th / ar 等语言里的英文 fallback、各语言里残留的中文、ja 里混进的中文；
+同为拉丁字母的语言之间（如 de 里的英文）无法靠文字区分。有问题时退出码为 1。
+"""
+import argparse
+import json
+import sys
+import time
+
+from i18n_tools import LocaleStore
+from i18n_tools.db import Database
+from i18n_tools.product_sync import COLUMNS
+from i18n_tools.script_detect import check_language, locale_items, product_items
+
+
+def preview(text, width=60):
+    text = " ".join(text.split())
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def print_text(report, summary_only):
+    for (source, lang), by_script in sorted(report.counts().items()):
+        summary = ", ".join(f"{label} {count}" for label, count in sorted(by_script.items()))
+        print(f"  {source:9} {lang:8} {summary}")
+    if not summary_only and report.findings:
+        print()
+        for finding in report.findings:
+            print(f"{finding.lang:8} {finding.source}:{finding.key}  [{finding.code}] {finding.message}  {preview(finding.text)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="按 Unicode 文字检查字符串是否是声明的语言")
+    parser.add_argument("--lang", action="append", help="只检查指定语言（可重复）")
+    parser.add_argument("--products", action="store_true", help="同时检查 products 表的多语言 JSON 列")
+    parser.add_argument("--no-locales", action="store_true", help="跳过语言文件")
+    parser.add_argument("--database", help="数据库连接串（默认 DATABASE_URL）")
+    parser.add_argument("--summary", action="store_true", help="只打印按语言汇总")
+    parser.add_argument("--json", action="store_true", help="输出 JSON")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    items = []
+    if not args.no_locales:
+        items += locale_items(LocaleStore(), args.lang)
+    if args.products:
+        with Database(args.database) as reader:
+            items += product_items(reader, COLUMNS, args.lang)
+    loaded = time.perf_counter() - started
+    report = check_language(items)
+
+    if args.json:
+        json.dump(report.as_dict(), sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print_text(report, args.summary)
+        print(
+            f"\n{'❌' if report.findings else '✅'} {len(report.findings)} strings in the wrong script"
+            f" out of {report.strings} (load {loaded * 1000:.0f} ms, classify {report.elapsed * 1000:.0f} ms)"
+        )
+    return 1 if report.findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
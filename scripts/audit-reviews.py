@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+流式审计 reviews 表的评价语言，结果写入 review_language_audits 表
+
+用法:
+    python3 scripts/audit-reviews.py                          全表审计，按块写回审计结果（默认 DATABASE_URL）
+    python3 scripts/audit-reviews.py --fix                    同时把能推断出语言的评价改写 reviews.language
+    python3 scripts/audit-reviews.py --dry-run --limit 100000 只统计，不写库
+    python3 scripts/audit-reviews.py --after-id 1500000 --workers 8 --chunk-size 10000
+    python3 scripts/audit-reviews.py --json report.json
+
+服务端游标按 id 顺序分块读取，进程池逐块判断（文字不符、ja 里没有假名、拉丁字母语言之间的错配），
+每块一个事务写回；内存占用与表的行数无关。中断后用 --after-id 接着上次输出的 id 继续。
+"""
+import argparse
+import json
+import sys
+import time
+
+from i18n_tools.db import Database
+from i18n_tools.review_audit import CHUNK_SIZE, TABLE, audit_reviews
+
+PROGRESS_INTERVAL = 2.0
+
+
+def print_summary(stats):
+    print(f"📊 {stats.rows} reviews, {stats.findings} findings, {stats.unchecked} with unknown language")
+    for code, count in stats.by_code.most_common():
+        print(f"  {code:16} {count:8}")
+    for declared, counts in sorted(stats.by_lang.items()):
+        detected = ", ".join(f"{lang} {count}" for lang, count in counts.most_common())
+        print(f"  {declared:8} → {detected}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="流式审计 reviews 表的评价语言")
+    parser.add_argument("--database", help="数据库连接串（默认 DATABASE_URL）")
+    parser.add_argument("--fix", action="store_true", help="把能推断出语言的评价改写 reviews.language")
+    parser.add_argument("--dry-run", action="store_true", help="只统计，不写审计结果也不改写评价")
+    parser.add_argument("--workers", type=int, help="工作进程数（默认 CPU 核数，0 为在当前进程内处理）")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"每块行数（默认 {CHUNK_SIZE}）")
+    parser.add_argument("--after-id", type=int, default=0, help="从这个 id 之后开始")
+    parser.add_argument("--limit", type=int, help="最多审计的行数")
+    parser.add_argument("--json", metavar="PATH", help="把统计写成 JSON 文件")
+    args = parser.parse_args(argv)
+    if args.fix and args.dry_run:
+        parser.error("--fix 和 --dry-run 不能同时使用")
+
+    last_report = [time.perf_counter()]
+
+    def progress(stats):
+        now = time.perf_counter()
+        if now - last_report[0] < PROGRESS_INTERVAL:
+            return
+        last_report[0] = now
+        print(
+            f"  … up to id {stats.last_id}: {stats.rows} reviews, {stats.findings} findings, "
+            f"{stats.fixed} fixed ({stats.rate:.0f} rows/s)",
+            flush=True,
+        )
+
+    with Database(args.database) as reader, Database(args.database) as writer:
+        stats = audit_reviews(
+            reader,
+            None if args.dry_run else writer,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            after_id=args.after_id,
+            limit=args.limit,
+            fix=args.fix,
+            progress=progress,
+        )
+
+    print_summary(stats)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(stats.as_dict(), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+    target = "not written" if args.dry_run else f"written to {TABLE}"
+    print(
+        f"✅ {stats.rows} reviews in {stats.elapsed:.1f}s ({stats.rate:.0f} rows/s), "
+        f"{stats.findings} findings {target}, {stats.fixed} reviews fixed, last id {stats.last_id}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+i18n 工具链基准测试
+
+用法:
+    python3 scripts/bench-i18n.py                          630 / 5000 / 50000 个 key × 17 种语言，打印表格
+    python3 scripts/bench-i18n.py --json bench.json        同时把结果写成 JSON
+    python3 scripts/bench-i18n.py --check                  与 scripts/bench-thresholds.json 比较，变慢时退出码 1
+    python3 scripts/bench-i18n.py --update-baseline        把本次结果写成新的基线
+    python3 scripts/bench-i18n.py --scales 630,5000 --case lint --case index
+
+翻译流水线用 FakeTransport 模拟模型（--latency 秒/请求），不需要 API key。
+"""
+import argparse
+import json
+import sys
+
+from i18n_tools.bench import SCALES, THRESHOLDS_PATH, Bench, check_regressions, load_thresholds, report, \
+    save_thresholds, update_baseline
+
+
+def print_result(result):
+    extra = "  ".join(f"{k}={v}" for k, v in result.extra.items())
+    print(
+        f"  {result.case:14} {result.keys:>7} keys  {result.seconds * 1000:10.1f} ms  "
+        f"{result.ns_per_unit:10.1f} ns/unit  {extra}",
+        flush=True,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="i18n 工具链基准测试")
+    parser.add_argument("--scales", default=",".join(map(str, SCALES)), help="英文 key 数，逗号分隔")
+    parser.add_argument("--case", action="append", help="只运行指定用例，可多次指定")
+    parser.add_argument("--repeat", type=int, default=3, help="每个用例重复次数，取最快一次")
+    parser.add_argument("--latency", type=float, default=0.02, help="FakeTransport 每个请求的延迟（秒）")
+    parser.add_argument("--concurrency", type=int, default=8, help="翻译流水线并发数")
+    parser.add_argument("--json", help="把结果写入 JSON 文件（- 为 stdout）")
+    parser.add_argument("--thresholds", default=THRESHOLDS_PATH, help="基线和阈值文件")
+    parser.add_argument("--check", action="store_true", help="与基线比较，有回归时退出码 1")
+    parser.add_argument("--update-baseline", action="store_true", help="把本次结果写入基线")
+    args = parser.parse_args(argv)
+
+    scales = [int(s) for s in args.scales.split(",") if s]
+    bench = Bench(repeat=args.repeat, latency=args.latency, concurrency=args.concurrency)
+    quiet = args.json == "-"
+    if not quiet:
+        print(f"⏱️  {len(bench.langs)} languages, scales {scales}")
+    results = bench.run(scales, args.case, None if quiet else print_result)
+
+    thresholds = load_thresholds(args.thresholds)
+    regressions = check_regressions(results, thresholds)
+    output = report(results, scales)
+    output["regressions"] = regressions
+
+    if args.json == "-":
+        print(json.dumps(output, ensure_ascii=False, indent=2))
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+    if args.update_baseline:
+        save_thresholds(update_baseline(thresholds, results), args.thresholds)
+        if not quiet:
+            print(f"💾 baseline updated: {args.thresholds}")
+        return 0
+
+    if not quiet:
+        for r in regressions:
+            what = "ns/unit" if r["kind"] == "slower" else "x per-unit cost growth"
+            print(f"  ❌ {r['case']} @ {r['keys']}: {r['value']} {what} > {r['limit']}")
+        if not regressions and thresholds.get("baseline"):
+            print("✅ no regressions")
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
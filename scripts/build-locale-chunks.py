@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+把 client/src/i18n/locales 拆成按 section 懒加载的 chunk
+
+用法:
+    python3 scripts/build-locale-chunks.py           生成 chunk 和 client/src/i18n/chunks.json
+    python3 scripts/build-locale-chunks.py --check   只检查生成结果是否为最新（CI 用，过期时退出码 1）
+    python3 scripts/build-locale-chunks.py --dense   不做稀疏化/去重，按源文件原样拆分（排查问题用）
+
+默认经过 i18n_tools.compiler 编译：非英文语言只输出与英文不同的值。
+"""
+import argparse
+import sys
+
+from i18n_tools import LocaleStore
+from i18n_tools.chunks import build_chunks, is_up_to_date, payload_report, write_chunks
+from i18n_tools.compiler import LocaleCompiler
+
+
+def kb(n):
+    return f"{n / 1024:7.1f} KB"
+
+
+def print_report(report):
+    raw, gz = report["before_initial_js"]
+    print("Initial JS i18n payload")
+    print(f"  before  all locales inlined  {kb(raw)}  (gzip {kb(gz)})")
+    raw, gz = report["after_initial_js"]
+    print(f"  after   chunk manifest only  {kb(raw)}  (gzip {kb(gz)})")
+    print("First-paint locale fetch (core sections, active language + en fallback)")
+    for lang, (raw, gz) in report["first_paint_fetch"].items():
+        print(f"  {lang:8} {kb(raw)}  (gzip {kb(gz)})")
+    print("Shipped per language (all sections)")
+    for lang, (dense, shipped) in report["shipped"].items():
+        print(f"  {lang:8} {kb(dense)} -> {kb(shipped)}  ({shipped / dense:6.1%})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="生成按 section 懒加载的语言 chunk")
+    parser.add_argument("--check", action="store_true", help="只检查生成结果是否为最新")
+    parser.add_argument("--dense", action="store_true", help="按源文件原样输出，不做稀疏化和去重")
+    parser.add_argument("--quiet", action="store_true", help="不打印负载对比报告")
+    args = parser.parse_args(argv)
+
+    store = LocaleStore()
+    compiler = None if args.dense else LocaleCompiler(store)
+    manifest, files = build_chunks(store, transform=compiler)
+
+    if args.check:
+        if is_up_to_date(manifest, files):
+            print("✅ locale chunks are up to date")
+            return 0
+        print("❌ locale chunks are stale, run: python3 scripts/build-locale-chunks.py")
+        return 1
+
+    added, removed, changed = write_chunks(manifest, files)
+    print(f"✓ {len(files)} chunks ({added} new, {removed} removed), manifest {'updated' if changed else 'unchanged'}")
+    if compiler is not None:
+        print(
+            f"  dropped {sum(compiler.dropped.values())} values identical to en, "
+            f"interned {sum(compiler.interned.values())} repeated strings"
+        )
+    if not args.quiet:
+        print_report(payload_report(store, manifest, files))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
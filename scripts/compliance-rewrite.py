@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+按合规词表（shared/compliance-terms.json）改写语言文件、种子 SQL 和 products 表
+
+用法:
+    python3 scripts/compliance-rewrite.py --audit                  只报告剩余命中（按语言、按 key），有命中时退出码 1
+    python3 scripts/compliance-rewrite.py                          改写全部语言文件、语言迁移和 seeds/ 下的 .sql / .sql.gz
+    python3 scripts/compliance-rewrite.py --products               同时改写 products 表（默认 DATABASE_URL）
+    python3 scripts/compliance-rewrite.py --no-locales --seed seeds/reviews.sql.gz
+    python3 scripts/compliance-rewrite.py --audit --json report.json
+
+每个目标只扫描一遍：词表按语言编译成一个正则，最长匹配优先，拉丁字母的词按整词匹配。
+改写语言文件后同时重新生成浏览器实际加载的 chunk（client/public/locales）；
+--audit 时 chunk 与语言文件不一致也算失败。
+语言迁移（scripts/locale-migrations/*.json）里的文案一并改写，并更新账本中的文件哈希，
+否则重放迁移会把语言文件改回原来的说法。改写 products 表后运行 pnpm products:project 刷新商品文本投影。
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+from i18n_tools import LocaleStore
+from i18n_tools.chunks import build_chunks, is_up_to_date, write_chunks
+from i18n_tools.compliance import (
+    TERMS_PATH,
+    Glossary,
+    Hits,
+    rewrite_locales,
+    rewrite_migrations,
+    rewrite_products,
+    rewrite_seed,
+)
+from i18n_tools.compiler import LocaleCompiler
+from i18n_tools.db import Database
+from i18n_tools.migrations import MIGRATIONS_DIR, Journal, discover
+from i18n_tools.sql_seed import open_seed
+
+SEEDS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../seeds"))
+
+
+def default_seeds():
+    return sorted(glob.glob(os.path.join(SEEDS_DIR, "*.sql")) + glob.glob(os.path.join(SEEDS_DIR, "*.sql.gz")))
+
+
+def print_hits(title, hits, verbose):
+    if not hits:
+        print(f"✅ {title}: 没有命中")
+        return
+    print(f"🔎 {title}: {hits.total} 处命中")
+    for lang, total, keys in hits.summary():
+        print(f"  {lang:8} {total:5} hits in {keys} keys")
+    if verbose:
+        for lang, keys in sorted(hits.by_lang.items()):
+            for key, counts in sorted(keys.items()):
+                terms = ", ".join(f"{term}×{n}" if n > 1 else term for term, n in counts.items())
+                print(f"    {lang:8} {key}  {terms}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="按合规词表改写语言文件、种子 SQL 和 products 表")
+    parser.add_argument("--audit", action="store_true", help="只报告命中，不写任何文件或数据库")
+    parser.add_argument("--no-locales", action="store_true", help="跳过语言文件")
+    parser.add_argument("--no-migrations", action="store_true", help="跳过语言迁移文件")
+    parser.add_argument("--migrations", default=MIGRATIONS_DIR, help="语言迁移目录")
+    parser.add_argument("--seed", action="append", help="种子 SQL 文件，可多次指定（默认 seeds/ 下全部）")
+    parser.add_argument("--no-seeds", action="store_true", help="跳过种子 SQL")
+    parser.add_argument("--products", action="store_true", help="处理 products 表")
+    parser.add_argument("--database", help="数据库连接串（默认 DATABASE_URL）")
+    parser.add_argument("--terms", default=TERMS_PATH, help="词表 JSON")
+    parser.add_argument("--json", metavar="PATH", help="把全部命中写成 JSON 文件")
+    parser.add_argument("--verbose", action="store_true", help="逐个 key 列出命中（--audit 时默认开启）")
+    args = parser.parse_args(argv)
+
+    glossary = Glossary.load(args.terms)
+    for name, term, replacement, found in glossary.cascades():
+        print(f"⚠️  {name}: {term} → {replacement} 的结果里仍含 {', '.join(found)}，重复执行会再次替换")
+    verbose = args.verbose or args.audit
+    verb = "remaining" if args.audit else "rewritten"
+    report = {}
+    stale_chunks = False
+
+    if not args.no_locales:
+        started = time.perf_counter()
+        store = LocaleStore()
+        if args.audit:
+            hits = rewrite_locales(store, glossary)
+        else:
+            with store.transaction() as tx:
+                hits = rewrite_locales(store, glossary, tx)
+        report["locales"] = hits
+        print_hits(f"locales ({verb})", hits, verbose)
+        print(f"  {len(store.langs)} locales, {store.writes} files written in {time.perf_counter() - started:.2f}s")
+        # 浏览器加载的是编译后的 chunk，只改语言文件不会改变线上文案
+        manifest, files = build_chunks(store, transform=LocaleCompiler(store))
+        if args.audit:
+            stale_chunks = not is_up_to_date(manifest, files)
+            if stale_chunks:
+                print("❌ locale chunks are stale, run: python3 scripts/build-locale-chunks.py")
+        else:
+            added, removed, _ = write_chunks(manifest, files)
+            print(f"  {len(files)} locale chunks ({added} new, {removed} removed)")
+
+    if not args.no_migrations:
+        migrations = discover(args.migrations)
+        hits, changed = rewrite_migrations(migrations, glossary, write=not args.audit)
+        report["locale-migrations"] = hits
+        print_hits(f"locale migrations ({verb})", hits, verbose)
+        if changed and not args.audit:
+            journal = Journal.load(os.path.join(args.migrations, "meta", "_journal.json"))
+            for migration in changed:
+                journal.rehash(migration)
+            journal.save()
+        print(f"  {len(migrations)} migrations, {len(changed)} {'need rewriting' if args.audit else 'rewritten'}")
+
+    for path in [] if args.no_seeds else (args.seed or default_seeds()):
+        started = time.perf_counter()
+        hits = Hits()
+        with open_seed(path, "r") as src:
+            if args.audit:
+                with open(os.devnull, "w", encoding="utf-8") as dst:
+                    stats, size = rewrite_seed(src, dst, glossary, hits)
+            else:
+                tmp_path = f"{path}.tmp"
+                with open_seed(tmp_path, "w", path.endswith(".gz")) as dst:
+                    stats, size = rewrite_seed(src, dst, glossary, hits)
+        if not args.audit:
+            if stats.changed_statements:
+                os.replace(tmp_path, path)
+            else:
+                os.remove(tmp_path)
+        name = os.path.relpath(path)
+        report[name] = hits
+        print_hits(f"{name} ({verb})", hits, verbose)
+        elapsed = time.perf_counter() - started
+        print(
+            f"  {stats.rows} rows in {stats.inserts} inserts, {stats.changed_statements} statements changed, "
+            f"{size / 1024 / 1024:.1f} MB in {elapsed:.2f}s"
+        )
+
+    if args.products:
+        started = time.perf_counter()
+        hits = Hits()
+        with Database(args.database) as reader, Database(args.database) as writer:
+            scanned, changed = rewrite_products(reader, writer, glossary, hits, dry_run=args.audit)
+        report["products"] = hits
+        print_hits(f"products ({verb})", hits, verbose)
+        print(f"  {scanned} products scanned, {changed} {'need rewriting' if args.audit else 'updated'} "
+              f"in {time.perf_counter() - started:.2f}s")
+        if changed and not args.audit:
+            print("next: pnpm products:project")
+
+    if args.json:
+        data = {target: hits.as_dict() for target, hits in report.items()}
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+    remaining = sum(hits.total for hits in report.values())
+    if args.audit:
+        print(f"\n{'❌' if remaining else '✅'} {remaining} compliance hits in {len(glossary)} terms")
+        return 1 if remaining or stale_chunks else 0
+    print(f"\n✅ {remaining} terms rewritten")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
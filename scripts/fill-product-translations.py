@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+补齐 products 表 name / shortDescription / description 中缺失的语言
+
+用法:
+    python3 scripts/fill-product-translations.py --dry-run         只统计缺失语言矩阵
+    python3 scripts/fill-product-translations.py                   翻译并写回（中断后重跑会从上次位置继续）
+    python3 scripts/fill-product-translations.py --restart         忽略上次进度，从头扫描
+    python3 scripts/fill-product-translations.py --lang ja --lang ko --limit 500
+
+默认连接 DATABASE_URL；请求并发、重试、翻译记忆与 translate-i18n.py 共用同一套实现。
+写回后运行 pnpm products:project 刷新商品文本投影。
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from i18n_tools.db import Database
+from i18n_tools.engine import DEFAULT_MODEL, TranslationEngine
+from i18n_tools.memory import DEFAULT_PATH as MEMORY_PATH, TranslationMemory
+from i18n_tools.product_fill import SUPPORTED_LANGUAGES, fill_products, load_state, save_state
+from i18n_tools.transport import transport_arg
+
+# 修改 prompt 时递增，翻译记忆按此版本隔离
+PROMPT_VERSION = "product-1"
+
+
+def print_matrix(stats):
+    print(f"📊 {stats.products} products scanned, {stats.gaps} columns with missing languages")
+    for lang in SUPPORTED_LANGUAGES:
+        if stats.missing_by_lang.get(lang):
+            print(f"  {lang:8} {stats.missing_by_lang[lang]:6} missing")
+
+
+async def run(args, memory):
+    state = {"last_id": 0} if args.restart else load_state()
+    if state.get("last_id"):
+        print(f"⏩ resuming after product id {state['last_id']}")
+    languages = tuple(args.lang) if args.lang else SUPPORTED_LANGUAGES
+    started = time.perf_counter()
+
+    def checkpoint(state, stats):
+        save_state(state)
+        rate = stats.products / (time.perf_counter() - started)
+        print(
+            f"  … up to id {state['last_id']}: {stats.filled} translations filled, "
+            f"{stats.updated} products updated ({rate:.0f} products/s)",
+            flush=True,
+        )
+
+    with Database(args.database) as reader, Database(args.database) as writer:
+        if args.dry_run:
+            stats = await fill_products(None, None, reader, writer, state, languages, args.limit)
+            print_matrix(stats)
+            return
+        async with TranslationEngine(
+            model=args.model,
+            concurrency=args.concurrency,
+            max_retries=args.max_retries,
+            base_url=args.base_url,
+            transport=args.transport,
+        ) as engine:
+            stats = await fill_products(engine, memory, reader, writer, state, languages, args.limit, checkpoint)
+        transport_summary = engine.transport.summary()
+        if transport_summary:
+            print(transport_summary)
+
+    # 完整跑完后清零进度，下次从头扫描（失败的语言仍缺失，会被重新发现）；--limit 截断时保留进度
+    if not args.limit or stats.products < args.limit:
+        save_state({"last_id": 0})
+    print_matrix(stats)
+    status = f"✅ {stats.filled} translations from {stats.sources} source texts, {stats.updated} products updated"
+    if stats.failed:
+        status += f" ⚠️  {stats.failed} failed, rerun to retry"
+    print(f"{status} ({time.perf_counter() - started:.1f}s)")
+    if stats.updated:
+        print("next: pnpm products:project")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="补齐商品多语言字段中缺失的语言")
+    parser.add_argument("--database", help="数据库连接串（默认 DATABASE_URL）")
+    parser.add_argument("--lang", action="append", choices=SUPPORTED_LANGUAGES, help="只补指定语言（可重复）")
+    parser.add_argument("--limit", type=int, default=None, help="本次最多处理的商品数")
+    parser.add_argument("--restart", action="store_true", help="忽略上次进度，从头扫描")
+    parser.add_argument("--dry-run", action="store_true", help="只统计缺失语言，不发送请求")
+    parser.add_argument("--concurrency", type=int, default=8, help="同时进行的请求数上限")
+    parser.add_argument("--max-retries", type=int, default=5, help="单个请求的最大重试次数")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--base-url", default=None, help="覆盖 API 地址（默认读取 OPENAI_BASE_URL）")
+    parser.add_argument("--transport", type=transport_arg, default=None, help="翻译请求的传输方式：live / record:PATH / replay:PATH / fake:latency=0.3,rate_limit=0.05,...（默认读取 I18N_TRANSPORT）")
+    parser.add_argument("--cache", default=MEMORY_PATH, help="翻译记忆 SQLite 文件路径")
+    parser.add_argument("--no-cache", action="store_true", help="不读写翻译记忆")
+    args = parser.parse_args(argv)
+
+    if args.no_cache or args.dry_run:
+        asyncio.run(run(args, None))
+        return 0
+    with TranslationMemory(args.model, PROMPT_VERSION, args.cache) as memory:
+        asyncio.run(run(args, memory))
+        print(f"💾 翻译记忆: 命中 {memory.hits} / 未命中 {memory.misses}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
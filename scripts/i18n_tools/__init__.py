@@ -0,0 +1,10 @@
+"""
+i18n 维护脚本共用的工具包
+
+所有 Python 维护脚本都通过这里读写 client/src/i18n/locales 下的语言文件，
+避免每个脚本各自 json.load / json.dump 全部文件。
+"""
+from .flat_index import FlatLocale, KeyTable
+from .locale_store import LOCALES_DIR, LocaleStore, Transaction
+
+__all__ = ["LOCALES_DIR", "FlatLocale", "KeyTable", "LocaleStore", "Transaction"]
@@ -0,0 +1,238 @@
+"""
+按 token 估算打包翻译批次
+
+固定 50 个 key 一批时，长的结算/政策文案会超出输出上限导致整批失败，
+短标签又浪费请求次数。这里按目标语言估算每条文本的输入/输出 token，
+在预算内尽量多装，并给每个请求单独计算 max_tokens。
+"""
+import heapq
+import json
+import unicodedata
+
+# 单次请求的输入（不含 prompt 模板）与输出 token 预算
+MAX_INPUT_TOKENS = 3000
+MAX_OUTPUT_TOKENS = 6000
+# 模型允许的 max_tokens 上限
+MODEL_OUTPUT_LIMIT = 16384
+# prompt 模板和 JSON 结构本身的固定开销
+PROMPT_OVERHEAD_TOKENS = 220
+
+# 译文相对英文的 token 膨胀系数（经验值，非拉丁文字的分词更碎）
+OUTPUT_EXPANSION = {
+    "ar": 2.0,
+    "de": 1.4,
+    "es": 1.3,
+    "fr": 1.35,
+    "hi": 3.5,
+    "id": 1.3,
+    "it": 1.3,
+    "ja": 1.3,
+    "ko": 1.6,
+    "pt": 1.3,
+    "ru": 2.2,
+    "th": 3.0,
+    "tr": 1.7,
+    "vi": 1.9,
+    "zh": 1.1,
+    "zh-Hant": 1.2,
+}
+
+# 多语言合并请求里每条译文的 "语言代码": 开销
+LANG_CODE_TOKENS = 4
+
+# dry-run 估算用的延迟模型：固定往返 + 按输出速度生成
+BASE_LATENCY_SECONDS = 0.8
+OUTPUT_TOKENS_PER_SECOND = 80
+
+
+def compact_json(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def estimate_tokens(text):
+    """粗略估算 token 数：ASCII 约 4 字符 1 token，CJK 约 1 字 1 token，其他文字约 2 字符 1 token"""
+    ascii_chars = 0
+    wide = 0
+    other = 0
+    for ch in text:
+        if ord(ch) < 128:
+            ascii_chars += 1
+        elif unicodedata.east_asian_width(ch) in ("W", "F"):
+            wide += 1
+        else:
+            other += 1
+    return ascii_chars / 4 + wide + other / 2
+
+
+class Batch:
+    def __init__(self, lang):
+        self.lang = lang
+        self.texts = {}
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def add(self, key, text, input_tokens, output_tokens):
+        self.texts[key] = text
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+
+    @property
+    def max_tokens(self):
+        """给模型的 max_tokens：估算值留 50% 余量"""
+        return int(min(MODEL_OUTPUT_LIMIT, max(256, self.output_tokens * 1.5 + 64)))
+
+    @property
+    def expected_seconds(self):
+        return BASE_LATENCY_SECONDS + self.output_tokens / OUTPUT_TOKENS_PER_SECOND
+
+    def __len__(self):
+        return len(self.texts)
+
+    @classmethod
+    def from_texts(cls, texts, lang):
+        batch = cls(lang)
+        for key, text in texts.items():
+            batch.add(key, text, *estimate_pair(key, text, lang))
+        return batch
+
+
+def estimate_pair(key, text, lang):
+    """返回 (输入 token, 输出 token)；key 在输入和输出中各出现一次"""
+    key_tokens = estimate_tokens(key) + 3
+    text_tokens = estimate_tokens(text)
+    return key_tokens + text_tokens, key_tokens + text_tokens * OUTPUT_EXPANSION.get(lang, 1.5)
+
+
+def plan_batches(texts, lang, max_input_tokens=MAX_INPUT_TOKENS, max_output_tokens=MAX_OUTPUT_TOKENS):
+    """按原顺序把 {key: 英文} 装进尽量少的批次，每批的输入和估算输出都不超过预算"""
+    batches = []
+    current = Batch(lang)
+    for key, text in texts.items():
+        input_tokens, output_tokens = estimate_pair(key, text, lang)
+        if len(current) and (
+            current.input_tokens + input_tokens > max_input_tokens
+            or current.output_tokens + output_tokens > max_output_tokens
+        ):
+            batches.append(current)
+            current = Batch(lang)
+        current.add(key, text, input_tokens, output_tokens)
+    if len(current):
+        batches.append(current)
+    return batches
+
+
+def dedupe_texts(texts):
+    """
+    按英文原文去重：返回 ({代表 key: 原文}, {原文: [使用它的全部 key]})
+    代表 key 是原文第一次出现的 key，译文拿回来后再分发给同一原文的其他 key
+    """
+    unique = {}
+    keys_by_text = {}
+    for key, text in texts.items():
+        keys = keys_by_text.get(text)
+        if keys is None:
+            keys_by_text[text] = [key]
+            unique[key] = text
+        else:
+            keys.append(key)
+    return unique, keys_by_text
+
+
+class FanoutBatch(Batch):
+    """一批英文在一个请求里同时翻译成 langs 中的每个语言；texts 为 {代表 key: 英文}"""
+
+    def __init__(self, langs):
+        super().__init__(None)
+        self.langs = tuple(langs)
+
+    def shares(self):
+        """{语言: 估算输出 token}：把这个请求的 token 和费用按各语言的译文量拆给各语言"""
+        text_tokens = sum(estimate_tokens(text) for text in self.texts.values())
+        return {
+            lang: len(self.texts) * LANG_CODE_TOKENS + text_tokens * OUTPUT_EXPANSION.get(lang, 1.5)
+            for lang in self.langs
+        }
+
+
+def estimate_fanout(key, text, langs):
+    """返回 (输入 token, 输出 token)；输出里每条译文多一个 "语言代码": 的开销"""
+    key_tokens = estimate_tokens(key) + 3
+    text_tokens = estimate_tokens(text)
+    output_tokens = key_tokens + sum(
+        LANG_CODE_TOKENS + text_tokens * OUTPUT_EXPANSION.get(lang, 1.5) for lang in langs
+    )
+    return key_tokens + text_tokens, output_tokens
+
+
+def plan_fanout_batches(needs, group_size, max_input_tokens=MAX_INPUT_TOKENS, max_output_tokens=MAX_OUTPUT_TOKENS):
+    """
+    needs: {英文: (代表 key, [需要这段英文的语言])}
+
+    语言按待翻译文本数从多到少排序后每 group_size 个一组，缺口相近的语言落在同一组；
+    组内按"这段英文需要组里哪些语言"归类，每类再按 token 预算装批
+    """
+    group_size = max(1, group_size)
+    counts = {}
+    for _, langs in needs.values():
+        for lang in langs:
+            counts[lang] = counts.get(lang, 0) + 1
+    order = sorted(counts, key=lambda lang: -counts[lang])
+    batches = []
+    for start in range(0, len(order), group_size):
+        group = order[start:start + group_size]
+        by_langs = {}
+        for text, (key, langs) in needs.items():
+            targets = tuple(lang for lang in group if lang in langs)
+            if targets:
+                by_langs.setdefault(targets, {})[key] = text
+        for targets, texts in by_langs.items():
+            current = FanoutBatch(targets)
+            for key, text in texts.items():
+                input_tokens, output_tokens = estimate_fanout(key, text, targets)
+                if len(current) and (
+                    current.input_tokens + input_tokens > max_input_tokens
+                    or current.output_tokens + output_tokens > max_output_tokens
+                ):
+                    batches.append(current)
+                    current = FanoutBatch(targets)
+                current.add(key, text, input_tokens, output_tokens)
+            if len(current):
+                batches.append(current)
+    return batches
+
+
+def split_batch(texts):
+    """把一批拆成两半（用于输出被截断后的重试）"""
+    items = list(texts.items())
+    middle = max(1, len(items) // 2)
+    return [dict(items[:middle]), dict(items[middle:])] if len(items) > 1 else [dict(items)]
+
+
+def estimate_wall_seconds(batches, concurrency):
+    """最长处理时间优先调度到 concurrency 个槽位上，估算总耗时"""
+    slots = [0.0] * max(1, concurrency)
+    for seconds in sorted((b.expected_seconds for b in batches), reverse=True):
+        heapq.heappush(slots, heapq.heappop(slots) + seconds)
+    return max(slots) if batches else 0.0
+
+
+def describe_plan(plans, concurrency):
+    """plans: {lang: [Batch]}，返回 dry-run 报告的文本行"""
+    lines = []
+    all_batches = []
+    for lang, batches in plans.items():
+        all_batches.extend(batches)
+        input_tokens = sum(b.input_tokens for b in batches) + PROMPT_OVERHEAD_TOKENS * len(batches)
+        output_tokens = sum(b.output_tokens for b in batches)
+        keys = sum(len(b) for b in batches)
+        lines.append(
+            f"  {lang:8} {keys:5} keys  {len(batches):3} requests  "
+            f"~{int(input_tokens):7} in  ~{int(output_tokens):7} out tokens"
+        )
+    total_in = sum(b.input_tokens for b in all_batches) + PROMPT_OVERHEAD_TOKENS * len(all_batches)
+    total_out = sum(b.output_tokens for b in all_batches)
+    lines.append(
+        f"  {'total':8} {len(all_batches):17} requests  ~{int(total_in):7} in  ~{int(total_out):7} out tokens"
+    )
+    lines.append(f"  expected duration ~{estimate_wall_seconds(all_batches, concurrency):.1f}s at concurrency {concurrency}")
+    return lines
@@ -0,0 +1,381 @@
+"""
+i18n 工具链基准测试
+
+用固定随机种子生成合成语言包（从现在的约 630 个 key 放大到 5 万个 key × 17 种语言），
+测量扁平索引（建立 / 还原嵌套 / 查找 / fallback 比较 / 反向查找）、读写全部语言文件、事务补丁、lint、文字检查，以及 translate-i18n.py
+的翻译流水线（TranslationEngine + FakeTransport 模拟模型，带注入延迟，不发网络请求）。
+
+每个用例记录总耗时和每个单位（key 或 key×语言）的纳秒数。阈值文件里保存基线：
+    某个规模的 ns/单位 超过基线 × tolerance          判为变慢
+    最大规模与最小规模的 ns/单位 之比超过 max_scaling  判为复杂度退化（与机器快慢无关）
+"""
+import asyncio
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+
+from .engine import TranslationEngine
+from .flat_index import FlatLocale, KeyTable
+from .lint import lint_store
+from .locale_store import LocaleStore, dump_locale
+from .manifest import Manifest
+from .script_detect import check_items, locale_items
+from .transport import FakeTransport
+
+SCRIPTS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+THRESHOLDS_PATH = os.path.join(SCRIPTS_DIR, "bench-thresholds.json")
+
+LANGS = (
+    "en", "zh", "zh-Hant", "de", "fr", "es", "it", "pt", "ru",
+    "ja", "ko", "ar", "hi", "th", "vi", "id", "tr",
+)
+SCALES = (630, 5000, 50000)
+# 合成译文里缺失和仍为英文 fallback 的比例
+MISSING_RATIO = 0.02
+FALLBACK_RATIO = 0.05
+
+_WORDS = (
+    "blessing temple bracelet order cart checkout payment shipping review account guardian "
+    "amulet fortune reading feng shui palm face energy harmony wisdom mountain master ritual "
+    "protection wealth health career love family jade sandalwood crystal beads incense prayer"
+).split()
+
+
+def synthetic_locale(keys, seed=0):
+    """生成约 keys 个叶子的英文语言包：section -> group -> key，少量占位符和 HTML"""
+    rng = random.Random(seed)
+    data = {}
+    sections = max(8, keys // 120)
+    count = 0
+    while count < keys:
+        section = data.setdefault(f"section{count % sections}", {})
+        group = section.setdefault(f"group{(count // sections) % 12}", {})
+        words = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 12)))
+        roll = rng.random()
+        if roll < 0.1:
+            words += " {{count}}"
+        elif roll < 0.13:
+            words = f"<strong>{words}</strong>"
+        group[f"key{count}"] = words.capitalize()
+        count += 1
+    return data
+
+
+def synthetic_translation(en, lang, seed=0):
+    """按英文结构生成某个语言：大部分加语言前缀，少量缺失或保留英文"""
+    rng = random.Random(f"{seed}:{lang}")
+
+    def walk(node):
+        out = {}
+        for key, value in node.items():
+            if isinstance(value, dict):
+                out[key] = walk(value)
+                continue
+            roll = rng.random()
+            if roll < MISSING_RATIO:
+                continue
+            out[key] = value if roll < MISSING_RATIO + FALLBACK_RATIO else f"[{lang}] {value}"
+        return out
+
+    return walk(en)
+
+
+def write_locales(directory, keys, langs=LANGS, seed=0):
+    en = synthetic_locale(keys, seed)
+    for lang in langs:
+        data = en if lang == "en" else synthetic_translation(en, lang, seed)
+        with open(os.path.join(directory, f"{lang}.json"), "w", encoding="utf-8") as f:
+            f.write(dump_locale(data))
+    return en
+
+
+def load_translate_script():
+    """translate-i18n.py 文件名带连字符，按路径导入"""
+    spec = importlib.util.spec_from_file_location("translate_i18n", os.path.join(SCRIPTS_DIR, "translate-i18n.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Result:
+    def __init__(self, case, keys, units, seconds, extra=None):
+        self.case = case
+        self.keys = keys
+        self.units = units
+        self.seconds = seconds
+        self.extra = extra or {}
+
+    @property
+    def ns_per_unit(self):
+        return self.seconds * 1e9 / self.units if self.units else 0.0
+
+    def as_dict(self):
+        return {
+            "case": self.case,
+            "keys": self.keys,
+            "units": self.units,
+            "seconds": round(self.seconds, 6),
+            "ns_per_unit": round(self.ns_per_unit, 1),
+            **self.extra,
+        }
+
+
+def best_of(repeat, fn):
+    """重复 repeat 次取最快的一次，返回 (秒, 最后一次的返回值)"""
+    best = None
+    value = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        value = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+
+class Bench:
+    def __init__(self, langs=LANGS, repeat=3, latency=0.02, concurrency=8, seed=0):
+        self.langs = langs
+        self.repeat = repeat
+        self.latency = latency
+        self.concurrency = concurrency
+        self.seed = seed
+        self.translate = None
+
+    def run(self, scales=SCALES, cases=None, progress=None):
+        results = []
+        for keys in scales:
+            directory = tempfile.mkdtemp(prefix="i18n-bench-")
+            try:
+                write_locales(directory, keys, self.langs, self.seed)
+                for name, case in self.cases():
+                    if cases and name not in cases:
+                        continue
+                    result = case(directory, keys)
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+        return results
+
+    def cases(self):
+        return [
+            ("load", self.bench_load),
+            ("dump", self.bench_dump),
+            ("index", self.bench_index),
+            ("unflatten", self.bench_unflatten),
+            ("lookup", self.bench_lookup),
+            ("fallbacks", self.bench_fallbacks),
+            ("reverse", self.bench_reverse),
+            ("patch", self.bench_patch),
+            ("lint", self.bench_lint),
+            ("language", self.bench_language),
+            ("pipeline", self.bench_pipeline),
+        ]
+
+    def store(self, directory):
+        return LocaleStore(directory).load()
+
+    def bench_load(self, directory, keys):
+        seconds, store = best_of(self.repeat, lambda: self.store(directory))
+        return Result("load", keys, keys * len(store.langs), seconds)
+
+    def bench_dump(self, directory, keys):
+        store = self.store(directory)
+        seconds, _ = best_of(self.repeat, lambda: [dump_locale(store.data(lang)) for lang in store.langs])
+        return Result("dump", keys, keys * len(store.langs), seconds)
+
+    def bench_index(self, directory, keys):
+        """全部语言建立扁平索引（共享一张 KeyTable）"""
+        store = self.store(directory)
+
+        def index():
+            table = KeyTable()
+            return [FlatLocale.from_nested(store.data(lang), table) for lang in store.langs]
+
+        seconds, _ = best_of(self.repeat, index)
+        return Result("index", keys, keys * len(store.langs), seconds)
+
+    def bench_unflatten(self, directory, keys):
+        store = self.store(directory)
+        flats = [store.flat(lang) for lang in store.langs]
+        seconds, _ = best_of(self.repeat, lambda: [flat.to_nested() for flat in flats])
+        return Result("unflatten", keys, sum(len(flat) for flat in flats), seconds)
+
+    def bench_lookup(self, directory, keys):
+        store = self.store(directory)
+        en_keys = list(store.flat("en"))
+        flats = [store.flat(lang) for lang in store.langs]
+
+        def lookup():
+            for flat in flats:
+                get = flat.get
+                for key in en_keys:
+                    get(key)
+
+        seconds, _ = best_of(self.repeat, lookup)
+        return Result("lookup", keys, len(en_keys) * len(flats), seconds)
+
+    def bench_fallbacks(self, directory, keys):
+        """每个语言里仍与英文相同的 key"""
+        store = self.store(directory)
+        en = store.flat("en")
+        flats = [store.flat(lang) for lang in store.langs if lang != "en"]
+        seconds, same = best_of(self.repeat, lambda: sum(len(flat.equal_to(en)) for flat in flats))
+        return Result("fallbacks", keys, len(en) * len(flats), seconds, {"fallbacks": same})
+
+    def bench_reverse(self, directory, keys):
+        """建立反向索引后按值查全部英文文本"""
+        store = self.store(directory)
+        values = [value for _, value in store.flat("en").items()]
+
+        def reverse():
+            flat = FlatLocale.from_nested(store.data("en"), store.keys)
+            for value in values:
+                flat.keys_for(value)
+
+        seconds, _ = best_of(self.repeat, reverse)
+        return Result("reverse", keys, len(values), seconds)
+
+    def bench_patch(self, directory, keys):
+        """每个语言改 5% 的 key，一个事务提交（含原子写回磁盘）"""
+        en_keys = list(self.store(directory).flat("en"))
+        rng = random.Random(self.seed)
+        changed = rng.sample(en_keys, max(1, len(en_keys) // 20))
+        rounds = [0]
+
+        def patch():
+            rounds[0] += 1
+            store = self.store(directory)
+            started = time.perf_counter()
+            with store.transaction() as tx:
+                for lang in store.langs:
+                    for key in changed:
+                        tx.set(lang, key, f"patched {rounds[0]} {key}")
+            return time.perf_counter() - started, store.writes
+
+        timings = [patch() for _ in range(self.repeat)]
+        seconds = min(t for t, _ in timings)
+        return Result("patch", keys, len(changed) * len(self.langs), seconds, {"files_written": timings[-1][1]})
+
+    def bench_lint(self, directory, keys):
+        store = self.store(directory)
+        seconds, report = best_of(self.repeat, lambda: lint_store(store))
+        return Result("lint", keys, keys * len(store.langs), seconds, {"issues": len(report.issues)})
+
+    def bench_language(self, directory, keys):
+        """script_detect 的批量文字直方图 + 判定，单位为字符串数"""
+        items = list(locale_items(self.store(directory)))
+        seconds, findings = best_of(self.repeat, lambda: check_items(items))
+        return Result("language", keys, len(items), seconds, {"findings": len(findings)})
+
+    def bench_pipeline(self, directory, keys):
+        """
+        translate-i18n.py 的 translate_language：所有语言并发，缺失和 fallback 的 key 作为待翻译
+        单位为待翻译的 key×语言；结果包含请求数和扣除注入延迟后的本地开销
+        """
+        translate = self.translate_script()
+        store = self.store(directory)
+        en_texts = translate.translatable_texts(store.flat("en"))
+        pending = {}
+        for lang in translate.LANG_NAMES:
+            if lang not in store:
+                continue
+            flat = store.flat(lang)
+            pending[lang] = {key: text for key, text in en_texts.items() if flat.get(key, text) == text}
+        work = tempfile.mkdtemp(prefix="i18n-bench-work-")
+        checkpoint = translate.Checkpoint
+        translate.Checkpoint = lambda lang: checkpoint(lang, work)
+        try:
+            transport = FakeTransport(latency=self.latency, jitter=0)
+            manifest = Manifest(os.path.join(work, "manifest.json"))
+
+            async def run():
+                async with TranslationEngine(concurrency=self.concurrency, transport=transport) as engine:
+                    await asyncio.gather(*(
+                        translate.translate_language(engine, store, manifest, lang, texts)
+                        for lang, texts in pending.items()
+                    ))
+
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                asyncio.run(run())
+            seconds = time.perf_counter() - started
+        finally:
+            translate.Checkpoint = checkpoint
+            shutil.rmtree(work, ignore_errors=True)
+        units = sum(len(texts) for texts in pending.values())
+        # 按并发数摊开后的纯等待时间，剩下的是本地开销（组 prompt、解析、写文件）
+        waiting = transport.requests * self.latency / self.concurrency
+        return Result("pipeline", keys, units, seconds, {
+            "requests": transport.requests,
+            "local_seconds": round(max(0.0, seconds - waiting), 3),
+        })
+
+    def translate_script(self):
+        if self.translate is None:
+            self.translate = load_translate_script()
+        return self.translate
+
+
+def report(results, scales):
+    return {
+        "version": 1,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "scales": list(scales),
+        "results": [r.as_dict() for r in results],
+    }
+
+
+def load_thresholds(path=THRESHOLDS_PATH):
+    if not os.path.exists(path):
+        return {"tolerance": 1.5, "max_scaling": {}, "baseline": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_thresholds(thresholds, path=THRESHOLDS_PATH):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(thresholds, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def update_baseline(thresholds, results):
+    for r in results:
+        thresholds["baseline"][f"{r.case}@{r.keys}"] = round(r.ns_per_unit, 1)
+    return thresholds
+
+
+def check_regressions(results, thresholds):
+    """返回回归列表，每项为 {case, keys, kind, value, limit}"""
+    regressions = []
+    tolerance = thresholds.get("tolerance", 1.5)
+    baseline = thresholds.get("baseline", {})
+    by_case = {}
+    for r in results:
+        by_case.setdefault(r.case, []).append(r)
+        base = baseline.get(f"{r.case}@{r.keys}")
+        if base and r.ns_per_unit > base * tolerance:
+            regressions.append({
+                "case": r.case, "keys": r.keys, "kind": "slower",
+                "value": round(r.ns_per_unit, 1), "limit": round(base * tolerance, 1),
+            })
+    for case, limit in thresholds.get("max_scaling", {}).items():
+        runs = sorted(by_case.get(case, []), key=lambda r: r.keys)
+        if len(runs) < 2 or not runs[0].ns_per_unit:
+            continue
+        scaling = runs[-1].ns_per_unit / runs[0].ns_per_unit
+        if scaling > limit:
+            regressions.append({
+                "case": case, "keys": runs[-1].keys, "kind": "scaling",
+                "value": round(scaling, 2), "limit": limit,
+            })
+    return regressions
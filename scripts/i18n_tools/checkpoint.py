@@ -0,0 +1,52 @@
+"""
+按语言记录已完成的翻译批次
+
+每个批次成功后立即追加到 JSONL 文件；语言写回 locale 文件后删除。
+中途失败或崩溃重跑时，英文原文未变的 key 直接从检查点恢复，不再请求。
+"""
+import json
+import os
+
+from .manifest import text_hash
+
+DEFAULT_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.cache/checkpoints")
+)
+
+
+class Checkpoint:
+    def __init__(self, lang, directory=DEFAULT_DIR):
+        self.lang = lang
+        self.path = os.path.join(directory, f"{lang}.jsonl")
+
+    def load(self, en_texts):
+        """返回检查点中原文哈希仍与当前英文一致的译文"""
+        if not os.path.exists(self.path):
+            return {}
+        restored = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 崩溃时最后一行可能没写完
+                    continue
+                key = entry.get("key")
+                if key in en_texts and entry.get("source") == text_hash(en_texts[key]):
+                    restored[key] = entry["value"]
+        return restored
+
+    def write(self, en_texts, translated):
+        if not translated:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for key, value in translated.items():
+                entry = {"key": key, "source": text_hash(en_texts[key]), "value": value}
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.unlink(self.path)
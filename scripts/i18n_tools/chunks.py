@@ -0,0 +1,160 @@
+"""
+把每个语言文件按顶层 section 拆成独立的 chunk，供前端按需加载
+
+输出:
+    client/public/locales/<lang>/<section>.<hash>.json   压缩后的 section 内容，文件名带内容哈希
+    client/src/i18n/chunks.json                           chunk 清单（section -> 哈希），由 config.ts 引入
+
+顶层直接是字符串的 key（历史遗留）统一放进 ROOT_NAMESPACE。
+"""
+import gzip
+import hashlib
+import json
+import os
+
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+PUBLIC_DIR = os.path.join(REPO_ROOT, "client/public/locales")
+CHUNK_MANIFEST_PATH = os.path.join(REPO_ROOT, "client/src/i18n/chunks.json")
+URL_BASE = "/locales/"
+ROOT_NAMESPACE = "_root"
+
+# 所有页面首屏都会用到的 section（页头、导航、页脚、通用文案），启动时预先加载
+CORE_SECTIONS = ["_root", "topBar", "nav", "common", "footer", "toast", "status"]
+
+
+def minify(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def split_namespaces(data):
+    """{section: dict}；顶层的字符串 key 合并到 ROOT_NAMESPACE"""
+    namespaces = {}
+    root = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            namespaces[key] = value
+        else:
+            root[key] = value
+    if root:
+        namespaces = {ROOT_NAMESPACE: root, **namespaces}
+    return namespaces
+
+
+def build_chunks(store, transform=None):
+    """
+    生成所有语言的 chunk，返回 (清单 dict, {相对路径: 字节内容})
+    transform(lang, section, value) 可在输出前改写每个 section（返回 None 表示不输出）
+    """
+    languages = {}
+    files = {}
+    for lang in sorted(store.langs):
+        entries = {}
+        for section, value in split_namespaces(store.data(lang)).items():
+            if transform is not None:
+                value = transform(lang, section, value)
+                if value is None:
+                    continue
+            data = minify(value)
+            digest = content_hash(data)
+            entries[section] = digest
+            files[chunk_path(lang, section, digest)] = data
+        languages[lang] = entries
+    manifest = {"base": URL_BASE, "core": CORE_SECTIONS, "languages": languages}
+    return manifest, files
+
+
+def chunk_path(lang, section, digest):
+    return os.path.join(lang, f"{section}.{digest}.json")
+
+
+def manifest_text(manifest):
+    return json.dumps(manifest, ensure_ascii=False, indent=2) + "\n"
+
+
+def write_chunks(manifest, files, out_dir=PUBLIC_DIR, manifest_path=CHUNK_MANIFEST_PATH):
+    """写入新 chunk、删除不再引用的旧 chunk；返回 (新增文件数, 删除文件数, 清单是否变化)"""
+    added = 0
+    for rel_path, data in files.items():
+        path = os.path.join(out_dir, rel_path)
+        if os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        added += 1
+
+    removed = 0
+    for rel_path in stale_chunks(files, out_dir):
+        os.unlink(os.path.join(out_dir, rel_path))
+        removed += 1
+
+    text = manifest_text(manifest)
+    changed = read_text(manifest_path) != text
+    if changed:
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return added, removed, changed
+
+
+def stale_chunks(files, out_dir=PUBLIC_DIR):
+    if not os.path.isdir(out_dir):
+        return []
+    stale = []
+    for lang in sorted(os.listdir(out_dir)):
+        lang_dir = os.path.join(out_dir, lang)
+        if not os.path.isdir(lang_dir):
+            continue
+        for filename in sorted(os.listdir(lang_dir)):
+            rel_path = os.path.join(lang, filename)
+            if filename.endswith(".json") and rel_path not in files:
+                stale.append(rel_path)
+    return stale
+
+
+def is_up_to_date(manifest, files, out_dir=PUBLIC_DIR, manifest_path=CHUNK_MANIFEST_PATH):
+    if read_text(manifest_path) != manifest_text(manifest):
+        return False
+    if stale_chunks(files, out_dir):
+        return False
+    return all(os.path.exists(os.path.join(out_dir, rel_path)) for rel_path in files)
+
+
+def read_text(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def sizes(data):
+    return len(data), len(gzip.compress(data, 9))
+
+
+def payload_report(store, manifest, files):
+    """拆分前后首屏 i18n 负载对比（字节数, gzip 字节数）"""
+    inlined = b"".join(minify(store.data(lang)) for lang in store.langs)
+    report = {
+        "before_initial_js": sizes(inlined),
+        "after_initial_js": sizes(minify(manifest)),
+        "first_paint_fetch": {},
+    }
+    def core_chunks(lang):
+        entries = manifest["languages"].get(lang, {})
+        return [files[chunk_path(lang, s, entries[s])] for s in manifest["core"] if s in entries]
+
+    en_core = core_chunks("en")
+    for lang in manifest["languages"]:
+        chunks = core_chunks(lang)
+        if lang != "en":
+            chunks += en_core
+        report["first_paint_fetch"][lang] = (sum(len(c) for c in chunks), sum(len(gzip.compress(c, 9)) for c in chunks))
+
+    report["shipped"] = {}
+    for lang, entries in manifest["languages"].items():
+        shipped = sum(len(files[chunk_path(lang, s, digest)]) for s, digest in entries.items())
+        report["shipped"][lang] = (len(minify(store.data(lang))), shipped)
+    return report
@@ -0,0 +1,115 @@
+"""
+把语言文件编译成稀疏、去重的前端 bundle
+
+源文件保持完整（翻译脚本和人工校对都依赖它），只在生成 chunk 时处理：
+    1. 去掉非 UI 数据：products 下按商品 id / slug 存放的商品文案（商品文案以数据库为准）
+    2. 非英文语言去掉与英文完全相同的值——运行时由 i18next 的 fallbackLng 补上
+    3. 同一 chunk 内重复出现的长字符串只保留第一次，其余改写成 i18next 嵌套引用 $t(key)
+       ——英文 chunk 除外：其他语言缺 key 时回退到英文值，$t(key) 却按当前语言解析，
+       会显示另一个 key 的译文；非英文 chunk 的引用目标与引用在同一个 chunk 里，一定已加载
+
+编译结果仍是普通的 i18next 资源，可直接用 addResourceBundle 合并。
+"""
+import sys
+
+FALLBACK_LANG = "en"
+ROOT_NAMESPACE = "_root"
+
+# 商品文案条目都带这些字段之一，UI 文案不会
+PRODUCT_ENTRY_FIELDS = ("name", "description", "shortDesc")
+
+# 嵌套引用里不能出现的字符：i18next 用它们分隔命名空间、参数和 key
+UNSAFE_REF_CHARS = set(":,()$.{}")
+
+
+def is_product_entry(key, value):
+    return isinstance(value, dict) and any(field in value for field in PRODUCT_ENTRY_FIELDS)
+
+
+def strip_non_ui(section, value):
+    if section != "products" or not isinstance(value, dict):
+        return value
+    return {k: v for k, v in value.items() if not is_product_entry(k, v)}
+
+
+def sparse_diff(value, fallback):
+    """只保留与 fallback 不同的部分；完全相同时返回 None"""
+    if isinstance(value, dict) and isinstance(fallback, dict):
+        diff = {}
+        for key, child in value.items():
+            child = sparse_diff(child, fallback.get(key))
+            if child is not None:
+                diff[key] = child
+        return diff or None
+    return None if value == fallback else value
+
+
+def intern_strings(value, prefix, min_length=24):
+    """
+    同一 chunk 内重复的字符串改写成 $t(第一次出现的 key)
+    返回 (新 value, 被替换的值个数)；带插值或嵌套语法的字符串保持原样
+    """
+    first_seen = {}
+    replaced = 0
+
+    def ref_for(path):
+        if any(ch in UNSAFE_REF_CHARS for part in path for ch in part):
+            return None
+        return "$t(" + ".".join(prefix + path) + ")"
+
+    def walk(node, path):
+        nonlocal replaced
+        if isinstance(node, dict):
+            return {key: walk(child, path + [key]) for key, child in node.items()}
+        if not isinstance(node, str) or len(node) < min_length or "{{" in node or "$t(" in node:
+            return sys.intern(node) if isinstance(node, str) else node
+        node = sys.intern(node)
+        canonical = first_seen.get(node)
+        if canonical is None:
+            ref = ref_for(path)
+            if ref is not None:
+                first_seen[node] = ref
+            return node
+        if len(canonical) < len(node):
+            replaced += 1
+            return canonical
+        return node
+
+    return walk(value, []), replaced
+
+
+class LocaleCompiler:
+    """build_chunks 的 transform：compiler(lang, section, value) -> 编译后的 value 或 None"""
+
+    def __init__(self, store, fallback_lang=FALLBACK_LANG, intern=True):
+        self.store = store
+        self.fallback_lang = fallback_lang
+        self.intern = intern
+        self.dropped = {}
+        self.interned = {}
+
+    def fallback_section(self, section):
+        data = self.store.data(self.fallback_lang)
+        if section == ROOT_NAMESPACE:
+            return {k: v for k, v in data.items() if not isinstance(v, dict)}
+        return data.get(section)
+
+    def __call__(self, lang, section, value):
+        value = strip_non_ui(section, value)
+        if lang != self.fallback_lang:
+            before = count_leaves(value)
+            value = sparse_diff(value, strip_non_ui(section, self.fallback_section(section)))
+            self.dropped[lang] = self.dropped.get(lang, 0) + before - count_leaves(value)
+        if not value:
+            return None
+        if self.intern and lang != self.fallback_lang and isinstance(value, dict):
+            prefix = [] if section == ROOT_NAMESPACE else [section]
+            value, replaced = intern_strings(value, prefix)
+            self.interned[lang] = self.interned.get(lang, 0) + replaced
+        return value
+
+
+def count_leaves(value):
+    if isinstance(value, dict):
+        return sum(count_leaves(v) for v in value.values())
+    return 0 if value is None else 1
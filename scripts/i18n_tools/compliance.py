@@ -0,0 +1,238 @@
+"""
+合规术语替换（词表 shared/compliance-terms.json，对照 compliance-glossary.md 维护）
+
+词表按语言组织：zh 表对所有语言生效（不少字段存的是错误语言的文本，ja / zh-Hant
+和各语言的文案里都混着简体词）；en 表对英文和非拉丁字母语言生效——temple、spiritual
+在法语、印尼语等语言里是正常词汇，这些语言要在词表文件里建自己的表；
+其他语言代码的表只作用于该语言，与共用表冲突时优先。
+
+每个语言的词表编译成一个前缀树正则（sql_seed.compile_terms）：最长匹配优先，
+拉丁字母的词按整词匹配，每段文本只扫描一遍，替换结果不会再被二次替换。
+
+同一套词表用于四个目标，都可以只审计不写入：
+    语言文件     全部语言的字符串值（key 不动）
+    语言迁移     scripts/locale-migrations/*.json 里 set / setdefault 的值——迁移重放时
+                 不会把改写过的语言文件写回不合规的原文
+    种子 SQL     products / categories / product_images / reviews 的文本列，逐条语句流式处理
+                 （评价按所在行的 language 选词表）
+    products 表  按窗口流式读取，每个窗口改动的行合成一条 UPDATE
+服务启动时的 server/compliance-migration.ts 读取同一个词表文件。
+"""
+import json
+import os
+
+from .product_sync import update_statement
+from .sql_seed import TEXT_COLUMNS, SeedTransformer, TermRewriter, rewrite_column, transform_stream
+
+TERMS_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../shared/compliance-terms.json")
+)
+
+SHARED_TABLES = ("zh", "en")
+# 不套用 en 表的拉丁字母语言
+LATIN_LANGS = ("de", "es", "fr", "id", "it", "pt", "tr", "vi")
+
+# 比 TEXT_COLUMNS 多出 blessingTemple / blessingMaster 两个纯文本列
+COLUMNS = {**TEXT_COLUMNS, "products": TEXT_COLUMNS["products"] + ("blessingTemple", "blessingMaster")}
+
+WINDOW_SIZE = 500
+
+
+def load_terms(path=TERMS_PATH):
+    """返回 {表名: {原词: 替换}}；同一张表里重复的原词以第一次出现为准"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    tables = {}
+    for name, pairs in data.items():
+        table = tables.setdefault(name, {})
+        for term, replacement in pairs:
+            table.setdefault(term, replacement)
+    return tables
+
+
+class Glossary:
+    """
+    按语言编译好的替换器，接口与 TermRewriter 相同，rewrite() 的 lang 决定用哪个语言的词表
+    （None 为 zh + en，用于语言未知的纯文本）；可以直接交给 SeedTransformer
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.shared = {}
+        for name in SHARED_TABLES:
+            for term, replacement in tables.get(name, {}).items():
+                self.shared.setdefault(term, replacement)
+        self.base = TermRewriter(self.shared)
+        self._by_lang = {}
+        # SQL 原文预筛要覆盖所有语言的词
+        everything = dict(self.shared)
+        for table in tables.values():
+            for term, replacement in table.items():
+                everything.setdefault(term, replacement)
+        self._any = self.base if len(everything) == len(self.shared) else TermRewriter(everything)
+
+    @classmethod
+    def load(cls, path=TERMS_PATH):
+        return cls(load_terms(path))
+
+    def __len__(self):
+        return sum(len(table) for table in self.tables.values())
+
+    def terms_for(self, lang):
+        """lang 实际使用的 {原词: 替换}"""
+        if lang is None:
+            return self.shared
+        terms = {} if lang in LATIN_LANGS else dict(self.tables.get("en", {}))
+        # 与共用表一致：zh、en 有同一个原词时以 zh 为准
+        terms.update(self.tables.get("zh", {}))
+        if lang not in SHARED_TABLES:
+            terms.update(self.tables.get(lang, {}))
+        return terms
+
+    def rewriter(self, lang=None):
+        if lang is None or lang in SHARED_TABLES or (lang not in LATIN_LANGS and lang not in self.tables):
+            return self.base
+        rewriter = self._by_lang.get(lang)
+        if rewriter is None:
+            rewriter = self._by_lang[lang] = TermRewriter(self.terms_for(lang))
+        return rewriter
+
+    def may_match(self, raw):
+        return self._any.may_match(raw)
+
+    def rewrite(self, text, lang=None, found=None):
+        return self.rewriter(lang).rewrite(text, lang, found)
+
+    def cascades(self):
+        """替换结果里仍含词表原词的条目（重复执行会再被替换）：[(表名, 原词, 替换, [命中])]"""
+        problems = []
+        for name, table in self.tables.items():
+            rewriter = self.rewriter(None if name in SHARED_TABLES else name)
+            for term, replacement in table.items():
+                found = []
+                rewriter.rewrite(replacement, found=found)
+                if found:
+                    problems.append((name, term, replacement, found))
+        return problems
+
+
+class Hits:
+    """术语命中 {lang: {key: {原词: 次数}}}；key 为语言文件的点分路径或 表#id.列"""
+
+    def __init__(self):
+        self.by_lang = {}
+
+    def add(self, lang, key, terms):
+        counts = self.by_lang.setdefault(lang, {}).setdefault(key, {})
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+
+    def __bool__(self):
+        return bool(self.by_lang)
+
+    @property
+    def total(self):
+        return sum(sum(counts.values()) for keys in self.by_lang.values() for counts in keys.values())
+
+    def summary(self):
+        """[(lang, 命中数, key 数)]，按语言排序"""
+        return [
+            (lang, sum(sum(counts.values()) for counts in keys.values()), len(keys))
+            for lang, keys in sorted(self.by_lang.items())
+        ]
+
+    def as_dict(self):
+        return self.by_lang
+
+
+def rewrite_locales(store, glossary, tx=None, langs=None):
+    """扫描语言文件的全部字符串值并返回 Hits；tx 不为 None 时把替换结果写进事务"""
+    hits = Hits()
+    for lang in langs or store.langs:
+        rewriter = glossary.rewriter(lang)
+        for key, value in store.flat(lang).items():
+            if not isinstance(value, str):
+                continue
+            found = []
+            new, count = rewriter.rewrite(value, lang, found)
+            if count:
+                hits.add(lang, key, found)
+                if tx is not None:
+                    tx.set(lang, key, new)
+    return hits
+
+
+def rewrite_migrations(migrations, glossary, write=False):
+    """
+    扫描迁移文件里写入的字符串值，返回 (Hits, 改动过的迁移列表)；key 为 "迁移 tag:点分路径"。
+    write=True 时原地写回（与 migrate-locales.py --generate 相同的 JSON 格式），
+    调用方负责更新账本里这些迁移的哈希
+    """
+    hits = Hits()
+    changed = []
+    for migration in migrations:
+        with open(migration.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        count = 0
+        for op in data.get("ops", []):
+            for lang, value in (op.get("values") or {}).items():
+                rewriter = glossary.rewriter(lang)
+                if isinstance(value, dict):
+                    items = [(f"{op['section']}.{key}", value, key) for key in value]
+                else:
+                    items = [(op["key"], op["values"], lang)]
+                for path, parent, slot in items:
+                    if not isinstance(parent[slot], str):
+                        continue
+                    found = []
+                    new, n = rewriter.rewrite(parent[slot], lang, found)
+                    if n:
+                        hits.add(lang, f"{migration.tag}:{path}", found)
+                        parent[slot] = new
+                        count += n
+        if count:
+            changed.append(migration)
+            if write:
+                tmp_path = f"{migration.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                    f.write("\n")
+                os.replace(tmp_path, migration.path)
+    return hits, changed
+
+
+def rewrite_seed(src, dst, glossary, hits, columns=COLUMNS):
+    """src/dst 为文本文件对象（审计时 dst 可以是 os.devnull）；返回 (SeedStats, 读取的字符数)"""
+    transformer = SeedTransformer(rewriter=glossary, text_columns=columns, hits=hits)
+    size = transform_stream(src, dst, transformer)
+    return transformer.stats, size
+
+
+def rewrite_products(reader, writer, glossary, hits, columns=COLUMNS["products"], dry_run=False,
+                     batch_size=WINDOW_SIZE):
+    """
+    reader 流式读取 products，writer 写回（MySQL 服务端游标读取期间同一连接不能执行其他语句）；
+    dry_run 时只记录命中。返回 (扫描的商品数, 需要改写的商品数)
+    """
+    sql = f"SELECT `id`, {', '.join(f'`{c}`' for c in columns)} FROM `products` ORDER BY `id`"
+    scanned = changed = 0
+    for rows in reader.stream(sql, (), batch_size):
+        updates = {}
+        for row in rows:
+            product_id = row[0]
+            for column, value in zip(columns, row[1:]):
+                if not isinstance(value, str) or not value:
+                    continue
+                found = {}
+                new, count = rewrite_column(glossary, value, found)
+                for lang, terms in found.items():
+                    hits.add(lang, f"products#{product_id}.{column}", terms)
+                if count:
+                    updates.setdefault(product_id, {})[column] = new
+        scanned += len(rows)
+        changed += len(updates)
+        if updates and not dry_run:
+            statement, params = update_statement(updates, columns)
+            writer.execute(statement, params).close()
+            writer.commit()
+    return scanned, changed
@@ -0,0 +1,187 @@
+"""
+并发翻译请求引擎
+
+所有语言、所有批次共享同一个 AsyncOpenAI 客户端（同一个 keep-alive 连接池），
+并发数由 AdaptiveLimiter 控制：遇到 429 限流时减半并按 Retry-After 暂停，
+连续成功后再逐步恢复。网络错误和 5xx 按指数退避重试。
+
+请求经由 transport 发出（见 transport.py）：默认 live 直连 API，也可以录制、回放，
+或用本地 fake 注入延迟、限流、截断和坏输出，离线压测整条翻译流水线。
+传入 telemetry 时每次 complete() 调用记录一条 request 事件（见 telemetry.py）。
+"""
+import asyncio
+import random
+import time
+
+import openai
+
+from .transport import create_transport
+
+DEFAULT_MODEL = "gpt-4.1-mini"
+
+RETRYABLE_ERRORS = (
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+
+class AdaptiveLimiter:
+    """AIMD 并发控制：限流时并发减半，连续成功 increase_every 次后加一"""
+
+    def __init__(self, max_concurrency, min_concurrency=1, increase_every=10):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.increase_every = increase_every
+        self.limit = max_concurrency
+        self.in_flight = 0
+        self._successes = 0
+        self._resume_at = 0.0
+        self._cond = None
+
+    def _condition(self):
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    async def acquire(self):
+        cond = self._condition()
+        async with cond:
+            while self.in_flight >= self.limit:
+                await cond.wait()
+            self.in_flight += 1
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def release(self, rate_limited=False, cooldown=0.0):
+        cond = self._condition()
+        async with cond:
+            self.in_flight -= 1
+            if rate_limited:
+                self.limit = max(self.min_concurrency, self.limit // 2)
+                self._successes = 0
+                self._resume_at = max(self._resume_at, time.monotonic() + cooldown)
+            else:
+                self._successes += 1
+                if self._successes >= self.increase_every and self.limit < self.max_concurrency:
+                    self.limit += 1
+                    self._successes = 0
+            cond.notify_all()
+
+
+def backoff_delay(attempt, base=1.0, cap=30.0):
+    """指数退避 + 全抖动"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def retry_after_seconds(error):
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    for name in ("retry-after-ms", "retry-after"):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            seconds = float(value)
+        except ValueError:
+            continue
+        return seconds / 1000 if name == "retry-after-ms" else seconds
+    return None
+
+
+class TranslationEngine:
+    """
+    用法:
+        async with TranslationEngine(concurrency=8) as engine:
+            response = await engine.complete(messages, temperature=0.3)
+
+    transport 可以是 transport 对象或描述串（如 "fake:latency=0.2,rate_limit=0.1"），
+    不传时读取 I18N_TRANSPORT，仍未设置则直连 API
+    """
+
+    def __init__(self, model=DEFAULT_MODEL, concurrency=8, max_retries=5, base_url=None, api_key=None, timeout=120.0,
+                 telemetry=None, transport=None):
+        self.model = model
+        self.telemetry = telemetry
+        self.max_retries = max_retries
+        self.limiter = AdaptiveLimiter(concurrency)
+        if transport is None or isinstance(transport, str):
+            # 重试由引擎自己负责，SDK 内置重试关闭，避免两层退避叠加
+            client_kwargs = {"timeout": timeout, "max_retries": 0}
+            if base_url:
+                client_kwargs["base_url"] = base_url
+            if api_key:
+                client_kwargs["api_key"] = api_key
+            transport = create_transport(transport, **client_kwargs)
+        self.transport = transport
+
+    async def __aenter__(self):
+        await self.transport.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.transport.close()
+        return False
+
+    async def complete(self, messages, tags=None, **params):
+        """
+        发送一次 chat completion，返回原始 response；失败时按策略重试
+        tags 原样写进 telemetry 的 request 事件（如 lang、keys）
+        """
+        last_error = None
+        started = time.perf_counter()
+        queued = 0.0
+        latency = None
+        rate_limits = 0
+        attempt = 0
+        try:
+            for attempt in range(self.max_retries + 1):
+                waited = time.perf_counter()
+                await self.limiter.acquire()
+                sent = time.perf_counter()
+                queued += sent - waited
+                rate_limited = False
+                cooldown = 0.0
+                try:
+                    response = await self.transport.create(self.model, messages, **params)
+                    latency = time.perf_counter() - sent
+                    self._record(tags, "ok", attempt + 1, rate_limits, started, queued, latency, response=response)
+                    return response
+                except openai.RateLimitError as e:
+                    last_error = e
+                    rate_limited = True
+                    rate_limits += 1
+                    cooldown = retry_after_seconds(e) or backoff_delay(attempt)
+                except RETRYABLE_ERRORS as e:
+                    last_error = e
+                    cooldown = backoff_delay(attempt)
+                finally:
+                    await self.limiter.release(rate_limited=rate_limited, cooldown=cooldown)
+                if attempt < self.max_retries:
+                    await asyncio.sleep(cooldown)
+        except Exception as e:
+            # 不可重试的错误（400、401 等）
+            self._record(tags, "failed", attempt + 1, rate_limits, started, queued, latency, error=e)
+            raise
+        self._record(tags, "failed", attempt + 1, rate_limits, started, queued, latency, error=last_error)
+        raise last_error
+
+    def _record(self, tags, status, attempts, rate_limits, started, queued, latency, response=None, error=None):
+        if self.telemetry is None:
+            return
+        usage = getattr(response, "usage", None)
+        fields = dict(tags or {})
+        self.telemetry.request(
+            status=status,
+            attempts=attempts,
+            rate_limited=rate_limits,
+            latency=latency,
+            queued=round(queued, 4),
+            seconds=round(time.perf_counter() - started, 4),
+            input_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            output_tokens=getattr(usage, "completion_tokens", 0) or 0,
+            finish_reason=response.choices[0].finish_reason if response is not None else None,
+            error=None if error is None else f"{type(error).__name__}: {error}",
+            **fields,
+        )
@@ -0,0 +1,259 @@
+"""
+扁平 key 索引
+
+语言文件是嵌套 dict：按 'a.b.c' 读写要逐层走一遍，展开成 {路径: 值} 又要在每一层复制 dict，
+判断某个语言哪些 key 仍是英文 fallback 还得递归对比两棵树。这里换一种表示：
+
+    KeyTable    所有语言共享的路径表，路径字符串 sys.intern 后编号，内存里只有一份
+    FlatLocale  一个语言的值数组（按路径编号索引）+ 该语言自己的 key 顺序
+
+    flat = store.flat("zh")            # LocaleStore 按语言缓存，写入时增量维护
+    flat["checkout.copy"]              # O(1)
+    flat["checkout.copy"] = "复制"      # O(1)（新路径 O(层数)）
+    flat.keys_for("Copy")              # 值 -> 路径，反向索引首次使用时建立，之后随写入维护
+    flat.equal_to(store.flat("en"))    # 同一张 KeyTable 上按编号逐项比较
+    flat.to_nested()                   # 还原成嵌套 dict，保持 key 顺序
+
+FlatLocale 实现 MutableMapping，可以直接传给原来接收 {路径: 值} dict 的函数。
+数组和空对象是叶子，非空对象的路径记在 objects 里（lint 用它判断对象/叶子类型不一致）。
+"""
+import sys
+from collections.abc import MutableMapping
+
+_MISSING = object()
+
+
+class KeyTable:
+    """路径 -> 编号；编号只增不减，删除 key 不回收"""
+
+    __slots__ = ("paths", "ids")
+
+    def __init__(self):
+        self.paths = []
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.paths)
+
+    def intern(self, path):
+        i = self.ids.get(path)
+        if i is None:
+            path = sys.intern(path)
+            i = self.ids[path] = len(self.paths)
+            self.paths.append(path)
+        return i
+
+
+class FlatLocale(MutableMapping):
+    def __init__(self, table=None):
+        self.table = table if table is not None else KeyTable()
+        self.values = []
+        # 本语言的 key 顺序（编号）；删除后再写回的 key 回到原位置
+        self.order = []
+        self._listed = bytearray()
+        self.count = 0
+        self.objects = set()
+        self._reverse = None
+
+    @classmethod
+    def from_nested(cls, data, table=None):
+        flat = cls(table)
+        table = flat.table
+        known = table.ids.get
+        intern = table.intern
+        objects = flat.objects
+        ids = []
+        leaves = []
+
+        def walk(node, prefix):
+            for key, value in node.items():
+                path = prefix + key
+                if isinstance(value, dict) and value:
+                    objects.add(path)
+                    walk(value, path + ".")
+                else:
+                    i = known(path)
+                    ids.append(intern(path) if i is None else i)
+                    leaves.append(value)
+
+        walk(data, "")
+        # 先收集编号再一次性分配数组，避免逐个 key 扩容
+        size = len(table)
+        values = flat.values = [_MISSING] * size
+        listed = flat._listed = bytearray(size)
+        order = flat.order
+        for i, value in zip(ids, leaves):
+            if not listed[i]:
+                listed[i] = 1
+                order.append(i)
+            values[i] = value
+        flat.count = len(order)
+        return flat
+
+    def _grow(self, size):
+        missing = size - len(self.values)
+        if missing > 0:
+            self.values.extend([_MISSING] * missing)
+            self._listed.extend(bytes(missing))
+
+    def _put(self, i, value):
+        if i >= len(self.values):
+            self._grow(len(self.table))
+        old = self.values[i]
+        if old is _MISSING:
+            self.count += 1
+            if not self._listed[i]:
+                self._listed[i] = 1
+                self.order.append(i)
+        elif self._reverse is not None:
+            self._unindex(old, i)
+        self.values[i] = value
+        if self._reverse is not None:
+            self._index(value, i)
+
+    def _remove(self, i):
+        old = self.values[i]
+        if old is _MISSING:
+            return False
+        if self._reverse is not None:
+            self._unindex(old, i)
+        self.values[i] = _MISSING
+        self.count -= 1
+        return True
+
+    def _id(self, path):
+        i = self.table.ids.get(path)
+        if i is None or i >= len(self.values) or self.values[i] is _MISSING:
+            return None
+        return i
+
+    def __getitem__(self, path):
+        i = self._id(path)
+        if i is None:
+            raise KeyError(path)
+        return self.values[i]
+
+    def get(self, path, default=None):
+        i = self.table.ids.get(path)
+        if i is None or i >= len(self.values):
+            return default
+        value = self.values[i]
+        return default if value is _MISSING else value
+
+    def __contains__(self, path):
+        return self._id(path) is not None
+
+    def __setitem__(self, path, value):
+        """与 locale_store.set_nested 语义一致：覆盖路径上的叶子祖先，替换同名子树"""
+        if path in self.objects:
+            self._delete_subtree(path)
+        pos = path.find(".")
+        while pos > 0:
+            prefix = path[:pos]
+            if prefix not in self.objects:
+                i = self._id(prefix)
+                if i is not None:
+                    self._remove(i)
+                self.objects.add(prefix)
+            pos = path.find(".", pos + 1)
+        if isinstance(value, dict) and value:
+            i = self._id(path)
+            if i is not None:
+                self._remove(i)
+            self.objects.add(path)
+            for key, child in value.items():
+                self[f"{path}.{key}"] = child
+        else:
+            self._put(self.table.intern(path), value)
+
+    def __delitem__(self, path):
+        """删除叶子或整棵子树；删空的父对象不会像嵌套 dict 那样留下 {} 叶子"""
+        if path in self.objects:
+            self._delete_subtree(path)
+            return
+        i = self._id(path)
+        if i is None:
+            raise KeyError(path)
+        self._remove(i)
+
+    def _delete_subtree(self, path):
+        prefix = path + "."
+        paths = self.table.paths
+        for i in self.order:
+            if self.values[i] is not _MISSING and paths[i].startswith(prefix):
+                self._remove(i)
+        self.objects.discard(path)
+        self.objects.difference_update([p for p in self.objects if p.startswith(prefix)])
+
+    def __iter__(self):
+        paths = self.table.paths
+        values = self.values
+        for i in self.order:
+            if values[i] is not _MISSING:
+                yield paths[i]
+
+    def items(self):
+        paths = self.table.paths
+        values = self.values
+        return [(paths[i], values[i]) for i in self.order if values[i] is not _MISSING]
+
+    def __len__(self):
+        return self.count
+
+    def _index(self, value, i):
+        try:
+            self._reverse.setdefault(value, set()).add(i)
+        except TypeError:
+            # 数组、空对象等不可哈希的叶子不进反向索引
+            pass
+
+    def _unindex(self, value, i):
+        try:
+            ids = self._reverse.get(value)
+        except TypeError:
+            return
+        if ids is not None:
+            ids.discard(i)
+            if not ids:
+                del self._reverse[value]
+
+    def keys_for(self, value):
+        """值等于 value 的全部路径（按路径编号，即首次出现的顺序）"""
+        if self._reverse is None:
+            self._reverse = {}
+            for i in self.order:
+                if self.values[i] is not _MISSING:
+                    self._index(self.values[i], i)
+        ids = self._reverse.get(value)
+        if not ids:
+            return []
+        paths = self.table.paths
+        return [paths[i] for i in sorted(ids)]
+
+    def equal_to(self, other):
+        """两个语言里值相同的路径；共用 KeyTable 时按编号比较，不查路径"""
+        paths = self.table.paths
+        values = self.values
+        if other.table is self.table:
+            theirs = other.values
+            size = len(theirs)
+            return [
+                paths[i] for i in self.order
+                if values[i] is not _MISSING and i < size and theirs[i] == values[i]
+            ]
+        return [path for path, value in self.items() if other.get(path, _MISSING) == value]
+
+    def to_nested(self):
+        root = {}
+        paths = self.table.paths
+        values = self.values
+        for i in self.order:
+            value = values[i]
+            if value is _MISSING:
+                continue
+            parts = paths[i].split(".")
+            node = root
+            for part in parts[:-1]:
+                node = node.setdefault(part, {})
+            node[parts[-1]] = value
+        return root
@@ -0,0 +1,26 @@
+"""
+前端支持的语言及其英文名（写进翻译 prompt 和命令行输出）
+
+语言代码与 shared/const.ts 的 SUPPORTED_LANGUAGES 一致（顺序也相同），
+Python 脚本统一从这里取语言名，不再各自维护一份表。
+"""
+LANGUAGE_NAMES = {
+    "en": "English",
+    "zh": "Simplified Chinese",
+    "zh-Hant": "Traditional Chinese",
+    "de": "German",
+    "fr": "French",
+    "es": "Spanish",
+    "it": "Italian",
+    "pt": "Portuguese (Brazilian)",
+    "ru": "Russian",
+    "ja": "Japanese",
+    "ko": "Korean",
+    "ar": "Arabic",
+    "hi": "Hindi",
+    "th": "Thai",
+    "vi": "Vietnamese",
+    "id": "Indonesian",
+    "tr": "Turkish",
+}
+SUPPORTED_LANGUAGES = tuple(LANGUAGE_NAMES)
@@ -0,0 +1,192 @@
+"""
+跨语言结构检查
+
+用 LocaleStore 的扁平索引（store.flat，每个语言只建一次），
+以 en 为基准逐个 key 比较，一遍得出所有问题：
+
+    missing_key           en 有、该语言没有
+    extra_key             该语言有、en 没有（warning）
+    type_mismatch         同一 key 一边是对象、一边是字符串/数组等
+    placeholder_mismatch  {{count}} 等插值占位符不一致
+    html_mismatch         <strong>、<1> 等标签不一致
+    empty_value           空字符串
+"""
+import re
+import time
+
+from .parsing import placeholders
+
+BASE_LANG = "en"
+
+ERROR = "error"
+WARNING = "warning"
+
+SEVERITY = {
+    "missing_key": ERROR,
+    "extra_key": WARNING,
+    "type_mismatch": ERROR,
+    "placeholder_mismatch": ERROR,
+    "html_mismatch": ERROR,
+    "empty_value": ERROR,
+}
+
+_MISSING = object()
+
+_TAG_RE = re.compile(r"</?([A-Za-z][\w-]*|\d+)\s*/?>|<([A-Za-z][\w-]*)\s[^<>]*>")
+
+
+def html_tags(text):
+    tags = []
+    for match in _TAG_RE.finditer(text):
+        name = match.group(1) or match.group(2)
+        closing = match.group(0).startswith("</")
+        tags.append(("/" if closing else "") + name.lower())
+    return sorted(tags)
+
+
+def value_type(value):
+    if isinstance(value, dict):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, str):
+        return "string"
+    if value is None:
+        return "null"
+    return type(value).__name__
+
+
+def leaf_ancestor(key, flat):
+    """key 的某个前缀在 flat 里是叶子（即结构在这里分叉）时返回该前缀"""
+    pos = key.rfind(".")
+    while pos > 0:
+        prefix = key[:pos]
+        if prefix in flat:
+            return prefix
+        pos = key.rfind(".", 0, pos)
+    return None
+
+
+class Issue:
+    __slots__ = ("lang", "key", "code", "message")
+
+    def __init__(self, lang, key, code, message):
+        self.lang = lang
+        self.key = key
+        self.code = code
+        self.message = message
+
+    @property
+    def severity(self):
+        return SEVERITY[self.code]
+
+    def as_dict(self):
+        return {
+            "lang": self.lang,
+            "key": self.key,
+            "code": self.code,
+            "severity": self.severity,
+            "message": self.message,
+        }
+
+
+def check_value(lang, key, expected, actual, issues):
+    """比较同一 key 的两个叶子值（expected 为 en）"""
+    if value_type(expected) != value_type(actual):
+        issues.append(Issue(lang, key, "type_mismatch", f"expected {value_type(expected)}, got {value_type(actual)}"))
+        return
+    if not isinstance(actual, str):
+        return
+    if not actual.strip():
+        if expected.strip():
+            issues.append(Issue(lang, key, "empty_value", "empty string"))
+        return
+    if "{" in expected or "{" in actual:
+        want, got = placeholders(expected), placeholders(actual)
+        if want != got:
+            issues.append(Issue(lang, key, "placeholder_mismatch", f"expected {want}, got {got}"))
+    if "<" in expected or "<" in actual:
+        want, got = html_tags(expected), html_tags(actual)
+        if want != got:
+            issues.append(Issue(lang, key, "html_mismatch", f"expected {want}, got {got}"))
+
+
+def lint_language(lang, base, flat, objects):
+    """base / flat 为压平后的 en 和目标语言，objects 为目标语言的对象路径"""
+    issues = []
+    reported = set()
+    for key, expected in base.items():
+        actual = flat.get(key, _MISSING)
+        if actual is not _MISSING:
+            check_value(lang, key, expected, actual, issues)
+        elif key in objects:
+            # en 是叶子、目标语言是对象：在 en 的这个 key 上报告一次
+            reported.add(key)
+            issues.append(Issue(lang, key, "type_mismatch", f"expected {value_type(expected)}, got object"))
+        else:
+            ancestor = leaf_ancestor(key, flat)
+            if ancestor is None:
+                issues.append(Issue(lang, key, "missing_key", "missing"))
+            elif ancestor not in reported:
+                reported.add(ancestor)
+                issues.append(Issue(lang, ancestor, "type_mismatch", f"expected object, got {value_type(flat[ancestor])}"))
+    for key in flat:
+        if key not in base and key not in reported and leaf_ancestor(key, base) is None:
+            issues.append(Issue(lang, key, "extra_key", "not in en"))
+    return issues
+
+
+def lint_base(base_lang, base):
+    """基准语言自身的问题：空字符串"""
+    return [Issue(base_lang, key, "empty_value", "empty string")
+            for key, value in base.items() if isinstance(value, str) and not value.strip()]
+
+
+def lint_store(store, base_lang=BASE_LANG, langs=None):
+    """返回 LintReport；store 为 LocaleStore，langs 里有不存在的语言时抛出 ValueError"""
+    started = time.perf_counter()
+    index = {lang: store.flat(lang) for lang in store.langs}
+    unknown = sorted(set(langs or ()) - set(index))
+    if unknown:
+        raise ValueError(f"unknown locale: {', '.join(unknown)}")
+    base = index[base_lang]
+
+    issues = lint_base(base_lang, base)
+    for lang in sorted(langs or index):
+        if lang != base_lang:
+            issues.extend(lint_language(lang, base, index[lang], index[lang].objects))
+    return LintReport(issues, {lang: len(flat) for lang, flat in index.items()}, time.perf_counter() - started)
+
+
+class LintReport:
+    def __init__(self, issues, key_counts, elapsed):
+        self.issues = issues
+        self.key_counts = key_counts
+        self.elapsed = elapsed
+
+    @property
+    def errors(self):
+        return [issue for issue in self.issues if issue.severity == ERROR]
+
+    @property
+    def warnings(self):
+        return [issue for issue in self.issues if issue.severity == WARNING]
+
+    def counts(self):
+        """{lang: {code: 数量}}"""
+        counts = {}
+        for issue in self.issues:
+            by_code = counts.setdefault(issue.lang, {})
+            by_code[issue.code] = by_code.get(issue.code, 0) + 1
+        return counts
+
+    def as_dict(self):
+        return {
+            "ok": not self.errors,
+            "errors": len(self.errors),
+            "warnings": len(self.warnings),
+            "elapsed_ms": round(self.elapsed * 1000, 1),
+            "keys": self.key_counts,
+            "counts": self.counts(),
+            "issues": [issue.as_dict() for issue in self.issues],
+        }
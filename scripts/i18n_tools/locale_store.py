@@ -0,0 +1,275 @@
+"""
+事务式语言文件存储
+
+一次性读取全部语言文件，把多个脚本的嵌套 key 修改收集到同一个事务里，
+提交时只重写内容真正发生变化的文件（原子替换，保留 key 顺序和文件末尾换行）。
+
+    store = LocaleStore()
+    with store.transaction() as tx:
+        tx.set("zh", "common.service", "客户服务")
+        tx.setdefault("ar", "checkout.copy", "Copy")
+
+按 key 读取走 store.flat(lang) 扁平索引（flat_index.FlatLocale），不再逐层查找。
+"""
+import json
+import os
+import tempfile
+
+from .flat_index import FlatLocale, KeyTable
+
+LOCALES_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../client/src/i18n/locales")
+)
+
+_MISSING = object()
+
+
+def split_key(dotted_key):
+    return dotted_key.split(".")
+
+
+def get_nested(data, dotted_key, default=None):
+    current = data
+    for part in split_key(dotted_key):
+        if not isinstance(current, dict) or part not in current:
+            return default
+        current = current[part]
+    return current
+
+
+def set_nested(data, dotted_key, value):
+    """设置嵌套字典的值，如 'checkout.copy' -> data['checkout']['copy']；返回是否发生变化"""
+    parts = split_key(dotted_key)
+    current = data
+    for part in parts[:-1]:
+        child = current.get(part)
+        if not isinstance(child, dict):
+            child = current[part] = {}
+        current = child
+    if current.get(parts[-1], _MISSING) == value:
+        return False
+    current[parts[-1]] = value
+    return True
+
+
+def delete_nested(data, dotted_key):
+    parts = split_key(dotted_key)
+    parent = get_nested(data, ".".join(parts[:-1])) if len(parts) > 1 else data
+    if isinstance(parent, dict) and parts[-1] in parent:
+        del parent[parts[-1]]
+        return True
+    return False
+
+
+def dump_locale(data, trailing_newline=True):
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    return text + "\n" if trailing_newline else text
+
+
+class Transaction:
+    """收集一批修改，提交时统一应用到 LocaleStore"""
+
+    def __init__(self, store):
+        self.store = store
+        self.ops = []
+        self._pending = {}
+        self._callbacks = []
+
+    def set(self, lang, dotted_key, value):
+        self.ops.append(("set", lang, dotted_key, value))
+        self._pending[(lang, dotted_key)] = value
+
+    def setdefault(self, lang, dotted_key, value):
+        """只在 key 不存在时写入（用于英文 fallback 等补缺场景）"""
+        self.ops.append(("setdefault", lang, dotted_key, value))
+        if self.get(lang, dotted_key, _MISSING) is _MISSING:
+            self._pending[(lang, dotted_key)] = value
+
+    def delete(self, lang, dotted_key):
+        self.ops.append(("delete", lang, dotted_key, None))
+        self._pending[(lang, dotted_key)] = _MISSING
+
+    def update(self, lang, section, values):
+        for key, value in values.items():
+            self.set(lang, f"{section}.{key}" if section else key, value)
+
+    def get(self, lang, dotted_key, default=None):
+        """读取当前值（包含本事务中尚未提交的修改）"""
+        value = self._pending.get((lang, dotted_key), _MISSING)
+        if (lang, dotted_key) not in self._pending and lang in self.store:
+            value = self.store.get(lang, dotted_key, _MISSING)
+        return default if value is _MISSING else value
+
+    def __len__(self):
+        return len(self.ops)
+
+    def on_commit(self, callback):
+        """注册提交成功后执行的回调（如保存翻译来源清单）"""
+        self._callbacks.append(callback)
+
+    def commit(self):
+        written = self.store.apply(self.ops)
+        for callback in self._callbacks:
+            callback()
+        return written
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        self.ops = []
+        self._pending = {}
+        self._callbacks = []
+        return False
+
+
+class LocaleStore:
+    """client/src/i18n/locales 下全部语言文件的内存视图"""
+
+    def __init__(self, locales_dir=LOCALES_DIR, langs=None):
+        self.locales_dir = locales_dir
+        self._only = set(langs) if langs else None
+        self._data = None
+        self._raw = {}
+        self._newline = {}
+        self._dirty = set()
+        # 所有语言共享一张路径表，扁平索引按需建立
+        self.keys = KeyTable()
+        self._flat = {}
+        self.reads = 0
+        self.writes = 0
+
+    def path(self, lang):
+        return os.path.join(self.locales_dir, f"{lang}.json")
+
+    def load(self):
+        if self._data is not None:
+            return self
+        self._data = {}
+        for filename in sorted(os.listdir(self.locales_dir)):
+            if not filename.endswith(".json"):
+                continue
+            lang = filename[: -len(".json")]
+            if self._only and lang not in self._only:
+                continue
+            with open(self.path(lang), "r", encoding="utf-8") as f:
+                raw = f.read()
+            self.reads += 1
+            self._raw[lang] = raw
+            self._newline[lang] = raw.endswith("\n")
+            self._data[lang] = json.loads(raw)
+        return self
+
+    def reload(self, lang):
+        """
+        文件被外部修改后重新读取一个语言，只重建它的扁平索引；返回内容是否有变化。
+        文件已删除时移除该语言；JSON 无效时抛出 ValueError，内存中的旧内容保持不变
+        """
+        self.load()
+        if self._only and lang not in self._only:
+            return False
+        try:
+            with open(self.path(lang), "r", encoding="utf-8") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            existed = lang in self._data
+            for cache in (self._data, self._raw, self._newline, self._flat):
+                cache.pop(lang, None)
+            return existed
+        if raw == self._raw.get(lang):
+            return False
+        data = json.loads(raw)
+        self.reads += 1
+        self._raw[lang] = raw
+        self._newline[lang] = raw.endswith("\n")
+        self._data[lang] = data
+        self._flat.pop(lang, None)
+        self._dirty.discard(lang)
+        return True
+
+    @property
+    def langs(self):
+        return list(self.load()._data)
+
+    def __contains__(self, lang):
+        return lang in self.load()._data
+
+    def data(self, lang):
+        """返回某个语言的嵌套 dict（只读视图，修改请走 transaction）"""
+        return self.load()._data[lang]
+
+    def flat(self, lang):
+        """某个语言的扁平索引（FlatLocale，只读视图）；提交修改时增量更新"""
+        flat = self._flat.get(lang)
+        if flat is None:
+            flat = self._flat[lang] = FlatLocale.from_nested(self.data(lang), self.keys)
+        return flat
+
+    def get(self, lang, dotted_key, default=None):
+        flat = self.flat(lang)
+        if dotted_key in flat.objects:
+            # 对象路径返回整棵子树
+            return get_nested(self.data(lang), dotted_key, default)
+        return flat.get(dotted_key, default)
+
+    def transaction(self):
+        return Transaction(self)
+
+    def apply(self, ops):
+        """应用一组修改并写回，返回实际写入的语言列表"""
+        self.load()
+        for op, lang, dotted_key, value in ops:
+            if lang not in self._data:
+                self._data[lang] = {}
+                self._newline[lang] = True
+            data = self._data[lang]
+            flat = self._flat.get(lang)
+            self._dirty.add(lang)
+            if op == "setdefault":
+                if get_nested(data, dotted_key, _MISSING) is not _MISSING:
+                    continue
+                op = "set"
+            if op == "set":
+                set_nested(data, dotted_key, value)
+                if flat is not None:
+                    flat[dotted_key] = value
+            elif op == "delete":
+                # 删空的父对象在嵌套结构里会变成 {} 叶子，扁平索引下次使用时重建
+                if delete_nested(data, dotted_key):
+                    self._flat.pop(lang, None)
+            else:
+                raise ValueError(f"unknown locale op: {op}")
+        return self.flush()
+
+    def flush(self):
+        """把内容有变化的文件原子写回磁盘"""
+        if self._data is None:
+            return []
+        pending = {}
+        for lang in sorted(self._dirty):
+            text = dump_locale(self._data[lang], self._newline.get(lang, True))
+            if text != self._raw.get(lang):
+                pending[lang] = text
+        for lang, text in pending.items():
+            self._write_atomic(self.path(lang), text)
+            self._raw[lang] = text
+            self.writes += 1
+        self._dirty.clear()
+        return list(pending)
+
+    def _write_atomic(self, path, text):
+        fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            if os.path.exists(path):
+                os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
@@ -0,0 +1,123 @@
+"""
+翻译来源清单（source-hash manifest）
+
+为每个语言的每个 key 记录翻译时所依据的英文原文哈希和来源：
+    machine  机器翻译
+    human    人工翻译（或清单建立前已存在的译文）
+    fallback 直接写入的英文 fallback，仍需翻译
+
+translate-i18n.py 只处理清单里没有、英文已变化或仍是 fallback 的 key，
+不再用"值等于英文"来猜测——品牌名等本就与英文相同的译文不会被反复重翻。
+"""
+import hashlib
+import json
+import os
+
+MANIFEST_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../translation-manifest.json")
+)
+
+MACHINE = "machine"
+HUMAN = "human"
+FALLBACK = "fallback"
+PROVENANCES = (MACHINE, HUMAN, FALLBACK)
+
+
+def text_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+class Manifest:
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        self.langs = {}
+        self.bootstrapped = set()
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path=MANIFEST_PATH):
+        manifest = cls(path)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            manifest.bootstrapped = set(data.get("bootstrapped", []))
+            for lang, entries in data.get("langs", {}).items():
+                manifest.langs[lang] = {
+                    key: tuple(entry.split(":", 1)) for key, entry in entries.items()
+                }
+        return manifest
+
+    def save(self):
+        if not self.dirty:
+            return False
+        data = {
+            "version": 1,
+            "bootstrapped": sorted(self.bootstrapped),
+            "langs": {
+                lang: {key: f"{h}:{p}" for key, (h, p) in sorted(entries.items())}
+                for lang, entries in sorted(self.langs.items())
+            },
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+        return True
+
+    def entry(self, lang, key):
+        return self.langs.get(lang, {}).get(key)
+
+    def record(self, lang, key, en_text, provenance):
+        if provenance not in PROVENANCES:
+            raise ValueError(f"unknown provenance: {provenance}")
+        entry = (text_hash(en_text), provenance)
+        entries = self.langs.setdefault(lang, {})
+        if entries.get(key) != entry:
+            entries[key] = entry
+            self.dirty = True
+
+    def bootstrap(self, lang, en_flat, lang_flat, fallback_keys=()):
+        """
+        为尚未建立清单的语言补齐记录（只需执行一次）：已有译文一律记为 human。
+        值与英文相同不代表没翻译（品牌名、支付方式等），只有 fallback_keys 里列出的
+        key 或 section（如 "checkout" 覆盖 checkout.*）在值与英文相同时才记为 fallback
+        """
+        fallback_keys = set(fallback_keys)
+        prefixes = tuple(f"{key}." for key in fallback_keys)
+        entries = self.langs.setdefault(lang, {})
+        for key, en_value in en_flat.items():
+            if key in entries or not isinstance(en_value, str):
+                continue
+            value = lang_flat.get(key)
+            if value is None:
+                continue
+            listed = key in fallback_keys or key.startswith(prefixes)
+            provenance = FALLBACK if listed and value == en_value else HUMAN
+            entries[key] = (text_hash(en_value), provenance)
+        self.bootstrapped.add(lang)
+        self.dirty = True
+
+    def prune(self, en_flat):
+        """删除英文中已不存在的 key"""
+        for entries in self.langs.values():
+            for key in [k for k in entries if k not in en_flat]:
+                del entries[key]
+                self.dirty = True
+
+    def delta(self, lang, en_hashes):
+        """
+        返回 (需要翻译的 key 列表, 英文已变化但为人工译文的 key 列表)
+        en_hashes: {key: 英文原文哈希}
+        """
+        entries = self.langs.get(lang, {})
+        pending = []
+        stale_human = []
+        for key, current in en_hashes.items():
+            entry = entries.get(key)
+            if entry is None or entry[1] == FALLBACK:
+                pending.append(key)
+            elif entry[0] != current:
+                (stale_human if entry[1] == HUMAN else pending).append(key)
+        return pending, stale_human
@@ -0,0 +1,131 @@
+"""
+持久化翻译记忆（SQLite）
+
+以 (原文哈希, 目标语言, 模型, prompt 版本) 为键缓存译文。翻译前先查缓存，
+只把未命中的原文发给模型；每个批次成功后立即写入，崩溃重跑不会重复付费。
+prompt 改动后递增版本号，旧版本的缓存可用 invalidate() 清掉。
+"""
+import hashlib
+import os
+import sqlite3
+import time
+
+DEFAULT_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.cache/translation-memory.sqlite3")
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_hash TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    source_text TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (source_hash, target_lang, model, prompt_version)
+)
+"""
+
+
+def source_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    def __init__(self, model, prompt_version, path=DEFAULT_PATH):
+        self.model = model
+        self.prompt_version = prompt_version
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def lookup(self, texts, target_lang):
+        """返回 {原文: 译文}，只包含命中的部分"""
+        by_hash = {source_hash(text): text for text in set(texts)}
+        found = {}
+        hashes = list(by_hash)
+        # SQLite 默认最多 999 个绑定参数
+        for i in range(0, len(hashes), 900):
+            chunk = hashes[i:i + 900]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT source_hash, translation FROM translations"
+                f" WHERE target_lang = ? AND model = ? AND prompt_version = ? AND source_hash IN ({placeholders})",
+                [target_lang, self.model, self.prompt_version, *chunk],
+            ).fetchall()
+            for digest, translation in rows:
+                found[by_hash[digest]] = translation
+        if found:
+            now = time.time()
+            self.conn.executemany(
+                "UPDATE translations SET hits = hits + 1, last_used_at = ?"
+                " WHERE source_hash = ? AND target_lang = ? AND model = ? AND prompt_version = ?",
+                [(now, source_hash(text), target_lang, self.model, self.prompt_version) for text in found],
+            )
+            self.conn.commit()
+        self.hits += len(found)
+        self.misses += len(by_hash) - len(found)
+        return found
+
+    def store(self, pairs, target_lang):
+        """写入 {原文: 译文}"""
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO translations"
+            " (source_hash, target_lang, model, prompt_version, source_text, translation, created_at, last_used_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (source_hash(text), target_lang, self.model, self.prompt_version, text, translation, now, now)
+                for text, translation in pairs.items()
+            ],
+        )
+        self.conn.commit()
+
+    def invalidate(self, prompt_version=None):
+        """删除某个 prompt 版本的缓存；不传时删除除当前版本以外的全部"""
+        if prompt_version is None:
+            cur = self.conn.execute("DELETE FROM translations WHERE prompt_version != ?", (self.prompt_version,))
+        else:
+            cur = self.conn.execute("DELETE FROM translations WHERE prompt_version = ?", (prompt_version,))
+        self.conn.commit()
+        return cur.rowcount
+
+    def evict(self, max_age_days):
+        """删除超过 max_age_days 天未被使用的条目"""
+        cutoff = time.time() - max_age_days * 86400
+        cur = self.conn.execute("DELETE FROM translations WHERE last_used_at < ?", (cutoff,))
+        self.conn.commit()
+        return cur.rowcount
+
+    def stats(self):
+        rows = self.conn.execute(
+            "SELECT prompt_version, target_lang, COUNT(*), SUM(hits) FROM translations"
+            " GROUP BY prompt_version, target_lang ORDER BY prompt_version, target_lang"
+        ).fetchall()
+        return {
+            "session_hits": self.hits,
+            "session_misses": self.misses,
+            "entries": [
+                {"prompt_version": v, "target_lang": lang, "count": count, "hits": hits or 0}
+                for v, lang, count, hits in rows
+            ],
+        }
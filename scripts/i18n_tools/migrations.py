@@ -0,0 +1,322 @@
+"""
+语言文件迁移（仿 drizzle 的 journal）
+
+scripts/locale-migrations/ 下每个 NNNN_名称.json 是一个声明式补丁：
+
+    {
+      "description": "结算页新增支付方式",
+      "ops": [
+        {"op": "set", "key": "common.service", "values": {"zh": "客户服务", "en": "Customer Service"}},
+        {"op": "setdefault", "section": "checkout", "values": {"en": {"copy": "Copy"}, "zh": {"copy": "复制"}},
+         "fallback": ["ar", "hi"]},
+        {"op": "delete", "key": "products.legacy_banner", "langs": "*"}
+      ]
+    }
+
+    op        set 覆盖写入；setdefault 只在 key 不存在时写入；delete 删除叶子或整棵子树
+    key       完整的点分路径，values 为 {语言: 值}
+    section   路径前缀，values 为 {语言: {子 key: 值}}
+    fallback  这些语言写入 values["en"]，并在翻译来源清单里记为 fallback（"*" 表示其余全部语言）
+    langs     delete 作用的语言列表，"*" 表示全部（默认）；按 section 删除时用 keys 列出子 key
+
+已应用的迁移记在 meta/_journal.json（tag、文件哈希、应用时间），随语言文件一起提交。
+执行时把所有待应用迁移合并成一个事务：语言文件只读一次、每个文件最多写一次；
+两个迁移对同一个 key（或一个写 key、另一个写它的子路径）给出不同结果时，
+在写盘之前报告冲突并中止。
+"""
+import hashlib
+import json
+import os
+import re
+import time
+
+from .manifest import FALLBACK, HUMAN
+
+MIGRATIONS_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../locale-migrations")
+)
+JOURNAL_PATH = os.path.join(MIGRATIONS_DIR, "meta", "_journal.json")
+
+OPS = ("set", "setdefault", "delete")
+
+_FILENAME_RE = re.compile(r"^(\d{4})_[\w-]+\.json$")
+_MISSING = object()
+
+
+class MigrationError(Exception):
+    pass
+
+
+class MigrationConflict(MigrationError):
+    def __init__(self, conflicts):
+        self.conflicts = conflicts
+        super().__init__(f"{len(conflicts)} conflicting locale writes")
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class Migration:
+    def __init__(self, path):
+        self.path = path
+        self.tag = os.path.splitext(os.path.basename(path))[0]
+        match = _FILENAME_RE.match(os.path.basename(path))
+        if match is None:
+            raise MigrationError(f"{path}: 文件名应为 NNNN_名称.json")
+        self.idx = int(match.group(1))
+        self.hash = file_hash(path)
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise MigrationError(f"{self.tag}: {e}")
+        self.description = data.get("description", "")
+        self.ops = data.get("ops", [])
+        for i, op in enumerate(self.ops):
+            self._validate(i, op)
+
+    def _validate(self, i, op):
+        where = f"{self.tag} ops[{i}]"
+        if op.get("op") not in OPS:
+            raise MigrationError(f"{where}: op 必须是 {', '.join(OPS)}")
+        if ("key" in op) == ("section" in op):
+            raise MigrationError(f"{where}: key 和 section 必须且只能有一个")
+        if op["op"] == "delete":
+            if "values" in op or "fallback" in op:
+                raise MigrationError(f"{where}: delete 只接受 langs")
+            if "section" in op and not isinstance(op.get("keys"), list):
+                raise MigrationError(f"{where}: section 删除需要 keys 列表")
+            return
+        values = op.get("values")
+        if not isinstance(values, dict) or not values:
+            raise MigrationError(f"{where}: 缺少 values")
+        if "section" in op and not all(isinstance(v, dict) for v in values.values()):
+            raise MigrationError(f"{where}: section 的 values 应为 {{语言: {{子 key: 值}}}}")
+        if op.get("fallback") and "en" not in values:
+            raise MigrationError(f"{where}: fallback 需要 values 里有 en")
+
+    def expand(self, langs):
+        """展开成 (op, lang, key, value, provenance) 列表；langs 为语言文件里已有的语言"""
+        writes = []
+        for op in self.ops:
+            if op["op"] == "delete":
+                targets = langs if op.get("langs", "*") == "*" else op["langs"]
+                keys = [op["key"]] if "key" in op else [f"{op['section']}.{k}" for k in op["keys"]]
+                writes.extend(("delete", lang, key, None, None) for lang in targets for key in keys)
+                continue
+
+            values = op["values"]
+            fallback = op.get("fallback") or []
+            if fallback == "*":
+                fallback = [lang for lang in langs if lang not in values]
+            per_lang = [(lang, value, HUMAN) for lang, value in values.items()]
+            per_lang += [(lang, values["en"], FALLBACK) for lang in fallback]
+            for lang, value, provenance in per_lang:
+                if "key" in op:
+                    writes.append((op["op"], lang, op["key"], value, provenance))
+                else:
+                    writes.extend(
+                        (op["op"], lang, f"{op['section']}.{key}", item, provenance) for key, item in value.items()
+                    )
+        return writes
+
+
+def declared_fallbacks(migrations, langs):
+    """
+    迁移里声明为英文 fallback 的 key：{lang: set(key)}
+    给 translate-i18n.py 建立翻译来源清单用——账本里已应用的迁移不会再执行，
+    它们写下的 fallback 只能从迁移声明里找回；之后又被迁移覆盖或删除的 key 不算
+    """
+    declared = {}
+    for migration in migrations:
+        for op, lang, key, _, provenance in migration.expand(langs):
+            if provenance == FALLBACK:
+                declared.setdefault(lang, set()).add(key)
+            elif op != "setdefault" and lang in declared:
+                declared[lang].discard(key)
+    return declared
+
+
+def discover(directory=MIGRATIONS_DIR):
+    """按编号排序的全部迁移"""
+    if not os.path.isdir(directory):
+        return []
+    migrations = [
+        Migration(os.path.join(directory, name))
+        for name in sorted(os.listdir(directory))
+        if name.endswith(".json")
+    ]
+    seen = {}
+    for migration in migrations:
+        if migration.idx in seen:
+            raise MigrationError(f"编号重复: {seen[migration.idx]} / {migration.tag}")
+        seen[migration.idx] = migration.tag
+    return migrations
+
+
+class Journal:
+    """已应用迁移的账本"""
+
+    def __init__(self, path=JOURNAL_PATH):
+        self.path = path
+        self.entries = {}
+
+    @classmethod
+    def load(cls, path=JOURNAL_PATH):
+        journal = cls(path)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            journal.entries = {entry["tag"]: entry for entry in data.get("entries", [])}
+        return journal
+
+    def __contains__(self, tag):
+        return tag in self.entries
+
+    def record(self, migration, when=None):
+        self.entries[migration.tag] = {
+            "idx": migration.idx,
+            "tag": migration.tag,
+            "hash": migration.hash,
+            "when": int((when if when is not None else time.time()) * 1000),
+        }
+
+    def rehash(self, migration):
+        """迁移文件被工具改写（如合规改写，已应用的结果也做了同样的改写）后更新哈希，保留应用时间"""
+        migration.hash = file_hash(migration.path)
+        if migration.tag in self.entries:
+            self.entries[migration.tag]["hash"] = migration.hash
+
+    def save(self):
+        data = {
+            "version": 1,
+            "entries": sorted(self.entries.values(), key=lambda entry: (entry["idx"], entry["tag"])),
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+
+    def drift(self, migrations):
+        """返回 (应用后被修改的迁移, 账本里有但文件已不存在的 tag)"""
+        by_tag = {migration.tag: migration for migration in migrations}
+        modified = [
+            by_tag[tag] for tag, entry in self.entries.items()
+            if tag in by_tag and by_tag[tag].hash != entry["hash"]
+        ]
+        missing = sorted(tag for tag in self.entries if tag not in by_tag)
+        return modified, missing
+
+    def pending(self, migrations):
+        return [migration for migration in migrations if migration.tag not in self.entries]
+
+
+class Plan:
+    """
+    合并后的写入计划
+        writes     [(op, lang, key, value, provenance, tag)]，按迁移顺序
+        conflicts  [(lang, key, tag, value, other_key, other_tag, other_value)]
+    """
+
+    def __init__(self, migrations, langs):
+        self.migrations = migrations
+        self.writes = []
+        self.conflicts = []
+        # (lang, key) -> (op, value, tag)
+        targets = {}
+        by_lang = {}
+        for migration in migrations:
+            for op, lang, key, value, provenance in migration.expand(langs):
+                self.writes.append((op, lang, key, value, provenance, migration.tag))
+                seen = targets.get((lang, key))
+                if seen is None:
+                    targets[(lang, key)] = (op, value, migration.tag)
+                    by_lang.setdefault(lang, set()).add(key)
+                elif (seen[0] == "delete") != (op == "delete") or seen[1] != value:
+                    self.conflicts.append((lang, key, seen[2], _describe(seen[0], seen[1]),
+                                           key, migration.tag, _describe(op, value)))
+
+        # 一个迁移写 a.b、另一个写 a.b.c：后写的会覆盖或拆掉前者
+        for lang, keys in by_lang.items():
+            for key in keys:
+                pos = key.find(".")
+                while pos > 0:
+                    parent = key[:pos]
+                    if parent in keys:
+                        parent_op, parent_value, parent_tag = targets[(lang, parent)]
+                        op, value, tag = targets[(lang, key)]
+                        if parent_tag != tag:
+                            self.conflicts.append((lang, parent, parent_tag, _describe(parent_op, parent_value),
+                                                   key, tag, _describe(op, value)))
+                    pos = key.find(".", pos + 1)
+
+    def changes(self, store):
+        """实际会改变的 (lang, key) 数，按语言"""
+        counts = {}
+        for op, lang, key, value, _, _ in self.writes:
+            current = store.get(lang, key, _MISSING) if lang in store else _MISSING
+            if op == "delete":
+                changed = current is not _MISSING
+            elif op == "setdefault":
+                changed = current is _MISSING
+            else:
+                changed = current != value
+            if changed:
+                counts[lang] = counts.get(lang, 0) + 1
+        return counts
+
+    def apply(self, tx, manifest=None):
+        """把计划写进事务；manifest 不为 None 时为非英文 key 登记人工/fallback 来源；有冲突时什么都不写"""
+        if self.conflicts:
+            raise MigrationConflict(self.conflicts)
+        recorded = []
+        for op, lang, key, value, provenance, _ in self.writes:
+            if op == "delete":
+                tx.delete(lang, key)
+                continue
+            if op == "setdefault":
+                if tx.get(lang, key, _MISSING) is not _MISSING:
+                    continue
+                tx.setdefault(lang, key, value)
+            else:
+                tx.set(lang, key, value)
+            if lang != "en" and isinstance(value, str):
+                recorded.append((lang, key, provenance))
+
+        if manifest is not None and recorded:
+            def record():
+                for lang, key, provenance in recorded:
+                    en_text = tx.store.get("en", key)
+                    if isinstance(en_text, str):
+                        manifest.record(lang, key, en_text, provenance)
+                manifest.save()
+
+            tx.on_commit(record)
+        return len(self.writes)
+
+
+def _describe(op, value):
+    if op == "delete":
+        return "<delete>"
+    text = json.dumps(value, ensure_ascii=False)
+    text = text if len(text) <= 60 else text[:57] + "..."
+    return f"{text} ({op})" if op == "setdefault" else text
+
+
+def generate(name, directory=MIGRATIONS_DIR):
+    """新建一个空迁移文件，返回路径"""
+    slug = re.sub(r"[^\w-]+", "_", name.strip()).strip("_").lower()
+    if not slug:
+        raise MigrationError("迁移名称不能为空")
+    existing = [int(m.group(1)) for m in map(_FILENAME_RE.match, os.listdir(directory) if os.path.isdir(directory) else []) if m]
+    idx = max(existing, default=-1) + 1
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{idx:04d}_{slug}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"description": name, "ops": []}, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    return path
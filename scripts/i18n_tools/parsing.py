@@ -0,0 +1,139 @@
+"""
+模型输出解析
+"""
+import json
+import re
+
+_decoder = json.JSONDecoder()
+
+
+def strip_code_fence(text):
+    """清理可能的 markdown 代码块"""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+    return text.strip()
+
+
+def _skip_ws(text, pos):
+    while pos < len(text) and text[pos] in " \t\r\n":
+        pos += 1
+    return pos
+
+
+def parse_object_prefix(text):
+    """
+    逐个解析 JSON 对象里的 "key": value，遇到截断或错误就停下，
+    返回已完整解析出的键值对（用于输出被 max_tokens 截断的情况）
+    """
+    pairs = {}
+    pos = text.find("{")
+    if pos < 0:
+        return pairs
+    pos += 1
+    while True:
+        pos = _skip_ws(text, pos)
+        if pos >= len(text) or text[pos] == "}":
+            return pairs
+        try:
+            key, pos = _decoder.raw_decode(text, pos)
+            pos = _skip_ws(text, pos)
+            if not isinstance(key, str) or text[pos] != ":":
+                return pairs
+            value, pos = _decoder.raw_decode(text, _skip_ws(text, pos + 1))
+        except (ValueError, IndexError):
+            return pairs
+        pos = _skip_ws(text, pos)
+        # 值后面必须跟着 , 或 }，否则这个值本身可能被截断了
+        if pos >= len(text) or text[pos] not in ",}":
+            return pairs
+        pairs[key] = value
+        if text[pos] == ",":
+            pos += 1
+
+
+# 宽松匹配 "key": "value"，用于 JSON 整体损坏时逐条抢救
+_PAIR_RE = re.compile(r'"((?:[^"\\]|\\.)*)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*([^{}\s]+)\s*\}\}")
+
+
+def placeholders(text):
+    return sorted(_PLACEHOLDER_RE.findall(text))
+
+
+def salvage_pairs(text):
+    """从损坏的输出里尽量找回字符串键值对"""
+    pairs = parse_object_prefix(text)
+    for match in _PAIR_RE.finditer(text):
+        try:
+            key = json.loads(f'"{match.group(1)}"')
+            value = json.loads(f'"{match.group(2)}"')
+        except ValueError:
+            continue
+        pairs.setdefault(key, value)
+    return pairs
+
+
+def decode_object(text):
+    """从第一个 { 开始按完整 JSON 对象解析，失败返回 None"""
+    start = text.find("{")
+    if start < 0:
+        return None
+    try:
+        parsed, _ = _decoder.raw_decode(text, start)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def parse_translation(text, en_texts):
+    """
+    解析模型返回的译文，返回 (有效译文, 缺失或无效的 key 集合)
+
+    先按完整 JSON 解析；失败时退回逐条抢救。只保留请求中存在的 key、
+    非空字符串、且 {{placeholder}} 与英文一致的译文。
+    """
+    text = strip_code_fence(text)
+    parsed = decode_object(text)
+    if parsed is None:
+        parsed = salvage_pairs(text)
+
+    valid = {}
+    for key, en_text in en_texts.items():
+        value = parsed.get(key)
+        if not isinstance(value, str) or not value.strip():
+            continue
+        if placeholders(value) != placeholders(en_text):
+            continue
+        valid[key] = value
+    return valid, set(en_texts) - set(valid)
+
+
+def parse_fanout(text, en_texts, langs):
+    """
+    解析多语言合并请求的输出 {key: {语言: 译文}}，返回 ({语言: {key: 译文}}, 缺失或无效的译文条数)
+
+    校验规则与 parse_translation 相同；输出被截断时保留已完整输出的 key。
+    """
+    text = strip_code_fence(text)
+    parsed = decode_object(text)
+    if parsed is None:
+        parsed = parse_object_prefix(text)
+
+    valid = {lang: {} for lang in langs}
+    missing = 0
+    for key, en_text in en_texts.items():
+        entry = parsed.get(key)
+        if not isinstance(entry, dict):
+            missing += len(langs)
+            continue
+        expected = placeholders(en_text)
+        for lang in langs:
+            value = entry.get(lang)
+            if isinstance(value, str) and value.strip() and placeholders(value) == expected:
+                valid[lang][key] = value
+            else:
+                missing += 1
+    return valid, missing
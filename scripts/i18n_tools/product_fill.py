@@ -0,0 +1,295 @@
+"""
+补齐 products 表多语言 JSON 字段中缺失的语言
+
+流式读取 products（MySQL 服务端游标），对每个商品的 name / shortDescription /
+description 算出缺失语言矩阵；同一段原文只发一个请求，一次翻译成它缺的全部语言
+（输出超出预算时按语言拆成几组）。结果按窗口批量写回，每个窗口一个事务。
+
+可断点续跑：每个窗口提交后记录已完成的最大商品 id；译文同时写入翻译记忆，
+中途崩溃重跑时已翻译过的原文不会再请求。
+
+直接写 products，不经过 server/db.ts 的 updateProduct：product_texts 投影不会随之更新，
+接口读到哈希不符的投影行时现场解析并在后台刷新；写完后仍应运行 pnpm products:project。
+"""
+import asyncio
+import json
+import os
+
+from .batching import MAX_OUTPUT_TOKENS, MODEL_OUTPUT_LIMIT, Batch, compact_json, estimate_pair, estimate_tokens
+from .db import MYSQL, chunked
+from .languages import LANGUAGE_NAMES, SUPPORTED_LANGUAGES
+from .parsing import parse_translation, strip_code_fence
+from .product_sync import COLUMNS, parse_multilingual, update_statement
+
+STATE_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.cache/product-fill-state.json")
+)
+
+# 选原文时的优先顺序
+SOURCE_PREFERENCE = ("en", "zh", "zh-Hant")
+
+# 每个窗口的商品数（一个事务），以及单段原文的最大重试次数
+WINDOW_SIZE = 200
+MAX_RETRIES = 3
+
+
+def pick_source(values):
+    for lang in SOURCE_PREFERENCE:
+        if values.get(lang, "").strip():
+            return lang
+    for lang, text in values.items():
+        if lang in LANGUAGE_NAMES and text.strip():
+            return lang
+    return None
+
+
+def missing_languages(values, languages=SUPPORTED_LANGUAGES):
+    return [lang for lang in languages if not values.get(lang, "").strip()]
+
+
+class Gap:
+    """一个商品一列的缺口：从 source 语言翻译到 targets"""
+
+    __slots__ = ("product_id", "column", "source_lang", "text", "targets")
+
+    def __init__(self, product_id, column, source_lang, text, targets):
+        self.product_id = product_id
+        self.column = column
+        self.source_lang = source_lang
+        self.text = text
+        self.targets = targets
+
+
+def find_gaps(rows, languages=SUPPORTED_LANGUAGES):
+    """rows: [(id, name, shortDescription, description)]，返回 Gap 列表"""
+    gaps = []
+    for row in rows:
+        product_id = row[0]
+        for column, value in zip(COLUMNS, row[1:]):
+            values = parse_multilingual(value)
+            if not values:
+                continue
+            targets = missing_languages(values, languages)
+            source = pick_source(values)
+            if targets and source:
+                gaps.append(Gap(product_id, column, source, values[source], targets))
+    return gaps
+
+
+def plan_fanout(text, targets, max_output_tokens=MAX_OUTPUT_TOKENS):
+    """
+    把一段原文的目标语言分组，每组一个请求；Batch.texts 为 {目标语言: 原文}
+    原文只在 prompt 里出现一次，输入 token 只算一份
+    """
+    batches = []
+    current = Batch(None)
+    for lang in targets:
+        _, output_tokens = estimate_pair(lang, text, lang)
+        if len(current) and current.output_tokens + output_tokens > max_output_tokens:
+            batches.append(current)
+            current = Batch(None)
+        current.add(lang, text, 0 if len(current) else estimate_tokens(text), output_tokens)
+    if len(current):
+        batches.append(current)
+    return batches
+
+
+def fanout_messages(text, source_lang, targets, column):
+    target_list = ", ".join(f"{lang} ({LANGUAGE_NAMES[lang]})" for lang in targets)
+    prompt = f"""Translate the following {LANGUAGE_NAMES[source_lang]} product {column} into each of these languages: {target_list}.
+This is for a spiritual/cultural e-commerce website about Chinese traditional wisdom, Wutai Mountain Buddhist services, feng shui, palm reading, and face reading.
+
+Important rules:
+1. Keep all {{{{variable}}}} placeholders, markdown (**bold**, lists) and line breaks exactly as they are
+2. Translate naturally and professionally for each target language
+3. For Buddhist/spiritual terms, use culturally appropriate translations
+4. Return ONLY a JSON object mapping each language code to its translation, no explanation
+
+Text to translate:
+{compact_json(text)}"""
+    return [
+        {"role": "system", "content": "You are a professional multilingual translator. Return only valid JSON."},
+        {"role": "user", "content": prompt},
+    ]
+
+
+async def translate_fanout(engine, text, source_lang, column, batch, attempt=0):
+    """翻译一组目标语言，返回 {lang: 译文}；缺失或无效的语言单独重试"""
+    targets = list(batch.texts)
+    response = await engine.complete(
+        messages=fanout_messages(text, source_lang, targets, column),
+        temperature=0.3,
+        max_tokens=batch.max_tokens,
+    )
+    choice = response.choices[0]
+    translated, missing = parse_translation(strip_code_fence(choice.message.content or ""), batch.texts)
+    if not missing or attempt >= MAX_RETRIES:
+        return translated
+
+    retry = Batch(None)
+    for lang in targets:
+        if lang in missing:
+            retry.add(lang, text, 0, estimate_pair(lang, text, lang)[1])
+    if choice.finish_reason == "length":
+        # 输出被截断：剩余语言拆成两组，单个语言时用最大输出再试
+        if len(retry) == 1:
+            retry.output_tokens = MODEL_OUTPUT_LIMIT
+            parts = [retry]
+        else:
+            langs = list(retry.texts)
+            parts = plan_fanout(text, langs[: len(langs) // 2]) + plan_fanout(text, langs[len(langs) // 2:])
+    else:
+        parts = [retry]
+    for result in await asyncio.gather(*(translate_fanout(engine, text, source_lang, column, p, attempt + 1) for p in parts)):
+        translated.update(result)
+    return translated
+
+
+async def fill_source(engine, memory, text, source_lang, column, targets):
+    """一段原文翻译到 targets；先查翻译记忆，返回 {lang: 译文}"""
+    translated = {}
+    if memory is not None:
+        for lang in targets:
+            cached = memory.lookup([text], lang)
+            if text in cached:
+                translated[lang] = cached[text]
+    pending = [lang for lang in targets if lang not in translated]
+    if not pending:
+        return translated
+    results = await asyncio.gather(
+        *(translate_fanout(engine, text, source_lang, column, batch) for batch in plan_fanout(text, pending)),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            continue
+        if memory is not None:
+            for lang, value in result.items():
+                memory.store({text: value}, lang)
+        translated.update(result)
+    return translated
+
+
+def write_window(db, results):
+    """
+    results: {(product_id, column): {lang: 译文}}
+    重新读取当前值后只补缺失的语言，一个事务写完；返回更新的商品数
+    """
+    ids = sorted({product_id for product_id, _ in results})
+    updates = {}
+    for batch in chunked(ids, WINDOW_SIZE):
+        marks = ",".join("?" * len(batch))
+        rows = db.fetchall(
+            f"SELECT `id`, {', '.join(f'`{c}`' for c in COLUMNS)} FROM `products` WHERE `id` IN ({marks})", batch
+        )
+        for row in rows:
+            for column, value in zip(COLUMNS, row[1:]):
+                translated = results.get((row[0], column))
+                if not translated:
+                    continue
+                values = parse_multilingual(value)
+                added = {lang: text for lang, text in translated.items() if not values.get(lang, "").strip()}
+                if added:
+                    values.update(added)
+                    updates.setdefault(row[0], {})[column] = json.dumps(values, ensure_ascii=False)
+    if not updates:
+        return 0
+    try:
+        for batch in chunked(sorted(updates), WINDOW_SIZE):
+            statement, params = update_statement({product_id: updates[product_id] for product_id in batch})
+            db.execute(statement, params).close()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(updates)
+
+
+class FillStats:
+    def __init__(self):
+        self.products = 0
+        self.gaps = 0
+        self.sources = 0
+        self.filled = 0
+        self.failed = 0
+        self.updated = 0
+        self.missing_by_lang = {}
+
+
+async def fill_window(engine, memory, writer, gaps, stats):
+    """翻译一个窗口的全部缺口并写回；同一原文+源语言只翻译一次"""
+    by_source = {}
+    for gap in gaps:
+        key = (gap.text, gap.source_lang)
+        entry = by_source.setdefault(key, [set(), gap.column])
+        entry[0].update(gap.targets)
+    stats.sources += len(by_source)
+
+    keys = list(by_source)
+    translations = await asyncio.gather(*(
+        fill_source(engine, memory, text, source_lang, by_source[(text, source_lang)][1],
+                    sorted(by_source[(text, source_lang)][0], key=SUPPORTED_LANGUAGES.index))
+        for text, source_lang in keys
+    ))
+    translated = dict(zip(keys, translations))
+
+    results = {}
+    for gap in gaps:
+        done = translated[(gap.text, gap.source_lang)]
+        values = {lang: done[lang] for lang in gap.targets if lang in done}
+        stats.filled += len(values)
+        stats.failed += len(gap.targets) - len(values)
+        if values:
+            results.setdefault((gap.product_id, gap.column), {}).update(values)
+    if results:
+        stats.updated += write_window(writer, results)
+
+
+def load_state(path=STATE_PATH):
+    if not os.path.exists(path):
+        return {"last_id": 0}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(state, path=STATE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def stream_products(reader, after_id=0, limit=None, batch_size=WINDOW_SIZE):
+    if reader.dialect == MYSQL:
+        # 每个窗口翻译期间游标不读取，避免服务端因写超时断开
+        reader.execute("SET SESSION net_write_timeout = 3600").close()
+    sql = f"SELECT `id`, {', '.join(f'`{c}`' for c in COLUMNS)} FROM `products` WHERE `id` > ? ORDER BY `id`"
+    params = [after_id]
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return reader.stream(sql, params, batch_size)
+
+
+async def fill_products(engine, memory, reader, writer, state, languages=SUPPORTED_LANGUAGES,
+                        limit=None, on_window=None):
+    """
+    reader 流式读取，writer 写回（MySQL 服务端游标读取期间同一连接不能执行其他语句）
+    每个窗口提交后更新 state["last_id"]
+    """
+    stats = FillStats()
+    for rows in stream_products(reader, state.get("last_id", 0), limit):
+        stats.products += len(rows)
+        gaps = find_gaps(rows, languages)
+        stats.gaps += len(gaps)
+        for gap in gaps:
+            for lang in gap.targets:
+                stats.missing_by_lang[lang] = stats.missing_by_lang.get(lang, 0) + 1
+        if engine is not None and gaps:
+            await fill_window(engine, memory, writer, gaps, stats)
+        if engine is not None:
+            state["last_id"] = rows[-1][0]
+            if on_window is not None:
+                on_window(state, stats)
+    return stats
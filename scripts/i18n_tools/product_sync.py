@@ -0,0 +1,242 @@
+"""
+把语言文件里的商品文案迁移到 products 表的多语言 JSON 字段
+
+translate-fortune-products.mjs 等脚本把商品的 name / shortDesc / description
+按商品 id（或 slug）写进每个语言文件的 products 段，商品越多，每个用户下载的
+i18n 包越大。这里把这些条目按商品汇总成 {lang: 文本}，批量合并进 products 表，
+成功提交后再从语言文件里删掉。
+
+之后再有脚本往语言文件写商品文案，重跑一次即可增量同步；
+已同步条目的哈希记在 STATE_PATH，保留语言文件（--keep-locales）时也不会重复写库。
+
+update_statement 直接改 products，product_texts 投影不会随之更新（接口读到哈希不符的
+投影行时现场解析并在后台刷新）；同步后运行 pnpm products:project 重建投影。
+"""
+import hashlib
+import json
+import os
+import re
+
+from .compiler import is_product_entry
+from .db import chunked
+
+STATE_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.cache/product-sync-state.json")
+)
+
+# 语言文件字段 -> products 表列
+FIELD_MAP = {"name": "name", "shortDesc": "shortDescription", "description": "description"}
+COLUMNS = tuple(FIELD_MAP.values())
+BATCH_SIZE = 200
+
+_CJK_RE = re.compile(r"[一-鿿]")
+
+
+def extract_entries(store):
+    """返回 {商品 key: {列名: {lang: 文本}}}；商品 key 为 id 字符串或 slug"""
+    entries = {}
+    for lang in store.langs:
+        section = store.data(lang).get("products")
+        if not isinstance(section, dict):
+            continue
+        for key, value in section.items():
+            if not is_product_entry(key, value):
+                continue
+            columns = entries.setdefault(key, {})
+            for field, column in FIELD_MAP.items():
+                text = value.get(field)
+                if isinstance(text, str) and text.strip():
+                    columns.setdefault(column, {})[lang] = text
+    return entries
+
+
+def entry_hash(columns):
+    return hashlib.sha256(json.dumps(columns, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def parse_multilingual(value):
+    """列值解析成 {lang: 文本}；历史遗留的纯文本按是否含中文归到 zh 或 en"""
+    if not value:
+        return {}
+    if value.lstrip().startswith("{"):
+        try:
+            data = json.loads(value)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            return {lang: text for lang, text in data.items() if isinstance(text, str)}
+    return {"zh" if _CJK_RE.search(value) else "en": value}
+
+
+def merge_column(current, incoming, prefer_locale=False):
+    """
+    合并一列，返回 (新 JSON 文本或 None（无变化）, 冲突语言列表)
+    两边都有且不同的语言算冲突：默认保留数据库里的值
+    """
+    merged = parse_multilingual(current)
+    conflicts = []
+    changed = False
+    for lang, text in incoming.items():
+        existing = merged.get(lang)
+        if existing == text:
+            continue
+        if existing and not prefer_locale:
+            conflicts.append(lang)
+            continue
+        merged[lang] = text
+        changed = True
+    if not changed:
+        return None, conflicts
+    return json.dumps(merged, ensure_ascii=False), conflicts
+
+
+def load_state(path=STATE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(state, path=STATE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def resolve_product_ids(db, keys):
+    """商品 key -> 数据库 id；数字 key 直接当 id，其余按 slug 查"""
+    resolved = {}
+    slugs = []
+    for key in keys:
+        if key.isdigit():
+            resolved[key] = int(key)
+        else:
+            slugs.append(key)
+    for batch in chunked(slugs, BATCH_SIZE):
+        marks = ",".join("?" * len(batch))
+        for product_id, slug in db.fetchall(f"SELECT `id`, `slug` FROM `products` WHERE `slug` IN ({marks})", batch):
+            resolved[slug] = product_id
+    ids = sorted(set(resolved.values()))
+    existing = set()
+    for batch in chunked(ids, BATCH_SIZE):
+        marks = ",".join("?" * len(batch))
+        existing.update(row[0] for row in db.fetchall(f"SELECT `id` FROM `products` WHERE `id` IN ({marks})", batch))
+    return {key: product_id for key, product_id in resolved.items() if product_id in existing}
+
+
+def update_statement(updates, columns=COLUMNS, table="products"):
+    """
+    把 {id: {列: 值}} 拼成一条多行 UPDATE（CASE id WHEN ...），返回 (sql, params)
+    行已存在，只改 columns 中的列，不需要 INSERT 路径要求的其他非空列
+    """
+    ids = sorted(updates)
+    assignments = []
+    params = []
+    for column in columns:
+        rows = [product_id for product_id in ids if column in updates[product_id]]
+        if not rows:
+            continue
+        cases = []
+        for product_id in rows:
+            cases.append("WHEN ? THEN ?")
+            params.extend([product_id, updates[product_id][column]])
+        assignments.append(f"`{column}` = CASE `id` {' '.join(cases)} ELSE `{column}` END")
+    params.extend(ids)
+    marks = ",".join("?" * len(ids))
+    return f"UPDATE `{table}` SET {', '.join(assignments)} WHERE `id` IN ({marks})", params
+
+
+class SyncReport:
+    def __init__(self):
+        self.entries = 0
+        self.unchanged = 0
+        self.orphans = []
+        self.updated = 0
+        self.conflicts = {}
+        self.statements = 0
+        self.synced_keys = []
+        # 有冲突（保留了数据库里的值）的商品 key：不记同步状态，也不从语言文件删除
+        self.conflicted_keys = []
+
+
+def sync_products(store, db, state, prefer_locale=False, dry_run=False, full=False):
+    """
+    合并语言文件中的商品条目到数据库，每批一个事务；返回 SyncReport
+    state 为 {商品 key: 条目哈希}，只处理哈希变化的条目（full=True 时全部处理），成功后原地更新；
+    有冲突的条目只合并不冲突的部分，留在语言文件里等人工处理或 --prefer-locale 重跑
+    """
+    report = SyncReport()
+    entries = extract_entries(store)
+    report.entries = len(entries)
+
+    pending = {}
+    for key, columns in entries.items():
+        digest = entry_hash(columns)
+        if not full and state.get(key) == digest:
+            report.unchanged += 1
+            report.synced_keys.append(key)
+        else:
+            pending[key] = (columns, digest)
+
+    ids = resolve_product_ids(db, pending)
+    report.orphans = sorted(key for key in pending if key not in ids)
+
+    by_id = {}
+    for key, product_id in ids.items():
+        by_id.setdefault(product_id, []).append(key)
+
+    for batch in chunked(sorted(by_id), BATCH_SIZE):
+        marks = ",".join("?" * len(batch))
+        rows = db.fetchall(
+            f"SELECT `id`, {', '.join(f'`{c}`' for c in COLUMNS)} FROM `products` WHERE `id` IN ({marks})", batch
+        )
+        updates = {}
+        conflicted = set()
+        for row in rows:
+            product_id, current = row[0], dict(zip(COLUMNS, row[1:]))
+            for key in by_id[product_id]:
+                for column, incoming in pending[key][0].items():
+                    merged, conflicts = merge_column(
+                        updates.get(product_id, {}).get(column, current[column]), incoming, prefer_locale
+                    )
+                    if conflicts:
+                        report.conflicts[f"{key}.{column}"] = conflicts
+                        conflicted.add(key)
+                    if merged is not None:
+                        updates.setdefault(product_id, {})[column] = merged
+
+        if updates and not dry_run:
+            statement, params = update_statement(updates)
+            try:
+                db.execute(statement, params).close()
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            report.statements += 1
+        report.updated += len(updates)
+
+        report.conflicted_keys.extend(sorted(conflicted))
+        if not dry_run:
+            for product_id in batch:
+                for key in by_id[product_id]:
+                    if key in conflicted:
+                        state.pop(key, None)
+                        continue
+                    state[key] = pending[key][1]
+                    report.synced_keys.append(key)
+    return report
+
+
+def strip_synced(tx, keys):
+    """从所有语言文件删掉已同步的商品条目"""
+    for lang in tx.store.langs:
+        section = tx.store.data(lang).get("products")
+        if not isinstance(section, dict):
+            continue
+        for key in keys:
+            if key in section:
+                tx.delete(lang, f"products.{key}")
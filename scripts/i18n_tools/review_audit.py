@@ -0,0 +1,257 @@
+"""
+reviews 表语言审计：服务端游标按 id 顺序分块读取，进程池逐块判断文字和语言，按块批量写回
+
+每块评价（标题 + 评论，各取前 TEXT_LIMIT 个字符，在 SQL 里截断）交给一个工作进程：
+先用 script_detect 的码位表整块算出文字直方图，声明语言的文字不符时记 wrong_script / no_kana，
+并按主体文字推断语言；正文和声明语言都是拉丁字母时，再按常用词和特有字母给各语言打分，
+明显领先的语言与声明不同时记 wrong_language。
+
+主进程最多挂起 workers * PENDING_PER_WORKER 个块，按提交顺序取回结果，每块一个事务写回：
+先删除该块 id 区间内的旧审计结果再插入新结果（重复运行结果一致，已修正的行下次审计时随区间清掉），
+fix 时把能推断出语言的评价合成一条 CASE id 的 UPDATE 改写 reviews.language。
+占用的内存只与块大小和进程数有关，与表的行数无关。
+"""
+import os
+import re
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .db import MYSQL, chunked
+from .product_sync import update_statement
+from .script_detect import (
+    ARABIC, CYRILLIC, DEVANAGARI, EXPECTED_SCRIPTS, HAN, HANGUL, KANA, LATIN, MIN_LETTERS, THAI,
+    classify, dominant, histograms,
+)
+
+TABLE = "review_language_audits"
+
+CHUNK_SIZE = 5000
+# 每个工作进程最多排队的块数：再多只占内存，不会更快
+PENDING_PER_WORKER = 2
+TEXT_LIMIT = 400
+INSERT_BATCH = 500
+UPDATE_BATCH = 1000
+
+# 非拉丁文字 -> 推断的语言（汉字无法区分简繁，按 zh 处理）
+SCRIPT_LANGS = {
+    CYRILLIC: "ru",
+    ARABIC: "ar",
+    DEVANAGARI: "hi",
+    THAI: "th",
+    HANGUL: "ko",
+    KANA: "ja",
+    HAN: "zh",
+}
+
+LATIN_LANGS = tuple(lang for lang, scripts in EXPECTED_SCRIPTS.items() if scripts == (LATIN,))
+
+# 评价里常见的功能词和评价用语（参照 fix-review-languages.mjs），一个词可以属于多个语言
+LATIN_WORDS = {
+    "en": "the and is was this with very my it for but not arrived beautiful quality love recommend",
+    "de": "der die das und ist ich sehr nicht mit wurde habe ein eine auch schön wunderschön qualität",
+    "fr": "le les et est très une je avec pour ce cette mon pas qualité magnifique acheté depuis",
+    "es": "el los las y es muy una con para este esta pero hermosa calidad increíble exactamente",
+    "it": "il gli è molto una con per questo questa di che non bellissimo qualità assolutamente",
+    "pt": "o os é muito uma com para não peça linda chegou embalado qualidade você",
+    "id": "dan yang sangat ini dengan saya untuk bagus tidak kualitas sudah barang",
+    "tr": "ve bir çok bu için ile güzel kalite ürün değil gibi ama",
+    "vi": "và rất của là này cho tôi đẹp không lượng sản phẩm được",
+}
+# 只在某个拉丁字母语言里出现的字母，出现一种加 LETTER_SCORE 分
+LATIN_LETTERS = {
+    "de": "ß",
+    "es": "ñ¿¡",
+    "pt": "ãõ",
+    "tr": "ğşı",
+    "vi": "đơưạảấầẩẫậắằẳẵặẹẻẽếềểễệỉịọỏốồổỗộớờởỡợụủứừửữựỳỵỷỹ",
+}
+LETTER_SCORE = 2
+# 拉丁字母语言的结论条件：最高分至少 MIN_LATIN_SCORE，且至少是第二名的 LATIN_MARGIN 倍
+MIN_LATIN_SCORE = 3
+LATIN_MARGIN = 2
+
+_WORD_LANGS = {}
+for _lang, _words in LATIN_WORDS.items():
+    for _word in _words.split():
+        _WORD_LANGS[_word] = _WORD_LANGS.get(_word, ()) + (_lang,)
+_LETTER_LANGS = {letter: lang for lang, letters in LATIN_LETTERS.items() for letter in letters}
+_WORD_RE = re.compile(r"\w+")
+
+
+def latin_language(text):
+    """按出现的不同常用词和特有字母推断拉丁字母文本的语言；得分不够或没有明显领先时返回 None"""
+    scores = Counter()
+    text = text.lower()
+    for word in _WORD_LANGS.keys() & _WORD_RE.findall(text):
+        for lang in _WORD_LANGS[word]:
+            scores[lang] += 1
+    for letter in set(text).intersection(_LETTER_LANGS):
+        scores[_LETTER_LANGS[letter]] += LETTER_SCORE
+    ranked = scores.most_common(2)
+    if not ranked or ranked[0][1] < MIN_LATIN_SCORE:
+        return None
+    if len(ranked) > 1 and ranked[0][1] < ranked[1][1] * LATIN_MARGIN:
+        return None
+    return ranked[0][0]
+
+
+def infer_language(script, text):
+    return latin_language(text) if script == LATIN else SCRIPT_LANGS.get(script)
+
+
+def classify_review(declared, text, histogram):
+    """返回 (问题代码, 推断语言或 None, 主体文字, 加权占比)；没有问题、声明语言未知或字母太少时返回 None"""
+    result = classify(declared, histogram)
+    if result is not None:
+        code, script, share = result
+        return code, "zh" if code == "no_kana" else infer_language(script, text), script, share
+    if declared not in LATIN_LANGS or sum(histogram.values()) < MIN_LETTERS:
+        return None
+    script, share = dominant(histogram)
+    detected = latin_language(text)
+    if detected is None or detected == declared:
+        return None
+    return "wrong_language", detected, script, share
+
+
+def audit_chunk(rows):
+    """
+    工作进程入口：rows 为 [(id, language, title, comment)]
+    返回 (首 id, 末 id, [(id, 声明语言, 问题代码, 推断语言, 主体文字, 占比)], 未检查的行数)
+    """
+    texts = [" ".join(part for part in (title, comment) if part) for _, _, title, comment in rows]
+    findings = []
+    unchecked = 0
+    for row, text, histogram in zip(rows, texts, histograms(texts)):
+        if row[1] not in EXPECTED_SCRIPTS:
+            unchecked += 1
+            continue
+        result = classify_review(row[1], text, histogram)
+        if result is not None:
+            findings.append((row[0], row[1], *result))
+    return rows[0][0], rows[-1][0], findings, unchecked
+
+
+def write_chunk(writer, first_id, last_id, findings, fix=False):
+    """一个事务：替换 [first_id, last_id] 区间的审计结果；fix 时改写能推断出语言的评价。返回改写的行数"""
+    fixes = {review_id: {"language": detected} for review_id, _, _, detected, _, _ in findings if fix and detected}
+    try:
+        writer.execute(f"DELETE FROM `{TABLE}` WHERE `reviewId` BETWEEN ? AND ?", (first_id, last_id)).close()
+        for batch in chunked(findings, INSERT_BATCH):
+            values = ",".join(["(?, ?, ?, ?, ?, ?, ?)"] * len(batch))
+            params = []
+            for review_id, declared, code, detected, script, share in batch:
+                params.extend([review_id, declared, detected, code, script, round(share * 100), review_id in fixes])
+            writer.execute(
+                f"INSERT INTO `{TABLE}` (`reviewId`, `declared`, `detected`, `code`, `script`, `share`, `fixed`) "
+                f"VALUES {values}",
+                params,
+            ).close()
+        for batch in chunked(sorted(fixes), UPDATE_BATCH):
+            statement, params = update_statement({review_id: fixes[review_id] for review_id in batch}, ("language",),
+                                                 "reviews")
+            writer.execute(statement, params).close()
+        writer.commit()
+    except Exception:
+        writer.rollback()
+        raise
+    return len(fixes)
+
+
+class AuditStats:
+    def __init__(self):
+        self.rows = 0
+        self.chunks = 0
+        self.findings = 0
+        self.fixed = 0
+        self.unchecked = 0
+        self.last_id = 0
+        self.by_code = Counter()
+        # {声明语言: {推断语言或 "?": 数量}}
+        self.by_lang = {}
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self):
+        return self.rows / max(self.elapsed, 1e-9)
+
+    def add(self, rows, last_id, findings, unchecked):
+        self.rows += rows
+        self.chunks += 1
+        self.last_id = last_id
+        self.unchecked += unchecked
+        self.findings += len(findings)
+        for _, declared, code, detected, _, _ in findings:
+            self.by_code[code] += 1
+            by_detected = self.by_lang.setdefault(declared, Counter())
+            by_detected[detected or "?"] += 1
+
+    def as_dict(self):
+        return {
+            "rows": self.rows,
+            "findings": self.findings,
+            "fixed": self.fixed,
+            "unchecked": self.unchecked,
+            "last_id": self.last_id,
+            "elapsed_s": round(self.elapsed, 2),
+            "rows_per_s": round(self.rate),
+            "codes": dict(self.by_code),
+            "langs": {declared: dict(counts) for declared, counts in sorted(self.by_lang.items())},
+        }
+
+
+def stream_reviews(reader, after_id=0, limit=None, chunk_size=CHUNK_SIZE):
+    if reader.dialect == MYSQL:
+        # 进程池排满时主进程暂停读取，避免服务端因写超时断开游标
+        reader.execute("SET SESSION net_write_timeout = 3600").close()
+    sql = (
+        "SELECT `id`, `language`, SUBSTR(`title`, 1, ?), SUBSTR(`comment`, 1, ?) FROM `reviews` "
+        "WHERE `id` > ? ORDER BY `id`"
+    )
+    params = [TEXT_LIMIT, TEXT_LIMIT, after_id]
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return reader.stream(sql, params, chunk_size)
+
+
+def audit_reviews(reader, writer, workers=None, chunk_size=CHUNK_SIZE, after_id=0, limit=None, fix=False,
+                  progress=None):
+    """
+    reader 流式读取 reviews，writer 写回（MySQL 服务端游标读取期间同一连接不能执行其他语句），
+    writer 为 None 时只统计不写库；workers=0 时在当前进程内逐块处理。
+    progress(stats) 在每块写回后调用。返回 AuditStats
+    """
+    stats = AuditStats()
+
+    def finish(result, rows):
+        first_id, last_id, findings, unchecked = result
+        stats.add(rows, last_id, findings, unchecked)
+        if writer is not None:
+            stats.fixed += write_chunk(writer, first_id, last_id, findings, fix)
+        if progress is not None:
+            progress(stats)
+
+    chunks = stream_reviews(reader, after_id, limit, chunk_size)
+    if workers == 0:
+        for rows in chunks:
+            finish(audit_chunk(rows), len(rows))
+        return stats
+
+    workers = workers or os.cpu_count() or 1
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for rows in chunks:
+            pending.append((pool.submit(audit_chunk, rows), len(rows)))
+            if len(pending) >= workers * PENDING_PER_WORKER:
+                future, count = pending.popleft()
+                finish(future.result(), count)
+        while pending:
+            future, count = pending.popleft()
+            finish(future.result(), count)
+    return stats
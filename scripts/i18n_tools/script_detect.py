@@ -0,0 +1,229 @@
+"""
+按 Unicode 文字（script）判断字符串是否是声明的语言
+
+每个字符按预先建好的码位表映射成一个文字代码（拉丁、西里尔、阿拉伯、天城、泰、韩、假名、汉字），
+数字、标点、空白等中性字符不计。一批字符串先拼成一个长串，去掉 {{占位符}}、HTML 标签、
+网址和邮箱后用 str.translate 一次映射完（C 层逐码位查表），再按分隔符切开逐段计数，
+得到每个字符串的文字直方图。
+
+占比最高的文字不在该语言允许的文字里时报告 wrong_script（ja / ko / th / ar 里的英文 fallback、
+各语言文件里残留的中文）；ja 里汉字很多却没有一个假名时报告 no_kana（多半是中文）。
+同为拉丁字母的语言之间（en / de / fr ...）无法靠文字区分，不在检查范围内。
+"""
+import re
+import time
+
+from .product_sync import parse_multilingual
+
+LATIN = "latin"
+CYRILLIC = "cyrillic"
+ARABIC = "arabic"
+DEVANAGARI = "devanagari"
+THAI = "thai"
+HANGUL = "hangul"
+KANA = "kana"
+HAN = "han"
+
+# 文字 -> 码位区间（闭区间）
+SCRIPT_RANGES = {
+    LATIN: ((0x41, 0x5A), (0x61, 0x7A), (0xC0, 0xD6), (0xD8, 0xF6), (0xF8, 0x24F), (0x1E00, 0x1EFF)),
+    CYRILLIC: ((0x400, 0x52F),),
+    ARABIC: ((0x600, 0x6FF), (0x750, 0x77F), (0x8A0, 0x8FF), (0xFB50, 0xFDFF), (0xFE70, 0xFEFF)),
+    DEVANAGARI: ((0x900, 0x97F),),
+    THAI: ((0xE00, 0xE7F),),
+    HANGUL: ((0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7AF)),
+    KANA: ((0x3040, 0x30FF), (0x31F0, 0x31FF), (0xFF66, 0xFF9F)),
+    HAN: ((0x3400, 0x4DBF), (0x4E00, 0x9FFF), (0xF900, 0xFAFF)),
+}
+
+# 各语言允许作为主体的文字
+EXPECTED_SCRIPTS = {
+    "en": (LATIN,),
+    "de": (LATIN,),
+    "es": (LATIN,),
+    "fr": (LATIN,),
+    "id": (LATIN,),
+    "it": (LATIN,),
+    "pt": (LATIN,),
+    "tr": (LATIN,),
+    "vi": (LATIN,),
+    "zh": (HAN,),
+    "zh-Hant": (HAN,),
+    "ja": (KANA, HAN),
+    "ko": (HANGUL,),
+    "ar": (ARABIC,),
+    "hi": (DEVANAGARI,),
+    "ru": (CYRILLIC,),
+    "th": (THAI,),
+}
+
+# 比较主体文字时的权重：一个汉字 / 谚文音节承载的信息约等于两三个字母，
+# 否则 "PayPal 在线支付" 会因为字母数多被判成拉丁文
+WEIGHTS = {HAN: 3, HANGUL: 3, KANA: 2}
+
+# 计数的字母少于此数时不下结论（"OK"、"VIP"、纯数字）
+MIN_LETTERS = 4
+# ja 的字符串至少有这么多汉字、却没有假名时判为 no_kana（纯汉字的短标题在日语里很常见）
+NO_KANA_MIN_HAN = 16
+
+_SEPARATOR = "\x1f"
+_NEUTRAL = "."
+_CODES = {script: chr(ord("A") + i) for i, script in enumerate(SCRIPT_RANGES)}
+
+
+def _build_table():
+    """基本多文种平面的码位表：下标为码位，值为文字代码；平面外的字符 translate 时原样保留，不计数"""
+    table = [_NEUTRAL] * 0x10000
+    for script, ranges in SCRIPT_RANGES.items():
+        code = _CODES[script]
+        for start, end in ranges:
+            table[start:end + 1] = [code] * (end - start + 1)
+    table[ord(_SEPARATOR)] = _SEPARATOR
+    return "".join(table)
+
+
+_TABLE = _build_table()
+
+# 不属于正文的片段：占位符、标签、网址
+_MARKUP_RE = re.compile(r"\{\{[^{}\x1f]*\}\}|<[^<>\x1f]*>|https?://[^\s\x1f]+")
+# 邮箱、域名：这个正则要在每个字母处尝试匹配，比上面的慢一个数量级，只对含 @ 或顶级域名的字符串运行
+_ADDRESS_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+|\b(?:[\w-]+\.)+(?:com|net|org|cn|io|co)\b")
+_ADDRESS_HINT_RE = re.compile(r"@|\.(?:com|net|org|cn|io|co)\b")
+
+
+def histograms(texts):
+    """[文本] -> [{文字: 字母数}]；整批只做一次去噪和一次码位映射"""
+    blob = _MARKUP_RE.sub(" ", _SEPARATOR.join(text.replace(_SEPARATOR, " ") for text in texts))
+    if _ADDRESS_HINT_RE.search(blob):
+        blob = _SEPARATOR.join(
+            _ADDRESS_RE.sub(" ", segment) if _ADDRESS_HINT_RE.search(segment) else segment
+            for segment in blob.split(_SEPARATOR)
+        )
+    # 中性字符映射后整体删掉，每段只剩文字代码（和平面外的字符），逐个代码用 str.count 计数
+    mapped = blob.translate(_TABLE).replace(_NEUTRAL, "")
+    codes = tuple(_CODES.items())
+    return [
+        {script: count for script, code in codes if (count := segment.count(code))}
+        for segment in mapped.split(_SEPARATOR)
+    ]
+
+
+def dominant(histogram):
+    """(加权后占比最高的文字, 加权占比)；histogram 不能为空"""
+    weighted = {script: count * WEIGHTS.get(script, 1) for script, count in histogram.items()}
+    script = max(weighted, key=weighted.get)
+    return script, weighted[script] / sum(weighted.values())
+
+
+def classify(lang, histogram):
+    """返回 (问题代码, 主体文字, 加权占比)；没有问题、语言未知或字母太少时返回 None"""
+    expected = EXPECTED_SCRIPTS.get(lang)
+    letters = sum(histogram.values())
+    if expected is None or letters < MIN_LETTERS:
+        return None
+    script, share = dominant(histogram)
+    if script not in expected:
+        return "wrong_script", script, share
+    if lang == "ja" and KANA not in histogram and histogram.get(HAN, 0) >= NO_KANA_MIN_HAN:
+        return "no_kana", HAN, histogram[HAN] / letters
+    return None
+
+
+class Finding:
+    __slots__ = ("source", "lang", "key", "code", "script", "share", "text")
+
+    def __init__(self, source, lang, key, code, script, share, text):
+        self.source = source
+        self.lang = lang
+        self.key = key
+        self.code = code
+        self.script = script
+        self.share = share
+        self.text = text
+
+    @property
+    def message(self):
+        expected = "/".join(EXPECTED_SCRIPTS[self.lang])
+        if self.code == "no_kana":
+            return f"{self.share:.0%} han without any kana"
+        return f"{self.share:.0%} {self.script}, expected {expected}"
+
+    def as_dict(self):
+        return {
+            "source": self.source,
+            "lang": self.lang,
+            "key": self.key,
+            "code": self.code,
+            "script": self.script,
+            "share": round(self.share, 3),
+            "text": self.text,
+        }
+
+
+def check_items(items):
+    """items: [(来源, 语言, key, 文本)]，一次批量计算直方图后逐条判断，返回 [Finding]"""
+    items = list(items)
+    findings = []
+    for (source, lang, key, text), histogram in zip(items, histograms([item[3] for item in items])):
+        result = classify(lang, histogram)
+        if result is not None:
+            findings.append(Finding(source, lang, key, *result, text))
+    return findings
+
+
+def locale_items(store, langs=None):
+    """语言文件里的全部字符串值：("locales", 语言, 点分 key, 文本)"""
+    for lang in langs or store.langs:
+        for key, value in store.flat(lang).items():
+            if isinstance(value, str) and value:
+                yield "locales", lang, key, value
+
+
+def product_items(reader, columns, langs=None, batch_size=500):
+    """
+    products 表多语言 JSON 列里的每个语言：("products", 语言, "#id.列", 文本)
+    历史遗留的纯文本列没有声明语言，跳过
+    """
+    sql = f"SELECT `id`, {', '.join(f'`{c}`' for c in columns)} FROM `products` ORDER BY `id`"
+    for rows in reader.stream(sql, (), batch_size):
+        for row in rows:
+            for column, value in zip(columns, row[1:]):
+                if not isinstance(value, str) or not value.lstrip().startswith("{"):
+                    continue
+                for lang, text in parse_multilingual(value).items():
+                    if text and (langs is None or lang in langs):
+                        yield "products", lang, f"#{row[0]}.{column}", text
+
+
+class LanguageReport:
+    def __init__(self, findings, strings, elapsed):
+        self.findings = findings
+        self.strings = strings
+        self.elapsed = elapsed
+
+    def counts(self):
+        """{(来源, 语言): {问题代码/主体文字: 数量}}"""
+        counts = {}
+        for finding in self.findings:
+            by_script = counts.setdefault((finding.source, finding.lang), {})
+            label = finding.code if finding.code != "wrong_script" else finding.script
+            by_script[label] = by_script.get(label, 0) + 1
+        return counts
+
+    def as_dict(self):
+        return {
+            "ok": not self.findings,
+            "findings": len(self.findings),
+            "strings": self.strings,
+            "elapsed_ms": round(self.elapsed * 1000, 1),
+            "counts": {f"{source}:{lang}": by_script for (source, lang), by_script in sorted(self.counts().items())},
+            "issues": [finding.as_dict() for finding in self.findings],
+        }
+
+
+def check_language(items):
+    """items 同 check_items；返回 LanguageReport（含计时）"""
+    started = time.perf_counter()
+    items = list(items)
+    findings = check_items(items)
+    return LanguageReport(findings, len(items), time.perf_counter() - started)
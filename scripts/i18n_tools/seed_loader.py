@@ -0,0 +1,283 @@
+"""
+把 seeds/*.sql 并行批量导入数据库
+
+种子文件里每行一条 INSERT，逐条回放时大部分时间花在网络往返和逐条提交上。
+这里流式读取种子文件，把同一张表、同一列顺序的行重新拼成大的多行 INSERT
+（按行数和字节数封顶，不超过 max_allowed_packet），不同的表分给不同的连接并行写入；
+同一张表始终由同一个连接按文件顺序写，INSERT IGNORE 遇到重复键时的结果与逐条回放一致。
+
+每个连接导入期间关闭外键检查（MySQL: foreign_key_checks，SQLite: foreign_keys / synchronous），
+结束时恢复原值。unique_checks 保持打开：关掉后 InnoDB 可能不检查二级唯一索引上的重复，
+INSERT IGNORE 就不再跳过这些行，结果与逐条回放不同。
+
+非 INSERT 语句（建表、UPDATE 等）作为屏障：先等所有连接写完已排队的批次，再在主连接上执行；
+SET 语句和只有注释的语句（如 SET NAMES、mysqldump 的 /*!40101 ... */）跳过，会话设置由这里统一管理。
+"""
+import queue
+import re
+import threading
+import time
+
+from .db import SQLITE, Database
+from .sql_seed import InsertStatement, StatementReader, split_insert, split_leading, unescape
+
+WORKERS = 4
+BATCH_ROWS = 2000
+BATCH_BYTES = 4 << 20
+# 每个连接最多排队的批次数，限制读取速度超过写入速度时的内存占用
+QUEUE_DEPTH = 4
+# SQLite 单条语句的参数上限
+SQLITE_MAX_VARIABLES = 32766
+
+_SET_RE = re.compile(r"SET\b", re.I)
+
+
+class TableStats:
+    def __init__(self, table):
+        self.table = table
+        self.rows = 0
+        self.batches = 0
+        self.busy = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.busy if self.busy else 0.0
+
+
+def fast_load_session(db):
+    """关闭外键检查（唯一性检查保持打开），返回恢复原设置的函数"""
+    if db.dialect == SQLITE:
+        foreign_keys = db.fetchall("PRAGMA foreign_keys")[0][0]
+        synchronous = db.fetchall("PRAGMA synchronous")[0][0]
+        db.execute_raw("PRAGMA foreign_keys = OFF").close()
+        db.execute_raw("PRAGMA synchronous = OFF").close()
+
+        def restore():
+            db.execute_raw(f"PRAGMA foreign_keys = {int(foreign_keys)}").close()
+            db.execute_raw(f"PRAGMA synchronous = {int(synchronous)}").close()
+
+        return restore
+
+    foreign_key_checks = db.fetchall("SELECT @@SESSION.foreign_key_checks")[0][0]
+    db.execute_raw("SET SESSION foreign_key_checks = 0").close()
+
+    def restore():
+        db.execute_raw(f"SET SESSION foreign_key_checks = {int(foreign_key_checks)}").close()
+
+    return restore
+
+
+def reset_table(db, table):
+    if db.dialect == SQLITE:
+        db.execute_raw(f"DELETE FROM `{table}`").close()
+    else:
+        db.execute_raw(f"TRUNCATE TABLE `{table}`").close()
+    db.commit()
+
+
+class Worker(threading.Thread):
+    """一个数据库连接；按顺序执行分配给它的那些表的批次"""
+
+    def __init__(self, url):
+        super().__init__(daemon=True)
+        self.url = url
+        self.queue = queue.Queue(maxsize=QUEUE_DEPTH)
+        self.stats = {}
+        self.error = None
+
+    def run(self):
+        db = restore = None
+        try:
+            db = Database(self.url)
+            restore = fast_load_session(db)
+        except Exception as exc:
+            self.error = exc
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    break
+                if self.error is None:
+                    self.load(db, *item)
+            except Exception as exc:
+                self.error = exc
+                # 连接断开时 rollback 也会失败；线程必须继续取完队列，否则主线程 put 时永远阻塞
+                try:
+                    db.rollback()
+                except Exception:
+                    pass
+            finally:
+                self.queue.task_done()
+        if db is not None:
+            try:
+                if restore is not None:
+                    restore()
+            finally:
+                db.close()
+
+    def load(self, db, table, sql, params, rows, reset):
+        stats = self.stats.setdefault(table, TableStats(table))
+        started = time.perf_counter()
+        if reset:
+            reset_table(db, table)
+        db.execute_raw(sql, params).close()
+        db.commit()
+        stats.busy += time.perf_counter() - started
+        stats.rows += rows
+        stats.batches += 1
+
+
+class Pending:
+    __slots__ = ("tuples", "params", "size")
+
+    def __init__(self):
+        self.tuples = []
+        self.params = []
+        self.size = 0
+
+
+class SeedLoader:
+    """
+    loader = SeedLoader(url, reset=True)
+    loader.load(f)           # 可多次调用，按顺序导入多个文件
+    stats = loader.finish()  # 等待全部写完，返回 {表名: TableStats}
+    """
+
+    def __init__(self, url=None, workers=WORKERS, batch_rows=BATCH_ROWS, batch_bytes=BATCH_BYTES, reset=False):
+        self.db = Database(url)
+        self.url = url
+        # SQLite 同一时间只能有一个写连接，并行没有意义
+        if self.db.dialect == SQLITE:
+            workers = 1
+        self.workers = [Worker(url) for _ in range(workers)]
+        for worker in self.workers:
+            worker.start()
+        self.batch_rows = batch_rows
+        self.batch_bytes = batch_bytes
+        self.reset = reset
+        self.assigned = {}
+        self.pending = {}
+        self.barriers = 0
+        self.skipped = 0
+
+    def load(self, f):
+        for text in StatementReader(f):
+            self.feed(text)
+
+    def feed(self, text):
+        _, body = split_leading(text)
+        body = body.strip()
+        if not body or body == ";" or _SET_RE.match(body):
+            self.skipped += 1
+            return
+        if self.db.dialect == SQLITE:
+            parsed = self.split_sqlite(text)
+        else:
+            parsed = split_insert(text)
+            if parsed is not None:
+                parsed = (*parsed, None)
+        if parsed is None:
+            self.barrier(text)
+            return
+        head, table, columns, tuples, params = parsed
+        # 同一张表、同样的动词（INSERT / INSERT IGNORE / REPLACE）和列顺序才能拼进同一批
+        key = (" ".join(head.upper().split()), table, tuple(columns))
+        pending = self.pending.get(key)
+        if pending is None:
+            pending = self.pending[key] = Pending()
+        max_rows = self.batch_rows
+        if params is not None:
+            max_rows = min(max_rows, SQLITE_MAX_VARIABLES // max(len(columns), 1))
+        for i, row in enumerate(tuples):
+            pending.tuples.append(row)
+            pending.size += len(row) + 1
+            if params is not None:
+                pending.params.extend(params[i])
+            if len(pending.tuples) >= max_rows or pending.size >= self.batch_bytes:
+                self.flush(key)
+                pending = self.pending[key] = Pending()
+
+    def split_sqlite(self, text):
+        """SQLite 不认 MySQL 的反斜杠转义：字符串解码后作为参数绑定，NOW() 换成 CURRENT_TIMESTAMP"""
+        stmt = InsertStatement.parse(text)
+        if stmt is None or stmt.trailer.strip(" \t\r\n;"):
+            return None
+        tuples = []
+        params = []
+        for row in stmt.rows:
+            values = []
+            row_params = []
+            for raw, _ in row:
+                if raw[:1] in ("'", '"'):
+                    values.append("?")
+                    row_params.append(unescape(raw[1:-1]))
+                elif raw.upper().startswith(("NOW(", "CURRENT_TIMESTAMP")):
+                    values.append("CURRENT_TIMESTAMP")
+                else:
+                    values.append(raw)
+            tuples.append("(" + ", ".join(values) + ")")
+            params.append(row_params)
+        return stmt.head, stmt.table, stmt.columns, tuples, params
+
+    def flush(self, key):
+        pending = self.pending.pop(key, None)
+        if pending is None or not pending.tuples:
+            return
+        verb, table, columns = key
+        if self.db.dialect == SQLITE and verb.startswith("INSERT IGNORE"):
+            verb = "INSERT OR IGNORE INTO"
+        column_list = ", ".join(f"`{c}`" for c in columns)
+        sql = f"{verb} `{table}` ({column_list}) VALUES {','.join(pending.tuples)}"
+        reset = False
+        worker = self.assigned.get(table)
+        if worker is None:
+            worker = self.assigned[table] = self.workers[len(self.assigned) % len(self.workers)]
+            reset = self.reset
+        self.put(worker, (table, sql, pending.params or None, len(pending.tuples), reset))
+
+    def put(self, worker, item):
+        while True:
+            self.check()
+            try:
+                worker.queue.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def check(self):
+        for worker in self.workers:
+            if worker.error is not None:
+                raise worker.error
+
+    def drain(self):
+        for key in list(self.pending):
+            self.flush(key)
+        for worker in self.workers:
+            worker.queue.join()
+        self.check()
+
+    def barrier(self, text):
+        self.drain()
+        self.barriers += 1
+        try:
+            self.db.execute_raw(text).close()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def finish(self):
+        """写完剩余批次并关闭所有连接；返回 {表名: TableStats}"""
+        try:
+            self.drain()
+        finally:
+            for worker in self.workers:
+                worker.queue.put(None)
+            for worker in self.workers:
+                worker.join()
+            self.db.close()
+        self.check()
+        stats = {}
+        for worker in self.workers:
+            stats.update(worker.stats)
+        return stats
@@ -0,0 +1,499 @@
+"""
+流式读写 SQL 种子文件
+
+StatementReader 按块读取文件，逐条切出 SQL 语句（正确跳过字符串和注释里的分号），
+内存占用只与单条语句大小有关。InsertStatement 解析 INSERT ... VALUES (...), (...)
+的元组；未修改的值原样输出，改过的值重新转义，未改动的语句按原文写回。
+
+SeedTransformer 对 INSERT 中的文本列应用两类修改：
+    行补丁   按 id 或 slug 指定某行某列的新值，或 {lang: 文本} 合并进多语言 JSON
+    术语替换 对文本列（多语言 JSON 则对每种语言的文本）做整词表替换
+"""
+import gzip
+import json
+import re
+
+from .product_sync import parse_multilingual
+
+CHUNK_SIZE = 1 << 20
+
+# 语句外：找下一个需要关心的位置
+_NORMAL_RE = re.compile(r"[;'\"`#]|--(?=[ \t\r\n])|--$|/\*")
+# 字符串内：一次吃掉到结束引号为止的全部内容（含转义）
+_STRING_RE = {q: re.compile(rf"[^{q}\\]*(?:\\.[^{q}\\]*)*", re.S) for q in "'\"`"}
+
+_INSERT_RE = re.compile(
+    r"(?P<head>(?:INSERT|REPLACE)(?:\s+(?:IGNORE|LOW_PRIORITY|DELAYED|HIGH_PRIORITY))*\s+INTO\s+)"
+    r"`?(?P<table>\w+)`?\s*\((?P<columns>[^)]*)\)\s*VALUES\s*",
+    re.I,
+)
+_VALUE_RE = re.compile(
+    r"\s*(?:'(?P<str>[^'\\]*(?:(?:\\.|'')[^'\\]*)*)'"
+    r'|"(?P<dstr>[^"\\]*(?:(?:\\.|"")[^"\\]*)*)"'
+    r"|(?P<null>NULL)\b"
+    r"|(?P<num>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)"
+    r"|(?P<call>[A-Za-z_]\w*\s*\([^()']*\))"
+    r"|(?P<word>[A-Za-z_]\w*))\s*",
+    re.S,
+)
+_SEP_RE = re.compile(r"\s*([(),])\s*")
+_TABLE_RE = re.compile(r"^\s*(?:INSERT|REPLACE)\b[^(]*?\bINTO\s+`?(\w+)", re.I | re.M)
+
+_UNESCAPE = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+_UNESCAPE_RE = re.compile(r"\\(.)|''|\"\"", re.S)
+_ESCAPE_RE = re.compile(r"[\\'\"\n\r\0\x1a]")
+_ESCAPE = {"\\": "\\\\", "'": "\\'", '"': '\\"', "\n": "\\n", "\r": "\\r", "\0": "\\0", "\x1a": "\\Z"}
+
+
+def unescape(raw):
+    return _UNESCAPE_RE.sub(lambda m: m.group(0)[0] if m.group(1) is None else _UNESCAPE.get(m.group(1), m.group(1)), raw)
+
+
+def quote(text):
+    return "'" + _ESCAPE_RE.sub(lambda m: _ESCAPE[m.group(0)], text) + "'"
+
+
+class StatementReader:
+    """
+    逐条产出语句文本（含结尾分号和它前面的空白、注释）；文件末尾不以分号结束的部分原样产出
+    """
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+
+    def __iter__(self):
+        buf = ""
+        start = pos = 0
+        quote_char = None
+        eof = False
+        while True:
+            if not eof:
+                chunk = self.f.read(self.chunk_size)
+                if chunk:
+                    self.bytes_read += len(chunk)
+                    # 只在读入新块时丢掉已产出的部分，避免每条语句都复制整个缓冲区
+                    buf = buf[start:] + chunk
+                    pos -= start
+                    start = 0
+                else:
+                    eof = True
+            need_more = False
+            while not need_more:
+                if quote_char is not None:
+                    end = _STRING_RE[quote_char].match(buf, pos).end()
+                    # 停在块末尾、末尾的反斜杠或可能是 '' 转义的引号上时，等下一块
+                    if not eof and end >= len(buf) - 1:
+                        pos = end
+                        need_more = True
+                        continue
+                    if end >= len(buf) or buf[end] != quote_char:
+                        # 文件在字符串中间结束
+                        pos = len(buf)
+                        need_more = True
+                        continue
+                    pos = end + 1
+                    if buf.startswith(quote_char, pos):
+                        pos += 1
+                    else:
+                        quote_char = None
+                    continue
+                m = _NORMAL_RE.search(buf, pos)
+                if m is None:
+                    # 末尾可能是半个 -- 或 /*，留一个字符下次重扫
+                    pos = max(pos, len(buf) - 1)
+                    need_more = True
+                    continue
+                token = m.group(0)
+                if token == ";":
+                    yield buf[start:m.end()]
+                    start = pos = m.end()
+                elif token in ("'", '"', "`"):
+                    quote_char = token
+                    pos = m.end()
+                elif token == "/*":
+                    end = buf.find("*/", m.end())
+                    if end < 0:
+                        pos = m.start()
+                        need_more = True
+                    else:
+                        pos = end + 2
+                elif token == "--" and not eof:
+                    # 块末尾的 --，要看下一个字符才知道是不是注释
+                    pos = m.start()
+                    need_more = True
+                else:
+                    end = buf.find("\n", m.end())
+                    if end < 0:
+                        pos = m.start()
+                        need_more = True
+                    else:
+                        pos = end + 1
+            if eof:
+                if start < len(buf):
+                    yield buf[start:]
+                return
+
+
+def split_leading(text):
+    """拆出语句前的空白和注释，返回 (leading, body)；只有注释时 body 为空串"""
+    body = text.lstrip()
+    while body.startswith(("--", "#", "/*")):
+        end = body.find("*/") + 2 if body.startswith("/*") else body.find("\n") + 1
+        if end <= 0:
+            return text, ""
+        body = body[end:].lstrip()
+    return text[: len(text) - len(body)], body
+
+
+def scan_rows(body, pos):
+    """
+    从 VALUES 之后逐个值扫描元组（_VALUE_RE / _SEP_RE，线性时间，不回溯）
+    返回 ([(元组原文, [值原文])], 结束位置)；不是合法的元组列表时返回 None
+    """
+    rows = []
+    while True:
+        sep = _SEP_RE.match(body, pos)
+        if sep is None or sep.group(1) != "(":
+            return None
+        start = sep.start(1)
+        pos = sep.end()
+        values = []
+        while True:
+            v = _VALUE_RE.match(body, pos)
+            if v is None:
+                return None
+            values.append(v.group(0).strip())
+            pos = v.end()
+            sep = _SEP_RE.match(body, pos)
+            if sep is None:
+                return None
+            pos = sep.end()
+            if sep.group(1) == ")":
+                break
+            if sep.group(1) != ",":
+                return None
+        rows.append((body[start:sep.start(1) + 1], values))
+        sep = _SEP_RE.match(body, pos)
+        if sep is None or sep.group(1) != ",":
+            return rows, pos
+        pos = sep.end()
+
+
+def split_insert(text):
+    """
+    快速拆分 INSERT：返回 (head, table, columns, [元组原文])，不解码值
+    不是 INSERT ... VALUES 或带 ON DUPLICATE KEY UPDATE 之类尾部时返回 None
+    """
+    _, body = split_leading(text)
+    m = _INSERT_RE.match(body)
+    if m is None:
+        return None
+    scanned = scan_rows(body, m.end())
+    if scanned is None or body[scanned[1]:].strip(" \t\r\n;"):
+        return None
+    columns = [c.strip().strip("`") for c in m.group("columns").split(",")]
+    return m.group("head"), m.group("table"), columns, [row for row, _ in scanned[0]]
+
+
+class InsertStatement:
+    """
+    一条 INSERT 语句：leading（前导空白/注释）+ head + 列名 + 元组 + trailer
+    rows 中每个值为 [原文, 新文本]：解析时只保留原文，get() 时才解码；set() 把原文置为 None
+    """
+
+    def __init__(self, leading, head, table, columns, rows, trailer):
+        self.leading = leading
+        self.head = head
+        self.table = table
+        self.columns = columns
+        self.rows = rows
+        self.trailer = trailer
+        self.index = {name: i for i, name in enumerate(columns)}
+
+    @classmethod
+    def parse(cls, text):
+        """不是 INSERT ... VALUES 或无法完整解析时返回 None（调用方原样输出）"""
+        leading, body = split_leading(text)
+        m = _INSERT_RE.match(body)
+        if m is None:
+            return None
+        scanned = scan_rows(body, m.end())
+        if scanned is None:
+            return None
+        columns = [c.strip().strip("`") for c in m.group("columns").split(",")]
+        rows = []
+        for _, values in scanned[0]:
+            if len(values) != len(columns):
+                return None
+            rows.append([[value, None] for value in values])
+        return cls(leading, m.group("head"), m.group("table"), columns, rows, body[scanned[1]:])
+
+    def get(self, row, column):
+        """字符串列返回解码后的文本，NULL / 数字 / 函数调用返回 None"""
+        i = self.index.get(column)
+        if i is None:
+            return None
+        raw, text = row[i]
+        if raw is None:
+            return text
+        if raw[:1] in ("'", '"'):
+            return unescape(raw[1:-1])
+        return None
+
+    def set(self, row, column, text):
+        i = self.index[column]
+        row[i] = [None, text]
+
+    def render(self):
+        tuples = []
+        for row in self.rows:
+            tuples.append("(" + ", ".join(raw if raw is not None else quote(text) for raw, text in row) + ")")
+        columns = ", ".join(self.columns)
+        return f"{self.leading}{self.head}{self.table} ({columns}) VALUES {', '.join(tuples)}{self.trailer}"
+
+
+# 拉丁字母/数字：以这类字符开头或结尾的词条只按整词匹配（temple 不改 contemplate）
+_WORD_CLASS = "0-9A-Za-z\u00c0-\u024f"
+
+
+def _is_word_char(ch):
+    return ch.isascii() and ch.isalnum() or "\u00c0" <= ch <= "\u024f"
+
+
+def compile_terms(terms, word_boundaries=True):
+    """
+    把词表按前缀树编译成一个正则：同前缀的词共享分支（开光(?:仪式|法物)?），
+    每个位置最多沿树走一遍，不必逐个尝试全部词条；更长的延续排在前面，保证最长匹配优先
+    """
+    root = {}
+    for term in terms:
+        node = root
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = term
+    if not root:
+        return None
+    left = f"(?<![{_WORD_CLASS}])"
+    right = f"(?![{_WORD_CLASS}])"
+
+    def build(node):
+        alternatives = [re.escape(ch) + build(child) for ch, child in node.items() if ch]
+        term = node.get("")
+        if term is not None:
+            alternatives.append(right if word_boundaries and _is_word_char(term[-1]) else "")
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return "(?:" + "|".join(alternatives) + ")"
+
+    branches = []
+    for ch, child in root.items():
+        branch = re.escape(ch) + build(child)
+        branches.append(left + branch if word_boundaries and _is_word_char(ch) else branch)
+    return re.compile("|".join(branches))
+
+
+class TermRewriter:
+    """按词表替换文本，长词优先；词表编译成一个前缀树正则，一次扫描完成全部替换"""
+
+    def __init__(self, terms):
+        self.terms = dict(terms)
+        self.pattern = compile_terms(self.terms)
+        # 预筛不带整词边界：SQL 原文里 \nTemple 的 n 会挡住边界判断
+        self.prefilter = compile_terms(self.terms, word_boundaries=False)
+        # 词条不含需要转义的字符时，可以直接在 SQL 原文上判断有没有命中，省去解码
+        self.raw_searchable = not any(_ESCAPE_RE.search(t) for t in self.terms)
+
+    def may_match(self, raw):
+        """raw 为 SQL 字符串字面量原文；返回 False 时解码后也一定没有命中"""
+        if self.pattern is None:
+            return False
+        if not self.raw_searchable or raw[1:2] == "{":
+            return True
+        return self.prefilter.search(raw) is not None
+
+    def rewrite(self, text, lang=None, found=None):
+        """
+        返回 (新文本, 替换次数)；lang 供按语言选词表的子类使用
+        found 不为 None 时把命中的原词依次追加进去
+        """
+        if self.pattern is None or not text:
+            return text, 0
+        count = 0
+
+        def replace(m):
+            nonlocal count
+            count += 1
+            term = m.group(0)
+            if found is not None:
+                found.append(term)
+            return self.terms[term]
+
+        return self.pattern.sub(replace, text), count
+
+
+# 默认做术语替换的文本列
+TEXT_COLUMNS = {
+    "products": (
+        "name", "description", "shortDescription", "blessingDescription",
+        "suitableFor", "efficacy", "wearingGuide", "metaTitle", "metaDescription",
+    ),
+    "categories": ("name", "description"),
+    "product_images": ("altText",),
+    "reviews": ("title", "comment"),
+}
+# 行里有这一列时（reviews），纯文本列按它的语言选词表
+LANGUAGE_COLUMN = "language"
+
+
+class SeedStats:
+    def __init__(self):
+        self.statements = 0
+        self.inserts = 0
+        self.rows = 0
+        self.patched = 0
+        self.rewrites = 0
+        self.changed_statements = 0
+
+
+class SeedTransformer:
+    """
+    patches: {table: {id 或 slug: {列: 新文本 或 {lang: 文本}}}}
+    rewriter: TermRewriter（或同接口的对象）或 None
+    hits: 不为 None 时记录术语命中，需有 add(lang, key, 词列表)；key 为 表#id.列
+    """
+
+    def __init__(self, patches=None, rewriter=None, text_columns=TEXT_COLUMNS, hits=None):
+        self.patches = patches or {}
+        self.rewriter = rewriter
+        self.text_columns = text_columns
+        self.hits = hits
+        self.stats = SeedStats()
+
+    def wants(self, table):
+        return table in self.patches or (self.rewriter is not None and table in self.text_columns)
+
+    def transform(self, text):
+        self.stats.statements += 1
+        # 只看语句开头判断表名，与修改无关的表不解析元组
+        m = _TABLE_RE.search(text, 0, 4096)
+        if m is None:
+            return text
+        self.stats.inserts += 1
+        if not self.wants(m.group(1)):
+            return text
+        stmt = InsertStatement.parse(text)
+        if stmt is None:
+            return text
+        self.stats.rows += len(stmt.rows)
+        changed = False
+        for row in stmt.rows:
+            changed |= self.patch_row(stmt, row)
+            changed |= self.rewrite_row(stmt, row)
+        if not changed:
+            return text
+        self.stats.changed_statements += 1
+        return stmt.render()
+
+    def patch_row(self, stmt, row):
+        table_patches = self.patches.get(stmt.table)
+        if not table_patches:
+            return False
+        patch = None
+        for key_column in ("id", "slug"):
+            i = stmt.index.get(key_column)
+            if i is None:
+                continue
+            key = stmt.get(row, key_column)
+            patch = table_patches.get(row[i][0] if key is None else key)
+            if patch:
+                break
+        if not patch:
+            return False
+        changed = False
+        for column, value in patch.items():
+            if column not in stmt.index:
+                continue
+            current = stmt.get(row, column)
+            if isinstance(value, dict):
+                merged = parse_multilingual(current)
+                merged.update(value)
+                new = json.dumps(merged, ensure_ascii=False)
+            else:
+                new = value
+            if new != current:
+                stmt.set(row, column, new)
+                self.stats.patched += 1
+                changed = True
+        return changed
+
+    def rewrite_row(self, stmt, row):
+        if self.rewriter is None:
+            return False
+        changed = False
+        lang = stmt.get(row, LANGUAGE_COLUMN) if LANGUAGE_COLUMN in stmt.index else None
+        for column in self.text_columns.get(stmt.table, ()):
+            i = stmt.index.get(column)
+            if i is None or (row[i][0] is not None and not self.rewriter.may_match(row[i][0])):
+                continue
+            current = stmt.get(row, column)
+            if not current:
+                continue
+            hits = {} if self.hits is not None else None
+            new, total = rewrite_column(self.rewriter, current, hits, lang)
+            if hits:
+                key = f"{stmt.table}#{self.row_key(stmt, row)}.{column}"
+                for lang, terms in hits.items():
+                    self.hits.add(lang, key, terms)
+            if total:
+                stmt.set(row, column, new)
+                self.stats.rewrites += total
+                changed = True
+        return changed
+
+    def row_key(self, stmt, row):
+        for key_column in ("id", "slug"):
+            i = stmt.index.get(key_column)
+            if i is not None:
+                key = stmt.get(row, key_column)
+                return row[i][0] if key is None else key
+        return "?"
+
+
+def rewrite_column(rewriter, value, hits=None, lang=None):
+    """
+    对一列文本做术语替换，返回 (新值, 替换次数)；多语言 JSON 逐语言替换，结构不动
+    纯文本按 lang 替换（行里的语言列，如 reviews.language）；lang 为 None 时不区分语言
+    hits 不为 None 时按语言记下命中的原词：{lang: [词]}，没有 lang 的纯文本按是否含中文归到 zh / en
+    """
+    values = parse_multilingual(value) if value.lstrip().startswith("{") else None
+    if values and values.get("zh", values.get("en")) != value:
+        total = 0
+        for lang, text in values.items():
+            found = [] if hits is not None else None
+            values[lang], count = rewriter.rewrite(text, lang, found)
+            total += count
+            if found:
+                hits[lang] = found
+        return (json.dumps(values, ensure_ascii=False) if total else value), total
+    found = [] if hits is not None else None
+    new, total = rewriter.rewrite(value, lang, found)
+    if found:
+        hits[lang or next(iter(parse_multilingual(value)))] = found
+    return new, total
+
+
+def open_seed(path, mode, compressed=None):
+    """按文本方式打开 .sql / .sql.gz；compressed 为 None 时按扩展名判断"""
+    if path.endswith(".gz") if compressed is None else compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="")
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def transform_stream(src, dst, transformer, chunk_size=CHUNK_SIZE):
+    """src/dst 为文本文件对象；返回读取的字符数"""
+    reader = StatementReader(src, chunk_size)
+    for statement in reader:
+        dst.write(transformer.transform(statement))
+    return reader.bytes_read
@@ -0,0 +1,312 @@
+"""
+翻译运行的结构化记录
+
+每个事件一行 JSON（JSON Lines），追加写入 --telemetry 指定的文件：
+
+    {"ts": 1760000000.123, "event": "request", "lang": "de", "keys": 48, "attempts": 2, "retries": 1, ...}
+
+事件类型：
+    run_start  模型、并发数、待翻译语言
+    request    一次 engine.complete 调用（含内部重试）：排队/接口耗时、token、重试次数、结果
+    batch      一个批次的解析结果：译文数、缺失数、是否被截断、第几轮补翻
+    language   一个语言的汇总：翻译记忆命中、检查点恢复、请求翻译、失败的 key 数和耗时
+    run_end    总耗时与合计
+
+fan-out 请求（一个请求翻译多个语言）按 shares 权重把 token 和费用拆给各语言，
+请求数、重试和延迟每个语言各记一次（每个语言都等了这个请求）；合计行按请求只算一次。
+
+运行结束时 summary() 按语言给出请求数、p50/p95 接口延迟、token 和费用；
+write_prometheus() 生成 node_exporter textfile collector 可读的指标文件。
+"""
+import json
+import math
+import os
+import time
+
+# 每百万 token 的美元价格 (输入, 输出)；不在表里的模型可用 --price-input / --price-output 指定
+PRICES_PER_MILLION = {
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+}
+
+METRIC_PREFIX = "i18n_translate"
+
+
+def split_total(total, weights):
+    """把整数 total 按 weights 拆开（最大余数法），各份之和等于 total"""
+    weight_sum = sum(weights.values())
+    if not weight_sum:
+        weights = {key: 1 for key in weights}
+        weight_sum = len(weights)
+    exact = {key: total * weight / weight_sum for key, weight in weights.items()}
+    parts = {key: int(value) for key, value in exact.items()}
+    remainder = total - sum(parts.values())
+    for key in sorted(exact, key=lambda key: parts[key] - exact[key])[:remainder]:
+        parts[key] += 1
+    return parts
+
+
+def percentile(values, q):
+    """最近秩百分位，values 为空时返回 None"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[rank - 1]
+
+
+class LangStats:
+    def __init__(self, lang):
+        self.lang = lang
+        self.requests = 0
+        self.failed_requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.latencies = []
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.keys = 0
+        self.cache_hits = 0
+        self.restored = 0
+        self.translated = 0
+        self.api_keys = 0
+        self.failed_keys = 0
+        self.seconds = 0.0
+
+    def cost(self, prices):
+        if prices is None:
+            return None
+        price_in, price_out = prices
+        return (self.input_tokens * price_in + self.output_tokens * price_out) / 1e6
+
+    def add_request(self, status, attempts, rate_limited, latency, input_tokens, output_tokens):
+        self.requests += 1
+        self.attempts += attempts
+        self.retries += attempts - 1
+        self.rate_limited += rate_limited
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        if status == "ok":
+            self.latencies.append(latency)
+        else:
+            self.failed_requests += 1
+
+
+class Telemetry:
+    """
+    telemetry = Telemetry("run.jsonl", model="gpt-4.1-mini")
+    telemetry.emit("batch", lang="de", keys=40)
+    telemetry.request(lang="de", latency=1.2, input_tokens=900, ...)
+    print("\\n".join(telemetry.summary()))
+    telemetry.close()
+
+    path 为 None 时只在内存里汇总，不写文件。
+    """
+
+    def __init__(self, path=None, model=None, prices=None):
+        self.path = path
+        self.model = model
+        self.prices = prices if prices is not None else PRICES_PER_MILLION.get(model)
+        self.langs = {}
+        # 按请求计一次的合计（fan-out 请求在各语言里各记一次，合计里不重复）
+        self.requests = LangStats("total")
+        self.started = time.time()
+        self._clock = time.perf_counter()
+        self.seconds = None
+        self._file = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def stats(self, lang):
+        stats = self.langs.get(lang)
+        if stats is None:
+            stats = self.langs[lang] = LangStats(lang)
+        return stats
+
+    def emit(self, event, **fields):
+        if self._file is None:
+            return
+        record = {"ts": round(time.time(), 3), "event": event, **fields}
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def request(self, lang=None, status="ok", attempts=1, rate_limited=0, latency=None,
+                 input_tokens=0, output_tokens=0, shares=None, **fields):
+        """
+        记录一次 engine.complete 调用；lang 为 None 时（未打标签的调用）只写事件不计入语言汇总。
+        shares 为 {语言: 权重} 时（fan-out 请求）token 按权重拆给这些语言
+        """
+        self.requests.add_request(status, attempts, rate_limited, latency, input_tokens, output_tokens)
+        split = None
+        if shares:
+            inputs = split_total(input_tokens, shares)
+            outputs = split_total(output_tokens, shares)
+            split = {target: [inputs[target], outputs[target]] for target in shares}
+            for target in shares:
+                self.stats(target).add_request(status, attempts, rate_limited, latency, inputs[target], outputs[target])
+        elif lang is not None:
+            self.stats(lang).add_request(status, attempts, rate_limited, latency, input_tokens, output_tokens)
+        if split is not None:
+            fields["split_tokens"] = split
+        self.emit(
+            "request",
+            lang=lang,
+            status=status,
+            attempts=attempts,
+            retries=attempts - 1,
+            rate_limited=rate_limited,
+            latency=None if latency is None else round(latency, 4),
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            **fields,
+        )
+
+    def language(self, lang, keys, cache_hits, restored, translated, seconds, error=None):
+        stats = self.stats(lang)
+        stats.keys = keys
+        stats.cache_hits = cache_hits
+        stats.restored = restored
+        stats.translated = translated
+        # 失败的语言什么都没写回（translated 为 0），记忆和检查点命中的 key 不算 API 翻译的
+        stats.api_keys = max(translated - cache_hits - restored, 0)
+        stats.failed_keys = keys - translated
+        stats.seconds = seconds
+        self.emit(
+            "language",
+            lang=lang,
+            keys=keys,
+            cache_hits=cache_hits,
+            restored=restored,
+            requested=keys - cache_hits - restored,
+            translated=translated,
+            failed=keys - translated,
+            seconds=round(seconds, 3),
+            error=error,
+        )
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self._clock
+        total = self.total()
+        self.emit(
+            "run_end",
+            seconds=round(self.seconds, 3),
+            requests=total.requests,
+            retries=total.retries,
+            input_tokens=total.input_tokens,
+            output_tokens=total.output_tokens,
+            cost_usd=None if total.cost(self.prices) is None else round(total.cost(self.prices), 6),
+        )
+
+    def total(self):
+        total = LangStats("total")
+        for name in ("requests", "failed_requests", "attempts", "retries", "rate_limited",
+                     "input_tokens", "output_tokens"):
+            setattr(total, name, getattr(self.requests, name))
+        total.latencies.extend(self.requests.latencies)
+        for stats in self.langs.values():
+            for name in ("keys", "cache_hits", "restored", "translated", "api_keys", "failed_keys"):
+                setattr(total, name, getattr(total, name) + getattr(stats, name))
+            total.seconds = max(total.seconds, stats.seconds)
+        return total
+
+    def summary(self):
+        """按语言的汇总表（按耗时从长到短），最后一行为合计"""
+        def fmt_seconds(value):
+            return "-" if value is None else f"{value:.2f}s"
+
+        def fmt_cost(value):
+            return "-" if value is None else f"${value:.4f}"
+
+        lines = [
+            f"  {'lang':<8} {'keys':>6} {'cached':>6} {'reqs':>5} {'retry':>5} {'fail':>5} "
+            f"{'p50':>7} {'p95':>7} {'in tok':>8} {'out tok':>8} {'cost':>9} {'wall':>7}"
+        ]
+        rows = sorted(self.langs.values(), key=lambda s: s.seconds, reverse=True)
+        total = self.total()
+        if self.seconds is not None:
+            total.seconds = self.seconds
+        for stats in rows + [total]:
+            lines.append(
+                f"  {stats.lang:<8} {stats.keys:>6} {stats.cache_hits + stats.restored:>6} {stats.requests:>5} "
+                f"{stats.retries:>5} {stats.failed_keys:>5} "
+                f"{fmt_seconds(percentile(stats.latencies, 0.5)):>7} {fmt_seconds(percentile(stats.latencies, 0.95)):>7} "
+                f"{stats.input_tokens:>8} {stats.output_tokens:>8} {fmt_cost(stats.cost(self.prices)):>9} "
+                f"{stats.seconds:>6.1f}s"
+            )
+        return lines
+
+    def write_prometheus(self, path):
+        """写 Prometheus textfile；先写临时文件再替换，collector 不会读到半个文件"""
+        name = METRIC_PREFIX
+        lines = []
+
+        def metric(metric_name, kind, help_text, samples):
+            lines.append(f"# HELP {name}_{metric_name} {help_text}")
+            lines.append(f"# TYPE {name}_{metric_name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{val}"' for key, val in labels.items())
+                lines.append(f"{name}_{metric_name}{{{label_text}}} {value}" if label_text else f"{name}_{metric_name} {value}")
+
+        langs = sorted(self.langs.values(), key=lambda s: s.lang)
+        metric("requests_total", "counter", "Chat completion calls per language and status", [
+            sample for s in langs for sample in (
+                ({"lang": s.lang, "status": "ok"}, s.requests - s.failed_requests),
+                ({"lang": s.lang, "status": "failed"}, s.failed_requests),
+            )
+        ])
+        metric("retries_total", "counter", "Retried API attempts (rate limits, timeouts, 5xx)",
+               [({"lang": s.lang}, s.retries) for s in langs])
+        metric("rate_limited_total", "counter", "Attempts rejected with HTTP 429",
+               [({"lang": s.lang}, s.rate_limited) for s in langs])
+        metric("tokens_total", "counter", "Tokens reported by the API", [
+            sample for s in langs for sample in (
+                ({"lang": s.lang, "direction": "input"}, s.input_tokens),
+                ({"lang": s.lang, "direction": "output"}, s.output_tokens),
+            )
+        ])
+        metric("keys_total", "counter", "Keys handled per language by source", [
+            sample for s in langs for sample in (
+                ({"lang": s.lang, "source": "cache"}, s.cache_hits),
+                ({"lang": s.lang, "source": "checkpoint"}, s.restored),
+                ({"lang": s.lang, "source": "api"}, s.api_keys),
+                ({"lang": s.lang, "source": "failed"}, s.failed_keys),
+            )
+        ])
+        latency = []
+        for s in langs:
+            for q in (0.5, 0.95):
+                value = percentile(s.latencies, q)
+                if value is not None:
+                    latency.append(({"lang": s.lang, "quantile": str(q)}, round(value, 4)))
+        metric("request_latency_seconds", "gauge", "API latency of successful requests", latency)
+        if self.prices is not None:
+            metric("cost_usd", "gauge", "Estimated cost of this run",
+                   [({"lang": s.lang}, round(s.cost(self.prices), 6)) for s in langs])
+        metric("language_seconds", "gauge", "Wall time per language",
+               [({"lang": s.lang}, round(s.seconds, 3)) for s in langs])
+        if self.seconds is not None:
+            metric("run_seconds", "gauge", "Wall time of the whole run", [({}, round(self.seconds, 3))])
+        metric("last_run_timestamp_seconds", "gauge", "Start time of the last run", [({}, round(self.started, 3))])
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, path)
@@ -0,0 +1,126 @@
+"""
+翻译术语表（scripts/translation-glossary.json）：按批次注入 prompt，返回后按同一套匹配器校验
+
+词表是词条列表，每个词条为 {语言: [写法, ...]}：en 列出原文里可能出现的写法（单复数、同义叫法），
+目标语言的第一个写法写进 prompt，其余写法（复数、变格）在校验时同样算数。
+
+原文写法编译成一个前缀树正则（sql_seed.compile_terms，忽略大小写、整词、最长匹配优先），
+每段原文扫描一遍就知道用到了哪些词条；只有批次里出现的词条才写进 prompt。
+每个目标语言的写法也编译成一个正则（不要求整词，容忍词尾变化），译文扫描一遍，
+原文用到但译文里找不到的词条即为违规，由调用方只重新请求这些 key。
+"""
+import json
+import os
+
+from .batching import compact_json
+from .sql_seed import compile_terms
+
+GLOSSARY_PATH = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "../translation-glossary.json")
+)
+
+SOURCE_LANG = "en"
+
+
+class TermMatcher:
+    """{写法: 词条序号} 编译成的匹配器；find() 返回文本里出现的 {词条序号: 写法}"""
+
+    def __init__(self, forms, word_boundaries):
+        # 同一写法可能属于多个词条（Cultural Heritage Site 和 Heritage Site 在德语里都是 Kulturerbestätte）
+        self.forms = {}
+        for form, index in forms:
+            self.forms.setdefault(form.lower(), {}).setdefault(index, form)
+        self.pattern = compile_terms(self.forms, word_boundaries)
+
+    def find(self, text):
+        found = {}
+        if self.pattern is None or not text:
+            return found
+        for match in self.pattern.finditer(text.lower()):
+            for index, form in self.forms[match.group()].items():
+                found.setdefault(index, form)
+        return found
+
+
+class Terminology:
+    """原文匹配器一个，目标语言匹配器按需编译并缓存"""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.source = TermMatcher(
+            ((form, index) for index, entry in enumerate(entries) for form in entry.get(SOURCE_LANG, ())),
+            word_boundaries=True,
+        )
+        self._targets = {}
+
+    @classmethod
+    def load(cls, path=GLOSSARY_PATH):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def target(self, lang):
+        matcher = self._targets.get(lang)
+        if matcher is None:
+            matcher = self._targets[lang] = TermMatcher(
+                ((form, index) for index, entry in enumerate(self.entries) for form in entry.get(lang, ())),
+                word_boundaries=False,
+            )
+        return matcher
+
+    def required(self, texts, langs):
+        """{key: {词条序号: 原文写法}}，只保留 langs 里至少一个语言有译法的词条；没用到词条的 key 不出现"""
+        required = {}
+        for key, text in texts.items():
+            found = {
+                index: form
+                for index, form in self.source.find(text).items()
+                if any(self.entries[index].get(lang) for lang in langs)
+            }
+            if found:
+                required[key] = found
+        return required
+
+    def prompt_terms(self, required, langs):
+        """{原文写法: {语言: 译法}}：批次里实际出现的写法，每个语言只给第一个译法"""
+        terms = {}
+        for found in required.values():
+            for index, form in found.items():
+                if form in terms:
+                    continue
+                entry = self.entries[index]
+                targets = {lang: entry[lang][0] for lang in langs if entry.get(lang)}
+                if targets:
+                    terms[form] = targets
+        return terms
+
+    def prompt_rule(self, terms, langs, fanout=False):
+        """
+        写进 prompt 的术语规则；单语言 prompt 为 {原文写法: 译法}，fan-out prompt（译文按语言分组）
+        即使这一批只剩一个语言也用 {原文写法: {语言: 译法}}。
+        按写法排序，批次内容相同时 prompt 也相同，翻译记忆和录像才能命中
+        """
+        if len(langs) == 1 and not fanout:
+            ordered = {form: terms[form][langs[0]] for form in sorted(terms)}
+        else:
+            ordered = {form: terms[form] for form in sorted(terms)}
+        return f"Translate these glossary terms exactly as given, adjusting only grammatical endings: {compact_json(ordered)}"
+
+    def violations(self, required, translated, lang):
+        """{key: [缺少的原文写法]}：原文用到、但译文里找不到任何一种写法的词条"""
+        target = self.target(lang)
+        violations = {}
+        for key, found in required.items():
+            value = translated.get(key)
+            if not isinstance(value, str):
+                continue
+            expected = [index for index in found if self.entries[index].get(lang)]
+            if not expected:
+                continue
+            present = target.find(value)
+            missing = [found[index] for index in expected if index not in present]
+            if missing:
+                violations[key] = missing
+        return violations
@@ -0,0 +1,407 @@
+"""
+翻译请求的传输层
+
+TranslationEngine 只负责并发、限流和重试，真正发请求的是 transport：
+
+    live                      AsyncOpenAI（默认）
+    record:PATH               走 live，同时把每个请求和响应（含错误）追加写入 PATH（JSON Lines 录像）
+    replay:PATH[,latency=X]   按请求内容从录像里取回响应，不联网；latency 为秒数或 recorded（按录制时的耗时）
+    fake[:k=v,...]            本地生成译文，可注入延迟、限流、截断和损坏输出
+
+fake 的参数（概率均为每个请求独立抽样）：
+    latency=0.5        每个请求的基础延迟（秒）
+    jitter=0.2         延迟的随机浮动比例
+    tps=0              每秒输出 token 数，> 0 时延迟再加上 输出 token / tps
+    rate_limit=0       返回 429 的概率；retry_after=1 为响应里的 Retry-After 秒数
+    server_error=0     返回 500 的概率
+    timeout=0          请求超时的概率
+    truncate=0         输出截断一半并返回 finish_reason=length 的概率（输出超过 max_tokens 时总会截断）
+    malformed=0        输出损坏的概率（缺引号、占位符被改写、夹带说明文字，随机一种）
+    glossary_miss=0    不照 prompt 里的术语表翻译的概率（默认照术语表替换原文写法）
+    seed=0             随机种子，同样的参数和请求顺序得到同样的结果
+
+命令行用 --transport 或环境变量 I18N_TRANSPORT 选择，例如：
+    I18N_TRANSPORT="fake:latency=0.3,rate_limit=0.05,truncate=0.1" python3 scripts/translate-i18n.py
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import time
+
+import openai
+from openai.types.chat import ChatCompletion
+
+LIVE = "live"
+RECORD = "record"
+REPLAY = "replay"
+FAKE = "fake"
+
+ENV_VAR = "I18N_TRANSPORT"
+
+_PAYLOAD_RE = re.compile(r"translate:\n", re.I)
+_FANOUT_LANGS_RE = re.compile(r"into each of these languages: (.*?)\.\n")
+_LANG_CODE_RE = re.compile(r"([\w-]+) \([^)]*\)")
+_TARGET_RE = re.compile(r"from English to (.+?)\.\n")
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*([^{}\s]+)\s*\}\}")
+_GLOSSARY_RE = re.compile(r"glossary terms exactly as given[^:\n]*: (\{.*\})\n")
+
+
+def request_key(model, messages, params):
+    """请求内容的指纹：模型、消息和采样参数相同的请求在回放时取同一组响应"""
+    payload = json.dumps({"model": model, "messages": messages, **params}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _Request:
+    method = "POST"
+    url = "fake://chat/completions"
+
+
+class _Response:
+    """openai 的异常类只用到 status_code / headers / request"""
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.request = _Request()
+
+
+def make_error(kind, message="", headers=None):
+    """按类型名还原 openai 异常，供 fake 和 replay 使用"""
+    if kind == "RateLimitError":
+        return openai.RateLimitError(message or "Rate limit reached", response=_Response(429, headers), body=None)
+    if kind == "InternalServerError":
+        return openai.InternalServerError(message or "Internal server error", response=_Response(500, headers), body=None)
+    if kind == "APITimeoutError":
+        return openai.APITimeoutError(request=_Request())
+    if kind == "APIConnectionError":
+        return openai.APIConnectionError(message=message or "Connection error.", request=_Request())
+    return openai.APIStatusError(message or kind, response=_Response(400, headers), body=None)
+
+
+def make_completion(model, content, finish_reason="stop", prompt_tokens=0, completion_tokens=0):
+    return ChatCompletion.model_validate({
+        "id": "chatcmpl-local",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "finish_reason": finish_reason,
+            "message": {"role": "assistant", "content": content},
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    })
+
+
+class LiveTransport:
+    def __init__(self, **client_kwargs):
+        self.client_kwargs = client_kwargs
+        self.client = None
+
+    async def open(self):
+        from openai import AsyncOpenAI
+
+        self.client = AsyncOpenAI(**self.client_kwargs)
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+
+    async def create(self, model, messages, **params):
+        return await self.client.chat.completions.create(model=model, messages=messages, **params)
+
+    def summary(self):
+        return None
+
+
+class RecordTransport:
+    """包装另一个 transport，把每次请求的结果（响应或错误）和耗时追加写入录像文件"""
+
+    def __init__(self, inner, path):
+        self.inner = inner
+        self.path = path
+        self.recorded = 0
+        self._file = None
+
+    async def open(self):
+        await self.inner.open()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    async def close(self):
+        try:
+            await self.inner.close()
+        finally:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    async def create(self, model, messages, **params):
+        entry = {"key": request_key(model, messages, params), "request": {"model": model, "messages": messages, **params}}
+        started = time.perf_counter()
+        try:
+            response = await self.inner.create(model, messages, **params)
+        except openai.APIError as e:
+            response = getattr(e, "response", None)
+            headers = getattr(response, "headers", None) or {}
+            entry["error"] = {
+                "type": type(e).__name__,
+                "message": getattr(e, "message", str(e)),
+                "headers": {name: headers[name] for name in ("retry-after", "retry-after-ms") if name in headers},
+            }
+            raise
+        else:
+            entry["response"] = response.model_dump(mode="json")
+            return response
+        finally:
+            entry["seconds"] = round(time.perf_counter() - started, 4)
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+            self.recorded += 1
+
+    def summary(self):
+        return f"📼 recorded {self.recorded} requests to {self.path}"
+
+
+class ReplayMiss(openai.APIStatusError):
+    """录像里没有这个请求；不可重试，按请求失败处理"""
+
+
+class ReplayTransport:
+    """
+    按请求指纹回放录像；同一个请求录到多次（如先 429 后成功）时按录制顺序依次返回，
+    用完后重复最后一次
+    """
+
+    def __init__(self, path, latency=0.0):
+        self.path = path
+        self.latency = latency
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def open(self):
+        self.entries = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    self.entries.setdefault(entry["key"], []).append(entry)
+
+    async def close(self):
+        pass
+
+    async def create(self, model, messages, **params):
+        queue = self.entries.get(request_key(model, messages, params))
+        if not queue:
+            self.misses += 1
+            raise ReplayMiss("request not found in recording", response=_Response(404), body=None)
+        self.hits += 1
+        entry = queue.pop(0) if len(queue) > 1 else queue[0]
+        delay = entry.get("seconds", 0.0) if self.latency == "recorded" else self.latency
+        if delay:
+            await asyncio.sleep(delay)
+        error = entry.get("error")
+        if error is not None:
+            raise make_error(error["type"], error.get("message", ""), error.get("headers"))
+        return ChatCompletion.model_validate(entry["response"])
+
+    def summary(self):
+        return f"📼 replayed {self.hits} requests from {self.path}, {self.misses} not in recording"
+
+
+class FakeTransport:
+    """不联网的模型替身：把 prompt 里的英文加上语言前缀返回，按参数注入延迟和各类故障"""
+
+    def __init__(self, latency=0.5, jitter=0.2, tps=0.0, rate_limit=0.0, retry_after=1.0, server_error=0.0,
+                 timeout=0.0, truncate=0.0, malformed=0.0, glossary_miss=0.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.tps = tps
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.server_error = server_error
+        self.timeout = timeout
+        self.truncate = truncate
+        self.malformed = malformed
+        self.glossary_miss = glossary_miss
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.injected = {}
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    def summary(self):
+        injected = ", ".join(f"{kind} {count}" for kind, count in sorted(self.injected.items())) or "none"
+        return f"🧪 fake transport: {self.requests} requests, injected: {injected}"
+
+    def _inject(self, kind):
+        self.injected[kind] = self.injected.get(kind, 0) + 1
+
+    async def create(self, model, messages, **params):
+        self.requests += 1
+        rng = self.rng
+        delay = self.latency * (1 + rng.uniform(-self.jitter, self.jitter))
+        roll = rng.random()
+        if roll < self.rate_limit:
+            self._inject("rate_limit")
+            await asyncio.sleep(min(delay, 0.05))
+            raise make_error("RateLimitError", headers={"retry-after": str(self.retry_after)})
+        roll -= self.rate_limit
+        if roll < self.server_error:
+            self._inject("server_error")
+            await asyncio.sleep(delay)
+            raise make_error("InternalServerError")
+        roll -= self.server_error
+        if roll < self.timeout:
+            self._inject("timeout")
+            await asyncio.sleep(delay)
+            raise make_error("APITimeoutError")
+
+        prompt = messages[-1]["content"]
+        use_glossary = True
+        if self.glossary_miss and _GLOSSARY_RE.search(prompt) and rng.random() < self.glossary_miss:
+            self._inject("glossary_miss")
+            use_glossary = False
+        content = fake_translate(prompt, use_glossary)
+        completion_tokens = len(content) // 4
+        max_tokens = params.get("max_tokens")
+        finish_reason = "stop"
+        if max_tokens and completion_tokens > max_tokens:
+            content = content[: max_tokens * 4]
+            finish_reason = "length"
+        elif rng.random() < self.truncate:
+            self._inject("truncate")
+            content = content[: len(content) // 2]
+            finish_reason = "length"
+        elif rng.random() < self.malformed:
+            self._inject("malformed")
+            content = corrupt(content, rng)
+        completion_tokens = len(content) // 4
+
+        if self.tps > 0:
+            delay += completion_tokens / self.tps
+        await asyncio.sleep(max(0.0, delay))
+        prompt_tokens = sum(len(message["content"]) for message in messages) // 4
+        return make_completion(model, content, finish_reason, prompt_tokens, completion_tokens)
+
+
+def fake_translate(prompt, use_glossary=True):
+    """
+    按 prompt 末尾的 JSON 生成"译文"：
+        {key: 英文}                  -> {key: "[目标语言] 英文"}
+        {key: 英文} + 多个目标语言    -> {key: {语言: "[语言] 英文"}}
+        "英文" + 多个目标语言         -> {语言: "[语言] 英文"}（商品字段）
+    prompt 带术语表时，英文里的术语换成表里给的译法
+    """
+    matches = list(_PAYLOAD_RE.finditer(prompt))
+    if not matches:
+        return "{}"
+    try:
+        payload = json.loads(prompt[matches[-1].end():])
+    except ValueError:
+        return "{}"
+    glossary = _GLOSSARY_RE.search(prompt) if use_glossary else None
+    glossary = json.loads(glossary.group(1)) if glossary else {}
+    fanout = _FANOUT_LANGS_RE.search(prompt)
+    if fanout:
+        langs = _LANG_CODE_RE.findall(fanout.group(1))
+        if isinstance(payload, str):
+            result = {lang: f"[{lang}] {payload}" for lang in langs}
+        else:
+            result = {
+                key: {lang: f"[{lang}] {apply_glossary(text, glossary, lang)}" for lang in langs}
+                for key, text in payload.items()
+            }
+    else:
+        target = _TARGET_RE.search(prompt)
+        label = target.group(1) if target else "xx"
+        result = (
+            {key: f"[{label}] {apply_glossary(text, glossary)}" for key, text in payload.items()}
+            if isinstance(payload, dict) else {}
+        )
+    return json.dumps(result, ensure_ascii=False)
+
+
+def apply_glossary(text, glossary, lang=None):
+    """glossary 为 {英文: 译法} 或 {英文: {语言: 译法}}（两种写法都接受）；长词先换，忽略大小写"""
+    for term in sorted(glossary, key=len, reverse=True):
+        target = glossary[term]
+        if isinstance(target, dict):
+            target = target.get(lang) if lang is not None else None
+        if target:
+            text = re.sub(re.escape(term), lambda _: target, text, flags=re.I)
+    return text
+
+
+def corrupt(content, rng):
+    """随机制造一种模型常见的坏输出"""
+    kind = rng.randrange(3)
+    if kind == 0 and '",' in content:
+        # 丢掉一个右引号，JSON 整体解析失败
+        return content.replace('",', ",", 1)
+    if kind == 1 and _PLACEHOLDER_RE.search(content):
+        return _PLACEHOLDER_RE.sub(lambda m: "{" + m.group(1) + "}", content, count=1)
+    return f"Here is the translation:\n```json\n{content}\n```\nLet me know if you need anything else."
+
+
+def _parse_options(items):
+    options = {}
+    for item in items:
+        if not item:
+            continue
+        name, _, value = item.partition("=")
+        options[name.strip()] = value.strip()
+    return options
+
+
+def create_transport(spec=None, **client_kwargs):
+    """
+    按描述串创建 transport（见模块说明）；spec 为空时读取 I18N_TRANSPORT，仍为空则为 live
+    client_kwargs 传给 AsyncOpenAI（live / record 模式）
+    """
+    spec = spec or os.environ.get(ENV_VAR) or LIVE
+    mode, _, rest = spec.partition(":")
+    mode = mode.strip().lower()
+    if mode == LIVE:
+        return LiveTransport(**client_kwargs)
+    if mode in (RECORD, REPLAY):
+        path, *items = rest.split(",")
+        if not path:
+            raise ValueError(f"{mode} 需要录像文件路径，如 {mode}:.cache/translate.jsonl")
+        if mode == RECORD:
+            return RecordTransport(LiveTransport(**client_kwargs), path)
+        latency = _parse_options(items).get("latency", "0")
+        return ReplayTransport(path, latency if latency == "recorded" else float(latency))
+    if mode == FAKE:
+        options = _parse_options(rest.split(","))
+        try:
+            kwargs = {name: (int(value) if name == "seed" else float(value)) for name, value in options.items()}
+            return FakeTransport(**kwargs)
+        except TypeError as e:
+            raise ValueError(f"fake 参数错误: {e}")
+    raise ValueError(f"未知的 transport: {spec}（可选 live / record:PATH / replay:PATH / fake:...）")
+
+
+def transport_arg(spec):
+    """argparse 的 type：启动时就检查 --transport 描述串"""
+    try:
+        create_transport(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return spec
@@ -0,0 +1,243 @@
+"""
+语言文件监视：常驻内存的索引 + 增量跨语言检查
+
+    index = LintIndex(store)               # 启动时完整检查一遍（与 lint_store 结果相同）
+    watcher, how = open_watcher(store.locales_dir)
+    for first, names in watch_files(watcher):
+        ...                                # 每批变化的文件名，lang = 文件名去掉 .json
+        old = store.flat(lang)
+        store.reload(lang)                 # 只重新解析这一个文件
+        index.update(lang, old)            # 只重新检查受影响的语言 / key
+
+增量规则：
+    其他语言的文件变化     只用缓存的 en 重新检查这一个语言
+    en 只改了字符串值      key 集合、对象路径和值类型都不变时，只对改动的 key 在各语言里重跑 check_value
+    en 结构变化            用缓存的各语言索引重新检查全部语言（不重新读文件）
+
+文件变化优先用 inotify（Linux，ctypes 调用 libc，无需第三方包）；不可用时按 POLL_INTERVAL 比较 mtime。
+一次保存常常触发多个事件（编辑器先写临时文件再改名），收到第一个事件后再等 DEBOUNCE 秒合并成一批。
+
+push_sections() 把改动的 section 发给开发服务器（vite.config.ts 的 locale-hot-reload 插件），
+由 HMR 通道转给浏览器里的 i18next 直接替换资源，页面不用刷新。
+"""
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+import urllib.request
+
+from .chunks import split_namespaces
+from .lint import BASE_LANG, LintReport, check_value, lint_base, lint_language, value_type
+
+DEBOUNCE = 0.02
+POLL_INTERVAL = 0.1
+HOT_RELOAD_PATH = "/__i18n/hot"
+
+_MISSING = object()
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE = 0x00000200
+_IN_CLOEXEC = 0o2000000
+_EVENT = struct.Struct("iIII")
+
+
+def value_edits(old, new):
+    """new 与 old 的 key 集合、对象路径和值类型都相同时返回值有变化的 key 集合，否则返回 None"""
+    if old is None or len(old) != len(new) or old.objects != new.objects:
+        return None
+    edited = set()
+    for key, value in new.items():
+        before = old.get(key, _MISSING)
+        if before is _MISSING or value_type(before) != value_type(value):
+            return None
+        if before != value:
+            edited.add(key)
+    return edited
+
+
+class LintIndex:
+    """每个语言当前的问题列表，随文件变化增量更新"""
+
+    def __init__(self, store, base_lang=BASE_LANG):
+        self.store = store
+        self.base_lang = base_lang
+        self.issues = {}
+        self.rebuild()
+
+    def rebuild(self):
+        self.issues = {lang: self._lint(lang) for lang in self.store.langs}
+        return sorted(self.issues)
+
+    def _lint(self, lang):
+        base = self.store.flat(self.base_lang)
+        if lang == self.base_lang:
+            return lint_base(lang, base)
+        flat = self.store.flat(lang)
+        return lint_language(lang, base, flat, flat.objects)
+
+    def update(self, lang, old_flat=None):
+        """
+        lang 已经 store.reload()；old_flat 为重新读取前的扁平索引（新增的语言为 None）。
+        返回重新检查过的语言列表
+        """
+        if lang not in self.store:
+            self.issues.pop(lang, None)
+            return [lang]
+        if lang != self.base_lang:
+            self.issues[lang] = self._lint(lang)
+            return [lang]
+        base = self.store.flat(lang)
+        edited = value_edits(old_flat, base)
+        if edited is None:
+            return self.rebuild()
+        self.issues[lang] = lint_base(lang, base)
+        for other in self.store.langs:
+            if other == lang:
+                continue
+            flat = self.store.flat(other)
+            # 目标语言里是叶子的 key，其问题全部来自 check_value；缺失、对象/叶子不一致不受值修改影响
+            recheck = [key for key in edited if key in flat]
+            if not recheck:
+                continue
+            stale = set(recheck)
+            issues = [issue for issue in self.issues[other] if issue.key not in stale]
+            for key in recheck:
+                check_value(other, key, base[key], flat[key], issues)
+            self.issues[other] = issues
+        return sorted(self.issues)
+
+    def report(self, elapsed=0.0):
+        issues = [issue for lang in sorted(self.issues) for issue in self.issues[lang]]
+        return LintReport(issues, {lang: len(self.store.flat(lang)) for lang in self.store.langs}, elapsed)
+
+
+def issue_key(issue):
+    return issue.lang, issue.key, issue.code, issue.message
+
+
+def issue_diff(before, after):
+    """两组 Issue 的差异：(新出现的, 已消失的)，按 key 排序"""
+    old = {issue_key(issue): issue for issue in before}
+    new = {issue_key(issue): issue for issue in after}
+    added = [new[key] for key in sorted(new.keys() - old.keys())]
+    resolved = [old[key] for key in sorted(old.keys() - new.keys())]
+    return added, resolved
+
+
+def changed_sections(old_data, new_data):
+    """两个版本的嵌套 dict 之间内容有变化的 section：{section: 新内容}，删掉的 section 为 {}"""
+    old = split_namespaces(old_data or {})
+    new = split_namespaces(new_data or {})
+    return {
+        section: new.get(section, {})
+        for section in list(new) + [section for section in old if section not in new]
+        if old.get(section) != new.get(section)
+    }
+
+
+def push_sections(url, updates, timeout=1.0):
+    """
+    updates: [{"lng": 语言, "section": section, "data": 内容}]，POST 给开发服务器；
+    返回收到更新的浏览器数，开发服务器没有运行时抛出 OSError
+    """
+    body = json.dumps(updates, ensure_ascii=False).encode("utf-8")
+    request = urllib.request.Request(
+        url.rstrip("/") + HOT_RELOAD_PATH, data=body, headers={"Content-Type": "application/json"}, method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.load(response).get("clients", 0)
+
+
+def _is_locale(name):
+    return name.endswith(".json") and not name.startswith(".")
+
+
+class _Inotify:
+    def __init__(self, directory):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(_IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_DELETE
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch failed: {directory}")
+
+    def read(self, timeout):
+        """等待至多 timeout 秒，返回这段时间里变化的文件名集合"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        buf = os.read(self.fd, 64 * 1024)
+        names = set()
+        offset = 0
+        while offset < len(buf):
+            _, _, _, length = _EVENT.unpack_from(buf, offset)
+            offset += _EVENT.size
+            name = buf[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+            offset += length
+            if _is_locale(name):
+                names.add(name)
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _Poller:
+    def __init__(self, directory):
+        self.directory = directory
+        self.seen = self._scan()
+
+    def _scan(self):
+        stats = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if _is_locale(entry.name):
+                    stat = entry.stat()
+                    stats[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def read(self, timeout):
+        time.sleep(min(timeout, POLL_INTERVAL))
+        current = self._scan()
+        names = {name for name in current.keys() | self.seen.keys() if current.get(name) != self.seen.get(name)}
+        self.seen = current
+        return names
+
+    def close(self):
+        pass
+
+
+def open_watcher(directory, poll=False):
+    """返回 (watcher, 方式)；inotify 不可用（非 Linux、句柄数用尽）时退回轮询"""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return _Inotify(directory), "inotify"
+        except (OSError, AttributeError):
+            pass
+    return _Poller(directory), f"polling every {POLL_INTERVAL * 1000:.0f} ms"
+
+
+def watch_files(watcher, debounce=DEBOUNCE):
+    """不断产出 (第一个事件的时间 perf_counter, {变化的文件名})；同一次保存的多个事件合并成一批"""
+    while True:
+        names = watcher.read(1.0)
+        if not names:
+            continue
+        first = time.perf_counter()
+        while True:
+            more = watcher.read(debounce)
+            if not more:
+                break
+            names |= more
+        yield first, names
+
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+检查全部语言文件与 en.json 的结构一致性
+
+用法:
+    python3 scripts/lint-locales.py                  按语言汇总，列出所有 error
+    python3 scripts/lint-locales.py --json           机器可读输出（编辑器 / CI 用）
+    python3 scripts/lint-locales.py --lang de --lang fr --verbose
+
+有 error 时退出码为 1；加 --strict 时 warning（多余的 key）也算失败。
+"""
+import argparse
+import json
+import sys
+
+from i18n_tools import LocaleStore
+from i18n_tools.lint import lint_store
+
+
+def print_text(report, verbose):
+    for lang, by_code in sorted(report.counts().items()):
+        summary = ", ".join(f"{code} {count}" for code, count in sorted(by_code.items()))
+        print(f"  {lang:8} {summary}")
+    shown = report.issues if verbose else report.errors
+    if shown:
+        print()
+    for issue in shown:
+        print(f"{issue.severity:7} {issue.lang:8} {issue.key}  [{issue.code}] {issue.message}")
+    print(
+        f"\n{'❌' if report.errors else '✅'} {len(report.errors)} errors, {len(report.warnings)} warnings"
+        f" in {len(report.key_counts)} locales ({report.elapsed * 1000:.0f} ms)"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="检查语言文件的缺失/多余 key、类型、占位符和标签")
+    parser.add_argument("--json", action="store_true", help="输出 JSON")
+    parser.add_argument("--lang", action="append", help="只检查指定语言（可重复）")
+    parser.add_argument("--strict", action="store_true", help="warning 也返回非零退出码")
+    parser.add_argument("--verbose", action="store_true", help="同时列出 warning")
+    args = parser.parse_args(argv)
+
+    store = LocaleStore()
+    unknown = sorted(set(args.lang or ()) - set(store.langs))
+    if unknown:
+        parser.error(f"没有这些语言的文件: {', '.join(unknown)}（可选: {', '.join(store.langs)}）")
+    report = lint_store(store, langs=args.lang)
+    if args.json:
+        json.dump(report.as_dict(), sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print_text(report, args.verbose)
+
+    failed = report.errors or (args.strict and report.warnings)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
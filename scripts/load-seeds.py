@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+把 seeds/ 下的种子数据批量导入数据库（重置测试/预发环境用）
+
+用法:
+    python3 scripts/load-seeds.py                          导入默认种子文件到 DATABASE_URL
+    python3 scripts/load-seeds.py --reset                  先清空种子涉及的表再导入（pnpm db:reset）
+    python3 scripts/load-seeds.py seeds/reviews.sql.gz     只导入指定文件（.sql / .sql.gz）
+    python3 scripts/load-seeds.py --database sqlite:///tmp/shop.db --workers 1
+
+默认文件顺序：products-and-images.sql、health-safety-patch.sql，然后是 seeds/ 下其余的 .sql / .sql.gz。
+需要先 pnpm db:push 建好表结构。
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+from i18n_tools.seed_loader import BATCH_BYTES, BATCH_ROWS, WORKERS, SeedLoader
+from i18n_tools.sql_seed import open_seed
+
+SEEDS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../seeds"))
+SEED_ORDER = ("products-and-images.sql", "health-safety-patch.sql")
+
+
+def default_seeds():
+    files = [os.path.join(SEEDS_DIR, name) for name in SEED_ORDER]
+    for path in sorted(glob.glob(os.path.join(SEEDS_DIR, "*.sql")) + glob.glob(os.path.join(SEEDS_DIR, "*.sql.gz"))):
+        if path not in files and not (path.endswith(".gz") and path[:-3] in files):
+            files.append(path)
+    return [path for path in files if os.path.exists(path)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="并行批量导入种子数据")
+    parser.add_argument("files", nargs="*", help="种子文件（默认 seeds/ 下全部）")
+    parser.add_argument("--database", help="数据库连接串（默认 DATABASE_URL）")
+    parser.add_argument("--reset", action="store_true", help="导入前清空种子涉及的表")
+    parser.add_argument("--workers", type=int, default=WORKERS, help=f"并行连接数（默认 {WORKERS}）")
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS, help=f"每条 INSERT 的最大行数（默认 {BATCH_ROWS}）")
+    parser.add_argument("--batch-mb", type=float, default=BATCH_BYTES / (1 << 20), help="每条 INSERT 的最大大小 MB")
+    args = parser.parse_args(argv)
+
+    files = args.files or default_seeds()
+    if not files:
+        print("❌ no seed files found")
+        return 1
+
+    started = time.perf_counter()
+    loader = SeedLoader(args.database, args.workers, args.batch_rows, int(args.batch_mb * (1 << 20)), args.reset)
+    try:
+        for path in files:
+            print(f"📥 {os.path.relpath(path)}")
+            with open_seed(path, "r") as f:
+                loader.load(f)
+    finally:
+        stats = loader.finish()
+    elapsed = time.perf_counter() - started
+
+    total = sum(s.rows for s in stats.values())
+    print(f"{'table':24} {'rows':>10} {'batches':>8} {'seconds':>8} {'rows/s':>10}")
+    for s in sorted(stats.values(), key=lambda s: -s.rows):
+        print(f"{s.table:24} {s.rows:>10} {s.batches:>8} {s.busy:>8.2f} {s.rows_per_second:>10.0f}")
+    print(
+        f"✓ {total} rows into {len(stats)} tables with {len(loader.workers)} connections in {elapsed:.2f}s "
+        f"({total / elapsed if elapsed else 0:.0f} rows/s); "
+        f"{loader.barriers} other statements, {loader.skipped} skipped"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
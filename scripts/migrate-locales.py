@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+应用 scripts/locale-migrations/ 下尚未执行的语言文件迁移（格式见 i18n_tools/migrations.py）
+
+用法:
+    python3 scripts/migrate-locales.py                     合并执行全部待应用迁移（pnpm i18n:migrate）
+    python3 scripts/migrate-locales.py --status            列出已应用 / 待应用的迁移
+    python3 scripts/migrate-locales.py --dry-run           只检查冲突并统计每个语言会改动的 key
+    python3 scripts/migrate-locales.py --generate 结算页新文案   新建空迁移文件
+    python3 scripts/migrate-locales.py --baseline          把待应用迁移记为已应用，不改语言文件
+
+所有待应用迁移在一个事务里执行：语言文件只读一次、每个文件最多写一次；
+有冲突时不写任何文件，退出码 1。
+"""
+import argparse
+import os
+import sys
+import time
+
+from i18n_tools import LocaleStore
+from i18n_tools.manifest import MANIFEST_PATH, Manifest
+from i18n_tools.migrations import JOURNAL_PATH, MIGRATIONS_DIR, Journal, MigrationError, Plan, discover, generate
+
+
+def print_status(migrations, journal):
+    for migration in migrations:
+        entry = journal.entries.get(migration.tag)
+        if entry is None:
+            print(f"  ⏳ {migration.tag}  {migration.description}")
+        else:
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["when"] / 1000))
+            print(f"  ✅ {migration.tag}  {migration.description}  ({when})")
+
+
+def print_conflicts(conflicts):
+    print(f"❌ {len(conflicts)} 处冲突，未写入任何文件:")
+    for lang, key, tag, value, other_key, other_tag, other_value in conflicts:
+        if key == other_key:
+            print(f"  {lang}  {key}")
+        else:
+            print(f"  {lang}  {key}  ↔  {other_key}")
+        print(f"      {tag}: {value}")
+        print(f"      {other_tag}: {other_value}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="应用声明式语言文件迁移")
+    parser.add_argument("--status", action="store_true", help="列出迁移状态")
+    parser.add_argument("--dry-run", action="store_true", help="只检查冲突和统计改动，不写文件")
+    parser.add_argument("--generate", metavar="NAME", help="新建空迁移文件")
+    parser.add_argument("--baseline", action="store_true", help="把待应用迁移记为已应用（语言文件已包含这些修改时使用）")
+    parser.add_argument("--dir", default=MIGRATIONS_DIR, help="迁移目录")
+    parser.add_argument("--journal", default=None, help="账本路径（默认 <迁移目录>/meta/_journal.json）")
+    parser.add_argument("--manifest", default=MANIFEST_PATH, help="翻译来源清单路径")
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        print(f"📝 {os.path.relpath(generate(args.generate, args.dir))}")
+        return 0
+
+    journal_path = args.journal or (
+        JOURNAL_PATH if args.dir == MIGRATIONS_DIR else os.path.join(args.dir, "meta", "_journal.json")
+    )
+    try:
+        migrations = discover(args.dir)
+    except MigrationError as e:
+        print(f"❌ {e}")
+        return 1
+    journal = Journal.load(journal_path)
+
+    modified, missing = journal.drift(migrations)
+    for migration in modified:
+        print(f"⚠️  {migration.tag} 在应用后被修改，不会重新执行；需要新的修改请另建迁移")
+    for tag in missing:
+        print(f"⚠️  账本中的 {tag} 找不到对应文件")
+
+    if args.status:
+        print_status(migrations, journal)
+        return 0
+
+    pending = journal.pending(migrations)
+    if not pending:
+        print("✅ 没有待应用的迁移")
+        return 0
+
+    if args.baseline:
+        for migration in pending:
+            journal.record(migration)
+            print(f"📌 {migration.tag}")
+        journal.save()
+        print(f"\n{len(pending)} 个迁移已记为已应用（语言文件未改动）")
+        return 0
+
+    store = LocaleStore()
+    plan = Plan(pending, store.langs)
+    if plan.conflicts:
+        print_conflicts(plan.conflicts)
+        return 1
+
+    for migration in pending:
+        print(f"▶ {migration.tag}  {migration.description}")
+    changes = plan.changes(store)
+    if args.dry_run:
+        print(f"\n📋 {len(plan.writes)} 个写入，{sum(changes.values())} 个 key 会变化（dry-run，未写文件）:")
+        for lang in sorted(changes):
+            print(f"  {lang:<8} {changes[lang]:>5}")
+        return 0
+
+    manifest = Manifest.load(args.manifest)
+    applied_at = time.time()
+    with store.transaction() as tx:
+        plan.apply(tx, manifest)
+
+        def record_applied():
+            for migration in pending:
+                journal.record(migration, applied_at)
+            journal.save()
+
+        tx.on_commit(record_applied)
+
+    print(
+        f"\n{len(pending)} 个迁移，{sum(changes.values())} 个 key 变化，"
+        f"读取 {store.reads} 个文件，写入 {store.writes} 个文件"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+流式改写 SQL 种子文件（seeds/*.sql）中 INSERT 的文本列
+
+用法:
+    python3 scripts/patch-seed-sql.py seeds/products-and-images.sql -o out.sql --patch patch.json
+    python3 scripts/patch-seed-sql.py seeds/products-and-images.sql --in-place --terms terms.json
+    python3 scripts/patch-seed-sql.py seeds/products-and-images.sql -o out.sql --from-locales
+    python3 scripts/patch-seed-sql.py seeds/reviews.sql.gz -o reviews.patched.sql.gz --terms terms.json
+
+patch.json: {"products": {"510001": {"name": {"de": "..."}}, "some-slug": {"description": "..."}}}
+    值为 {lang: 文本} 时合并进多语言 JSON（纯文本列先按是否含中文归到 zh/en），为字符串时整列替换
+terms.json: {"旧词": "新词", ...}，对 products / categories / product_images 的文本列和 reviews 的
+    title / comment 做替换（长词优先，拉丁字母的词按整词匹配）；合规词表请用 compliance-rewrite.py
+--from-locales: 把语言文件 products 段里的商品文案当作补丁（同 products:sync-i18n 的字段映射）
+
+逐条语句读写，不会把整个文件读进内存；未改动的语句按原文输出。.gz 文件直接流式解压/压缩。
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from i18n_tools import LocaleStore
+from i18n_tools.product_sync import extract_entries
+from i18n_tools.sql_seed import SeedTransformer, TermRewriter, open_seed, transform_stream
+
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="流式改写 SQL 种子文件中的文本列")
+    parser.add_argument("input", help="输入 .sql 文件")
+    parser.add_argument("-o", "--output", help="输出文件（默认 stdout）")
+    parser.add_argument("--in-place", action="store_true", help="写回输入文件")
+    parser.add_argument("--patch", action="append", default=[], help="行补丁 JSON，可多次指定")
+    parser.add_argument("--terms", help="术语替换表 JSON")
+    parser.add_argument("--from-locales", action="store_true", help="用语言文件 products 段的商品文案作补丁")
+    args = parser.parse_args(argv)
+
+    patches = {}
+    for path in args.patch:
+        for table, rows in load_json(path).items():
+            for key, columns in rows.items():
+                patches.setdefault(table, {}).setdefault(str(key), {}).update(columns)
+    if args.from_locales:
+        for key, columns in extract_entries(LocaleStore()).items():
+            row = patches.setdefault("products", {}).setdefault(key, {})
+            for column, values in columns.items():
+                if isinstance(row.get(column), dict):
+                    values = {**values, **row[column]}
+                row[column] = values
+    rewriter = TermRewriter(load_json(args.terms)) if args.terms else None
+    transformer = SeedTransformer(patches, rewriter)
+
+    output = args.input if args.in_place else args.output
+    started = time.perf_counter()
+    with open_seed(args.input, "r") as src:
+        if output is None:
+            size = transform_stream(src, sys.stdout, transformer)
+        else:
+            tmp_path = f"{output}.tmp"
+            with open_seed(tmp_path, "w", output.endswith(".gz")) as dst:
+                size = transform_stream(src, dst, transformer)
+            os.replace(tmp_path, output)
+    elapsed = time.perf_counter() - started
+
+    stats = transformer.stats
+    print(
+        f"✓ {stats.statements} statements, {stats.inserts} inserts, {stats.rows} rows parsed: "
+        f"{stats.patched} values patched, {stats.rewrites} term rewrites in {stats.changed_statements} statements",
+        file=sys.stderr,
+    )
+    print(f"  {size / 1024 / 1024:.1f} MB in {elapsed:.2f}s ({size / 1024 / 1024 / max(elapsed, 1e-9):.1f} MB/s)",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+import { refreshProductTexts } from "../server/db";
+
+/**
+ * 重建产品多语言文本投影(product_texts)
+ *
+ * 后台增删改产品时会自动刷新;直接写库的批量脚本(翻译、导入等)跑完后执行一次即可。
+ * 只重写源字段有变化的产品,加 --force 全部重写。
+ *
+ * 用法: npx tsx scripts/project-product-texts.ts [--force]
+ */
+async function main() {
+  const force = process.argv.includes("--force");
+  const started = Date.now();
+  const { scanned, updated } = await refreshProductTexts(undefined, { force });
+  const seconds = (Date.now() - started) / 1000;
+  console.log(`✓ 扫描 ${scanned} 个产品, 重写 ${updated} 个产品的投影 (${seconds.toFixed(1)}s)`);
+  process.exit(0);
+}
+
+main().catch((err) => {
+  console.error("投影生成失败:", err);
+  process.exit(1);
+});
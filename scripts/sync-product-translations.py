@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+把语言文件 products 段里按商品 id / slug 存放的商品文案同步到 products 表
+
+用法:
+    python3 scripts/sync-product-translations.py                     同步并从语言文件删除已同步条目
+    python3 scripts/sync-product-translations.py --dry-run           只报告将要改动的商品
+    python3 scripts/sync-product-translations.py --keep-locales      同步但保留语言文件中的条目
+    python3 scripts/sync-product-translations.py --database sqlite:///tmp/shop.db
+
+默认连接 DATABASE_URL。数据库里已有且不同的译文默认保留（报告为冲突），有冲突的条目
+留在语言文件里，不会被删除；加 --prefer-locale 则以语言文件为准。同步后运行 pnpm products:project 刷新商品文本投影。
+"""
+import argparse
+import sys
+import time
+
+from i18n_tools import LocaleStore
+from i18n_tools.db import Database
+from i18n_tools.product_sync import load_state, save_state, strip_synced, sync_products
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="同步语言文件中的商品文案到 products 表")
+    parser.add_argument("--database", help="数据库连接串（默认 DATABASE_URL）")
+    parser.add_argument("--dry-run", action="store_true", help="只报告，不写数据库和语言文件")
+    parser.add_argument("--keep-locales", action="store_true", help="同步后不从语言文件删除条目")
+    parser.add_argument("--prefer-locale", action="store_true", help="冲突时以语言文件为准")
+    parser.add_argument("--full", action="store_true", help="忽略同步记录，全部重新合并")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    store = LocaleStore()
+    state = load_state()
+    with Database(args.database) as db:
+        report = sync_products(store, db, state, args.prefer_locale, args.dry_run, args.full)
+
+    print(
+        f"📦 {report.entries} product entries in locale files: "
+        f"{report.updated} products updated in {report.statements} statements, {report.unchanged} already synced"
+    )
+    for key, langs in sorted(report.conflicts.items()):
+        print(f"  ⚠️  {key}: kept database value for {', '.join(sorted(langs))}")
+    if report.conflicted_keys:
+        print(f"  ⚠️  {len(report.conflicted_keys)} entries with conflicts left in locale files (--prefer-locale to overwrite)")
+    if report.orphans:
+        print(f"  ⚠️  no matching product for: {', '.join(report.orphans)} (left in locale files)")
+
+    if args.dry_run:
+        print("dry run, nothing written")
+        return 0
+
+    save_state(state)
+    if not args.keep_locales and report.synced_keys:
+        with store.transaction() as tx:
+            strip_synced(tx, report.synced_keys)
+        print(f"🧹 removed {len(report.synced_keys)} product entries from {store.writes} locale files")
+    print(f"✓ done in {time.perf_counter() - started:.2f}s")
+    if report.updated:
+        print("next: pnpm products:project")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
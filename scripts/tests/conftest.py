@@ -0,0 +1,54 @@
+"""
+维护脚本的测试：直接 import scripts/ 下的 i18n_tools（与脚本本身的运行方式一致）
+"""
+import importlib.util
+import os
+import signal
+import sys
+
+import pytest
+
+SCRIPTS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+
+@pytest.fixture
+def time_limit():
+    """time_limit(秒)：超时时让测试失败而不是卡住（正则灾难性回溯一类的问题）"""
+
+    def on_alarm(signum, frame):
+        raise TimeoutError("time limit exceeded")
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+
+    def arm(seconds):
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+
+    yield arm
+    signal.setitimer(signal.ITIMER_REAL, 0)
+    signal.signal(signal.SIGALRM, previous)
+
+
+def load_script(filename):
+    """scripts/ 下的脚本作为模块导入（文件名带连字符，不能直接 import）"""
+    name = filename[: -len(".py")].replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SCRIPTS_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def translate_i18n():
+    return load_script("translate-i18n.py")
+
+
+@pytest.fixture(scope="session")
+def lint_locales():
+    return load_script("lint-locales.py")
+
+
+@pytest.fixture(scope="session")
+def migrate_locales():
+    return load_script("migrate-locales.py")
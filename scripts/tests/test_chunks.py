@@ -0,0 +1,54 @@
+import json
+
+from i18n_tools import LocaleStore
+from i18n_tools.chunks import ROOT_NAMESPACE, build_chunks, is_up_to_date, split_namespaces, write_chunks
+from i18n_tools.compiler import LocaleCompiler
+
+
+def make_store(tmp_path, locales):
+    directory = tmp_path / "locales"
+    directory.mkdir(exist_ok=True)
+    for lang, data in locales.items():
+        (directory / f"{lang}.json").write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return LocaleStore(str(directory))
+
+
+LOCALES = {
+    "en": {"brand": "Shop", "nav": {"home": "Home"}, "cart": {"title": "Cart"}},
+    "de": {"brand": "Shop", "nav": {"home": "Start"}, "cart": {"title": "Cart"}},
+}
+
+
+def test_split_namespaces_collects_top_level_strings():
+    assert split_namespaces(LOCALES["en"]) == {
+        ROOT_NAMESPACE: {"brand": "Shop"}, "nav": {"home": "Home"}, "cart": {"title": "Cart"},
+    }
+
+
+def test_compiled_chunks_only_ship_differences(tmp_path):
+    store = make_store(tmp_path, LOCALES)
+    manifest, files = build_chunks(store, transform=LocaleCompiler(store))
+    assert sorted(manifest["languages"]["en"]) == [ROOT_NAMESPACE, "cart", "nav"]
+    # de 与英文相同的 section 不输出，由 fallbackLng 补上
+    assert list(manifest["languages"]["de"]) == ["nav"]
+    digest = manifest["languages"]["de"]["nav"]
+    assert json.loads(files[f"de/nav.{digest}.json"]) == {"home": "Start"}
+
+
+def test_write_chunks_replaces_stale_files_and_check_detects_drift(tmp_path):
+    out_dir = tmp_path / "public"
+    manifest_path = tmp_path / "chunks.json"
+    store = make_store(tmp_path, LOCALES)
+    manifest, files = build_chunks(store, transform=LocaleCompiler(store))
+    assert not is_up_to_date(manifest, files, str(out_dir), str(manifest_path))
+    assert write_chunks(manifest, files, str(out_dir), str(manifest_path)) == (len(files), 0, True)
+    assert is_up_to_date(manifest, files, str(out_dir), str(manifest_path))
+    assert write_chunks(manifest, files, str(out_dir), str(manifest_path)) == (0, 0, False)
+
+    # 改了语言文件而没有重新生成 chunk：--check 应当失败
+    store = make_store(tmp_path, {**LOCALES, "de": {**LOCALES["de"], "nav": {"home": "Startseite"}}})
+    manifest, files = build_chunks(store, transform=LocaleCompiler(store))
+    assert not is_up_to_date(manifest, files, str(out_dir), str(manifest_path))
+    assert write_chunks(manifest, files, str(out_dir), str(manifest_path)) == (1, 1, True)
+    assert is_up_to_date(manifest, files, str(out_dir), str(manifest_path))
+    assert sorted(p.name for p in (out_dir / "de").iterdir()) == [f"nav.{manifest['languages']['de']['nav']}.json"]
@@ -0,0 +1,72 @@
+"""语言文件编译：稀疏 diff、去掉商品条目、重复字符串改写成 $t 引用"""
+import json
+
+import pytest
+
+from i18n_tools import LocaleStore
+from i18n_tools.chunks import build_chunks
+from i18n_tools.compiler import LocaleCompiler, intern_strings, sparse_diff, strip_non_ui
+
+LONG = "Free shipping on every order over $50"
+
+
+def test_intern_strings_replaces_repeats_with_first_key():
+    value = {"banner": LONG, "footer": {"note": LONG}, "short": "Buy", "again": "Buy"}
+    interned, replaced = intern_strings(value, ["home"])
+    assert interned == {"banner": LONG, "footer": {"note": "$t(home.banner)"}, "short": "Buy", "again": "Buy"}
+    assert replaced == 1
+
+
+def test_intern_strings_skips_interpolation_and_unsafe_keys():
+    text = "{{count}} customers bought this item today"
+    value = {"a": text, "b": text, "c.d": LONG, "e": LONG}
+    interned, replaced = intern_strings(value, ["home"])
+    assert interned == value
+    assert replaced == 0
+
+
+def test_sparse_diff_and_strip_non_ui():
+    en = {"title": "Shop", "nested": {"a": "A", "b": "B"}}
+    assert sparse_diff({"title": "Shop", "nested": {"a": "A", "b": "Bé"}}, en) == {"nested": {"b": "Bé"}}
+    assert sparse_diff(en, en) is None
+    products = {"title": "Products", "42": {"name": "Bracelet"}, "jade-ring": {"shortDesc": "Ring"}}
+    assert strip_non_ui("products", products) == {"title": "Products"}
+    assert strip_non_ui("home", products) == products
+
+
+@pytest.fixture
+def store(tmp_path):
+    locales = {
+        "en": {"home": {"banner": LONG, "promo": LONG, "title": "Home"}, "products": {"7": {"name": "Jade"}}},
+        "de": {"home": {"banner": "Kostenloser Versand ab 50 $ Bestellwert", "promo": LONG, "title": "Startseite"}},
+        "fr": {"home": {"banner": "Livraison offerte dès 50 $ d'achat", "promo": "Livraison offerte dès 50 $ d'achat"}},
+    }
+    for lang, data in locales.items():
+        (tmp_path / f"{lang}.json").write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return LocaleStore(str(tmp_path))
+
+
+def test_fallback_chunk_is_not_interned(store):
+    """de 缺 home.promo 时回退到英文值；英文里若是 $t(home.banner)，会按德语解析成 banner 的译文"""
+    compiler = LocaleCompiler(store)
+    assert compiler("en", "home", store.data("en")["home"]) == {"banner": LONG, "promo": LONG, "title": "Home"}
+    # de 的 promo 与英文相同，被去掉，由 fallbackLng 补上英文原文
+    assert compiler("de", "home", store.data("de")["home"]) == {
+        "banner": "Kostenloser Versand ab 50 $ Bestellwert",
+        "title": "Startseite",
+    }
+    # 非英文 chunk 的引用目标就在同一个 chunk 里
+    assert compiler("fr", "home", store.data("fr")["home"]) == {
+        "banner": "Livraison offerte dès 50 $ d'achat",
+        "promo": "$t(home.banner)",
+    }
+    assert compiler.interned == {"de": 0, "fr": 1}
+    assert compiler.dropped["de"] == 1
+
+
+def test_build_chunks_drops_product_entries_and_is_deterministic(store):
+    manifest, files = build_chunks(store, transform=LocaleCompiler(store))
+    again, files_again = build_chunks(store, transform=LocaleCompiler(store))
+    assert manifest == again and files == files_again
+    assert not any(b"Jade" in data for data in files.values())
+    assert all(b"$t(" not in data for path, data in files.items() if "/en/" in path)
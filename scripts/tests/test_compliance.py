@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from i18n_tools import LocaleStore
+from i18n_tools.compliance import Glossary, rewrite_locales, rewrite_migrations
+from i18n_tools.migrations import Journal, discover
+
+TABLES = {
+    "zh": {"开光": "启蕴", "开光加持": "启蕴"},
+    "en": {"temple": "heritage site", "sacred": "cultural", "Sacred": "Cultural"},
+    "ja": {"開光": "啓蘊"},
+}
+
+
+@pytest.fixture
+def glossary():
+    return Glossary(TABLES)
+
+
+def rewrite(glossary, text, lang):
+    found = []
+    new, count = glossary.rewrite(text, lang, found)
+    return new, count, found
+
+
+def test_english_terms_match_whole_words_only(glossary):
+    assert rewrite(glossary, "Visit the temple, contemplate Sacred art", "en") == (
+        "Visit the heritage site, contemplate Cultural art", 2, ["temple", "Sacred"],
+    )
+
+
+def test_longest_match_wins_and_zh_applies_everywhere(glossary):
+    assert rewrite(glossary, "开光加持手链", "zh")[:2] == ("启蕴手链", 1)
+    # 非拉丁字母语言同时套用 zh 和 en 表
+    assert rewrite(glossary, "temple 开光加持", "ar")[:2] == ("heritage site 启蕴", 2)
+    assert rewrite(glossary, "開光 temple", "ja")[:2] == ("啓蘊 heritage site", 2)
+
+
+def test_latin_languages_skip_english_table(glossary):
+    """temple 在法语里是正常词汇"""
+    assert rewrite(glossary, "le temple sacré 开光", "fr") == ("le temple sacré 启蕴", 1, ["开光"])
+
+
+def test_cascades_report_replacements_that_match_again():
+    assert Glossary({"en": {"holy": "sacred", "sacred": "cultural"}}).cascades() == [
+        ("en", "holy", "sacred", ["sacred"])
+    ]
+
+
+def test_rewrite_locales_audits_then_writes(tmp_path, glossary):
+    (tmp_path / "en.json").write_text(json.dumps({"home": {"title": "Sacred Jewelry", "cta": "Shop"}}), encoding="utf-8")
+    (tmp_path / "fr.json").write_text(json.dumps({"home": {"title": "Bijoux du temple"}}), encoding="utf-8")
+    store = LocaleStore(str(tmp_path))
+    hits = rewrite_locales(store, glossary)
+    assert hits.as_dict() == {"en": {"home.title": {"Sacred": 1}}}
+    assert store.writes == 0
+
+    with store.transaction() as tx:
+        rewrite_locales(store, glossary, tx)
+    reloaded = LocaleStore(str(tmp_path))
+    assert reloaded.get("en", "home.title") == "Cultural Jewelry"
+    assert reloaded.get("fr", "home.title") == "Bijoux du temple"
+    assert not rewrite_locales(reloaded, glossary)
+
+
+def test_rewrite_migrations_updates_files_and_journal(tmp_path, glossary):
+    directory = tmp_path / "migrations"
+    directory.mkdir()
+    migration = {
+        "description": "m",
+        "ops": [
+            {"op": "set", "section": "home", "values": {"en": {"title": "Sacred Jewelry"}, "zh": {"title": "开光手链"}}},
+            {"op": "setdefault", "key": "home.cta", "values": {"en": "Shop", "zh": "购买"}},
+        ],
+    }
+    (directory / "0000_home.json").write_text(json.dumps(migration, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    journal = Journal(str(directory / "meta" / "_journal.json"))
+    journal.record(discover(str(directory))[0], when=0)
+    journal.save()
+
+    hits, changed = rewrite_migrations(discover(str(directory)), glossary)
+    assert hits.as_dict() == {"en": {"0000_home:home.title": {"Sacred": 1}}, "zh": {"0000_home:home.title": {"开光": 1}}}
+    assert [m.tag for m in changed] == ["0000_home"]
+    # 审计不写文件
+    assert json.loads((directory / "0000_home.json").read_text(encoding="utf-8")) == migration
+
+    _, changed = rewrite_migrations(discover(str(directory)), glossary, write=True)
+    journal = Journal.load(str(directory / "meta" / "_journal.json"))
+    for migration in changed:
+        journal.rehash(migration)
+    journal.save()
+    data = json.loads((directory / "0000_home.json").read_text(encoding="utf-8"))
+    assert data["ops"][0]["values"] == {"en": {"title": "Cultural Jewelry"}, "zh": {"title": "启蕴手链"}}
+    assert Journal.load(journal.path).drift(discover(str(directory))) == ([], [])
+    assert Journal.load(journal.path).entries["0000_home"]["when"] == 0
+
+
+def test_shipped_migrations_are_compliant():
+    """重放迁移不能把语言文件改回不合规的说法"""
+    hits, changed = rewrite_migrations(discover(), Glossary.load())
+    assert not hits and changed == []
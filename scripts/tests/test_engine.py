@@ -0,0 +1,108 @@
+import asyncio
+
+import openai
+import pytest
+
+from i18n_tools.engine import AdaptiveLimiter, TranslationEngine, retry_after_seconds
+from i18n_tools.telemetry import Telemetry
+from i18n_tools.transport import make_completion, make_error
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class ScriptedTransport:
+    """依次返回脚本里的结果：异常类型名抛出对应的 openai 异常，其余作为译文返回"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def create(self, model, messages, **params):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if outcome.endswith("Error"):
+            raise make_error(outcome, headers={"retry-after-ms": "1"})
+        return make_completion(model, outcome, prompt_tokens=10, completion_tokens=5)
+
+
+def complete(transport, max_retries=5, telemetry=None):
+    async def run():
+        async with TranslationEngine(transport=transport, max_retries=max_retries, telemetry=telemetry) as engine:
+            return await engine.complete(MESSAGES, tags={"lang": "de"})
+
+    return asyncio.run(run())
+
+
+def test_retries_rate_limits_and_records_attempts():
+    telemetry = Telemetry()
+    transport = ScriptedTransport("RateLimitError", "RateLimitError", "ok")
+    response = complete(transport, telemetry=telemetry)
+    assert response.choices[0].message.content == "ok"
+    assert transport.calls == 3
+    stats = telemetry.langs["de"]
+    assert (stats.requests, stats.attempts, stats.retries, stats.rate_limited) == (1, 3, 2, 2)
+    assert (stats.input_tokens, stats.output_tokens) == (10, 5)
+
+
+def test_gives_up_after_max_retries(monkeypatch):
+    monkeypatch.setattr("i18n_tools.engine.backoff_delay", lambda attempt: 0.0)
+    telemetry = Telemetry()
+    transport = ScriptedTransport("InternalServerError")
+    with pytest.raises(openai.InternalServerError):
+        complete(transport, max_retries=2, telemetry=telemetry)
+    assert transport.calls == 3
+    assert telemetry.langs["de"].failed_requests == 1
+
+
+def test_does_not_retry_client_errors():
+    transport = ScriptedTransport("BadRequestError", "ok")
+    with pytest.raises(openai.APIStatusError):
+        complete(transport)
+    assert transport.calls == 1
+
+
+def test_retry_after_headers():
+    assert retry_after_seconds(make_error("RateLimitError", headers={"retry-after": "2"})) == 2.0
+    assert retry_after_seconds(make_error("RateLimitError", headers={"retry-after-ms": "250"})) == 0.25
+    assert retry_after_seconds(make_error("RateLimitError")) is None
+
+
+def test_limiter_halves_on_rate_limit_and_recovers():
+    async def run():
+        limiter = AdaptiveLimiter(8, increase_every=2)
+        await limiter.acquire()
+        await limiter.release(rate_limited=True)
+        assert limiter.limit == 4
+        await limiter.acquire()
+        await limiter.release(rate_limited=True)
+        assert limiter.limit == 2
+        for _ in range(4):
+            await limiter.acquire()
+            await limiter.release()
+        assert limiter.limit == 4
+
+    asyncio.run(run())
+
+
+def test_limiter_caps_in_flight_requests():
+    async def run():
+        limiter = AdaptiveLimiter(2)
+        peak = 0
+
+        async def task():
+            nonlocal peak
+            await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.001)
+            await limiter.release()
+
+        await asyncio.gather(*(task() for _ in range(10)))
+        return peak
+
+    assert asyncio.run(run()) == 2
@@ -0,0 +1,55 @@
+from i18n_tools.flat_index import FlatLocale, KeyTable
+from i18n_tools.locale_store import delete_nested, set_nested
+
+DATA = {"a": {"b": "1", "c": {"d": "2"}}, "e": [], "f": {}, "g": "3"}
+
+
+def test_from_nested_round_trip_and_objects():
+    flat = FlatLocale.from_nested(DATA)
+    assert dict(flat.items()) == {"a.b": "1", "a.c.d": "2", "e": [], "f": {}, "g": "3"}
+    assert flat.objects == {"a", "a.c"}
+    assert flat.to_nested() == DATA
+    assert len(flat) == 5
+
+
+def test_set_matches_set_nested():
+    cases = [("a.b.x", "new"), ("g.h", "4"), ("a", "leaf"), ("a.c", {"y": "5"}), ("z.y", "6")]
+    for path, value in cases:
+        nested = {"a": {"b": "1", "c": {"d": "2"}}, "g": "3"}
+        flat = FlatLocale.from_nested(nested)
+        set_nested(nested, path, value)
+        flat[path] = value
+        assert flat.to_nested() == nested, path
+        assert dict(flat.items()) == dict(FlatLocale.from_nested(nested).items()), path
+
+
+def test_delete_leaf_and_subtree():
+    flat = FlatLocale.from_nested(DATA)
+    del flat["a.c"]
+    assert "a.c.d" not in flat and "a.c" not in flat.objects
+    del flat["a.b"]
+    # 与嵌套 dict 不同，删空的父对象不会留下 {} 叶子
+    assert "a" not in flat
+    assert dict(flat.items()) == {"e": [], "f": {}, "g": "3"}
+    nested = {"a": {"b": "1"}}
+    delete_nested(nested, "a.b")
+    assert nested == {"a": {}}
+
+
+def test_deleted_key_returns_to_its_position():
+    flat = FlatLocale.from_nested({"x": "1", "y": "2", "z": "3"})
+    del flat["x"]
+    flat["w"] = "0"
+    flat["x"] = "1"
+    assert list(flat) == ["x", "y", "z", "w"]
+
+
+def test_shared_table_reverse_index_and_equal_to():
+    table = KeyTable()
+    en = FlatLocale.from_nested({"a": "Copy", "b": "Paste", "c": "Copy"}, table)
+    de = FlatLocale.from_nested({"a": "Kopieren", "b": "Paste"}, table)
+    assert en.keys_for("Copy") == ["a", "c"]
+    en["c"] = "Cut"
+    assert en.keys_for("Copy") == ["a"]
+    assert de.equal_to(en) == ["b"]
+    assert len(table) == 3
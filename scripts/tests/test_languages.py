@@ -0,0 +1,19 @@
+import os
+import re
+
+from i18n_tools.languages import LANGUAGE_NAMES, SUPPORTED_LANGUAGES
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+
+
+def test_matches_shared_const_and_locale_files():
+    with open(os.path.join(ROOT, "shared/const.ts"), encoding="utf-8") as f:
+        match = re.search(r"SUPPORTED_LANGUAGES = \[([^\]]*)\]", f.read())
+    assert tuple(re.findall(r"'([^']+)'", match.group(1))) == SUPPORTED_LANGUAGES
+    locales = os.path.join(ROOT, "client/src/i18n/locales")
+    assert {name[: -len(".json")] for name in os.listdir(locales) if name.endswith(".json")} == set(LANGUAGE_NAMES)
+
+
+def test_translate_targets_use_the_shared_names(translate_i18n):
+    assert set(translate_i18n.LANG_NAMES) <= set(SUPPORTED_LANGUAGES)
+    assert all(LANGUAGE_NAMES[lang] == name for lang, name in translate_i18n.LANG_NAMES.items())
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from i18n_tools import LocaleStore
+from i18n_tools.lint import lint_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    for lang, data in {"en": {"a": "Hi {{name}}", "b": "<1>Go</1>"}, "de": {"a": "Hallo {{user}}", "c": "x"}}.items():
+        (tmp_path / f"{lang}.json").write_text(json.dumps(data), encoding="utf-8")
+    return LocaleStore(str(tmp_path))
+
+
+def test_lint_store_codes(store):
+    report = lint_store(store)
+    assert sorted((issue.key, issue.code) for issue in report.issues) == [
+        ("a", "placeholder_mismatch"), ("b", "missing_key"), ("c", "extra_key"),
+    ]
+    assert len(report.errors) == 2 and len(report.warnings) == 1
+
+
+def test_lint_store_rejects_unknown_langs(store):
+    with pytest.raises(ValueError, match="xx"):
+        lint_store(store, langs=["de", "xx"])
+
+
+def test_lint_locales_reports_usage_error(lint_locales, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        lint_locales.main(["--lang", "xx"])
+    assert exit_info.value.code == 2
+    assert "xx" in capsys.readouterr().err
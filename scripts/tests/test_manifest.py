@@ -0,0 +1,59 @@
+from i18n_tools.manifest import FALLBACK, HUMAN, Manifest, text_hash
+
+EN = {"pay.alipay": "Alipay", "pay.card": "Card", "checkout.copy": "Copy", "checkout.title": "Checkout"}
+DE = {"pay.alipay": "Alipay", "pay.card": "Karte", "checkout.copy": "Copy", "checkout.title": "Kasse"}
+HASHES = {key: text_hash(value) for key, value in EN.items()}
+
+
+def test_bootstrap_keeps_values_equal_to_english(tmp_path):
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    manifest.bootstrap("de", EN, DE)
+    assert {provenance for _, provenance in manifest.langs["de"].values()} == {HUMAN}
+    assert manifest.delta("de", HASHES) == ([], [])
+
+
+def test_bootstrap_fallback_only_for_listed_keys(tmp_path):
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    manifest.bootstrap("de", EN, DE, fallback_keys=["checkout"])
+    assert manifest.entry("de", "checkout.copy")[1] == FALLBACK
+    # 列出的 section 里已经翻译过的值仍是人工译文
+    assert manifest.entry("de", "checkout.title")[1] == HUMAN
+    assert manifest.entry("de", "pay.alipay")[1] == HUMAN
+    assert manifest.delta("de", HASHES) == (["checkout.copy"], [])
+
+
+def test_manifest_save_load_round_trip(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    manifest = Manifest(path)
+    manifest.bootstrap("de", EN, DE, fallback_keys=["checkout.copy"])
+    assert manifest.save()
+    loaded = Manifest.load(path)
+    assert loaded.langs == manifest.langs
+    assert loaded.bootstrapped == {"de"}
+
+
+def test_migration_fallbacks_are_planned_for_translation(tmp_path):
+    """0003 结算页支付方式给 ar 等语言写的英文 fallback 在建立清单后进入翻译计划"""
+    from i18n_tools import LocaleStore
+    from i18n_tools.migrations import declared_fallbacks, discover
+
+    store = LocaleStore()
+    declared = declared_fallbacks(discover(), store.langs)
+    assert "checkout.copy" in declared["ar"]
+    assert "de" not in declared
+
+    en_flat = store.flat("en")
+    ar_flat = store.flat("ar")
+    untranslated = {
+        key for key in declared["ar"]
+        if isinstance(en_flat.get(key), str) and ar_flat.get(key) == en_flat[key]
+    }
+    assert len(untranslated) > 30
+
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    manifest.bootstrap("ar", en_flat, ar_flat, declared["ar"])
+    hashes = {key: text_hash(value) for key, value in en_flat.items() if isinstance(value, str)}
+    pending, _ = manifest.delta("ar", hashes)
+    assert untranslated <= set(pending)
+    # 迁移里给了阿拉伯语译文的 key 不受影响
+    assert all(manifest.entry("ar", key)[1] == HUMAN for key in ar_flat if key not in declared["ar"] and key in hashes)
@@ -0,0 +1,119 @@
+"""语言迁移：在临时语言目录上应用，检查冲突和翻译来源清单登记"""
+import json
+
+import pytest
+
+from i18n_tools import LocaleStore
+from i18n_tools.manifest import FALLBACK, HUMAN, Manifest
+from i18n_tools.migrations import Journal, MigrationConflict, Plan, declared_fallbacks, discover
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def locales(tmp_path):
+    directory = tmp_path / "locales"
+    directory.mkdir()
+    write_json(directory / "en.json", {"common": {"service": "Service"}, "checkout": {"title": "Checkout"}})
+    write_json(directory / "zh.json", {"common": {"service": "服务"}, "checkout": {"title": "结算"}})
+    # ar 的 copy 是手工改过的译文，不在任何迁移里
+    write_json(directory / "ar.json", {"common": {"service": "خدمة"}, "checkout": {"title": "الدفع", "copy": "نسخ"}})
+    return directory
+
+
+def migrations_dir(tmp_path, *migrations):
+    directory = tmp_path / "migrations"
+    directory.mkdir()
+    for i, ops in enumerate(migrations):
+        write_json(directory / f"{i:04d}_m{i}.json", {"description": f"m{i}", "ops": ops})
+    return directory
+
+
+PAYMENT = {
+    "op": "setdefault",
+    "section": "checkout",
+    "values": {"en": {"copy": "Copy", "alipay": "Alipay"}, "zh": {"copy": "复制", "alipay": "支付宝"}},
+    "fallback": ["ar"],
+}
+
+
+def test_apply_records_fallback_and_human_provenance(tmp_path, locales):
+    store = LocaleStore(str(locales))
+    plan = Plan(discover(str(migrations_dir(tmp_path, [PAYMENT]))), store.langs)
+    manifest = Manifest(str(tmp_path / "manifest.json"))
+    with store.transaction() as tx:
+        plan.apply(tx, manifest)
+
+    reloaded = LocaleStore(str(locales))
+    assert reloaded.get("zh", "checkout.copy") == "复制"
+    assert reloaded.get("ar", "checkout.alipay") == "Alipay"
+    # setdefault 不覆盖迁移之外改过的值
+    assert reloaded.get("ar", "checkout.copy") == "نسخ"
+
+    manifest = Manifest.load(str(tmp_path / "manifest.json"))
+    assert manifest.entry("zh", "checkout.copy")[1] == HUMAN
+    assert manifest.entry("ar", "checkout.alipay")[1] == FALLBACK
+    assert manifest.entry("ar", "checkout.copy") is None
+    assert manifest.entry("en", "checkout.copy") is None
+
+
+def test_conflicting_writes_abort_before_touching_disk(tmp_path, locales):
+    before = {path.name: path.read_text(encoding="utf-8") for path in locales.iterdir()}
+    directory = migrations_dir(
+        tmp_path,
+        [{"op": "set", "key": "common.service", "values": {"zh": "客户服务"}}],
+        [{"op": "set", "key": "common.service", "values": {"zh": "客服"}}],
+    )
+    store = LocaleStore(str(locales))
+    plan = Plan(discover(str(directory)), store.langs)
+    assert [(lang, key, tag, other) for lang, key, tag, _, _, other, _ in plan.conflicts] == [
+        ("zh", "common.service", "0000_m0", "0001_m1")
+    ]
+    with pytest.raises(MigrationConflict):
+        with store.transaction() as tx:
+            plan.apply(tx)
+    assert {path.name: path.read_text(encoding="utf-8") for path in locales.iterdir()} == before
+
+
+def test_parent_and_child_writes_conflict(tmp_path, locales):
+    directory = migrations_dir(
+        tmp_path,
+        [{"op": "set", "key": "checkout", "values": {"en": {"title": "Pay"}}}],
+        [{"op": "set", "key": "checkout.title", "values": {"en": "Checkout now"}}],
+    )
+    plan = Plan(discover(str(directory)), LocaleStore(str(locales)).langs)
+    assert [(lang, key, other_key) for lang, key, _, _, other_key, _, _ in plan.conflicts] == [
+        ("en", "checkout", "checkout.title")
+    ]
+
+
+def test_identical_writes_are_not_conflicts(tmp_path, locales):
+    write = {"op": "set", "key": "common.service", "values": {"zh": "客户服务"}}
+    plan = Plan(discover(str(migrations_dir(tmp_path, [write], [write]))), LocaleStore(str(locales)).langs)
+    assert plan.conflicts == []
+
+
+def test_cli_reports_conflict_and_leaves_journal_alone(tmp_path, locales, migrate_locales, monkeypatch, capsys):
+    monkeypatch.setattr(migrate_locales, "LocaleStore", lambda: LocaleStore(str(locales)))
+    directory = migrations_dir(
+        tmp_path,
+        [{"op": "set", "key": "common.service", "values": {"zh": "客户服务"}}],
+        [{"op": "delete", "key": "common.service", "langs": ["zh"]}],
+    )
+    code = migrate_locales.main(["--dir", str(directory), "--manifest", str(tmp_path / "manifest.json")])
+    assert code == 1
+    assert "冲突" in capsys.readouterr().out
+    assert Journal.load(str(directory / "meta" / "_journal.json")).entries == {}
+    assert LocaleStore(str(locales)).get("zh", "common.service") == "服务"
+
+
+def test_declared_fallbacks_drop_keys_overwritten_later(tmp_path, locales):
+    directory = migrations_dir(
+        tmp_path,
+        [PAYMENT],
+        [{"op": "set", "key": "checkout.alipay", "values": {"ar": "أليباي"}}],
+    )
+    declared = declared_fallbacks(discover(str(directory)), LocaleStore(str(locales)).langs)
+    assert declared == {"ar": {"checkout.copy"}}
@@ -0,0 +1,54 @@
+from i18n_tools.parsing import parse_fanout, parse_translation, salvage_pairs, strip_code_fence
+
+EN = {"cart.add": "Add to cart", "cart.count": "{{count}} items", "cart.empty": "Your cart is empty"}
+
+
+def test_strip_code_fence():
+    assert strip_code_fence('```json\n{"a": "b"}\n```') == '{"a": "b"}'
+    assert strip_code_fence('  {"a": "b"}  ') == '{"a": "b"}'
+
+
+def test_valid_json_with_explanation_around_it():
+    text = 'Here you go:\n{"cart.add": "In den Warenkorb", "cart.count": "{{count}} Artikel", ' \
+           '"cart.empty": "Warenkorb ist leer"}\nHope this helps.'
+    valid, missing = parse_translation(text, EN)
+    assert valid == {"cart.add": "In den Warenkorb", "cart.count": "{{count}} Artikel", "cart.empty": "Warenkorb ist leer"}
+    assert missing == set()
+
+
+def test_truncated_output_keeps_complete_pairs():
+    text = '{"cart.add": "In den Warenkorb", "cart.count": "{{count}} Artikel", "cart.empty": "Warenk'
+    valid, missing = parse_translation(text, EN)
+    assert valid == {"cart.add": "In den Warenkorb", "cart.count": "{{count}} Artikel"}
+    assert missing == {"cart.empty"}
+
+
+def test_broken_quote_salvages_remaining_pairs():
+    # 第一个值少了右引号，整体 JSON 解析失败：被吞掉的 key 重新请求，后面完好的键值对仍能找回
+    text = '{"cart.add": "In den Warenkorb, "cart.count": "{{count}} Artikel", "cart.empty": "Leer"}'
+    valid, missing = parse_translation(text, EN)
+    assert valid["cart.empty"] == "Leer"
+    assert missing == {"cart.count"}
+
+
+def test_rejects_placeholder_changes_empty_values_and_unknown_keys():
+    text = '{"cart.add": "  ", "cart.count": "{count} Artikel", "cart.empty": "Leer", "other": "x"}'
+    valid, missing = parse_translation(text, EN)
+    assert valid == {"cart.empty": "Leer"}
+    assert missing == {"cart.add", "cart.count"}
+
+
+def test_salvage_pairs_decodes_escapes():
+    assert salvage_pairs('garbage "a": "x \\"y\\"" more "b": "\\u00e9"') == {"a": 'x "y"', "b": "é"}
+
+
+def test_parse_fanout_counts_missing_translations():
+    text = '{"cart.add": {"de": "In den Warenkorb", "fr": ""}, "cart.count": {"de": "{{count}} Artikel", ' \
+           '"fr": "{{count}} articles"}, "cart.empty": {"de": "Le'
+    valid, missing = parse_fanout(text, EN, ("de", "fr"))
+    assert valid == {
+        "de": {"cart.add": "In den Warenkorb", "cart.count": "{{count}} Artikel"},
+        "fr": {"cart.count": "{{count}} articles"},
+    }
+    # fr 的空值 1 条 + 截断的 cart.empty 两个语言 2 条
+    assert missing == 3
@@ -0,0 +1,62 @@
+import json
+import sqlite3
+
+from i18n_tools import LocaleStore
+from i18n_tools.db import Database
+from i18n_tools.product_sync import strip_synced, sync_products
+
+
+def make_store(tmp_path, locales):
+    locales_dir = tmp_path / "locales"
+    locales_dir.mkdir()
+    for lang, data in locales.items():
+        (locales_dir / f"{lang}.json").write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return LocaleStore(str(locales_dir))
+
+
+def make_db(tmp_path, rows):
+    path = tmp_path / "shop.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE products (id integer primary key, slug text, name text not null, "
+        "shortDescription text, description text)"
+    )
+    conn.executemany("INSERT INTO products (id, slug, name) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return f"sqlite:///{path}"
+
+
+def test_conflicting_entries_stay_in_locale_files(tmp_path):
+    store = make_store(tmp_path, {
+        "en": {"products": {"1": {"name": "Ring"}, "2": {"name": "Necklace"}}},
+        "de": {"products": {"1": {"name": "Ring"}, "2": {"name": "Halskette"}}},
+    })
+    url = make_db(tmp_path, [(1, "ring", json.dumps({"en": "Ring"})), (2, "necklace", json.dumps({"de": "Kette"}))])
+    state = {}
+    with Database(url) as db:
+        report = sync_products(store, db, state)
+        names = dict(db.fetchall("SELECT id, name FROM products"))
+
+    assert report.synced_keys == ["1"]
+    assert report.conflicted_keys == ["2"]
+    assert report.conflicts == {"2.name": ["de"]}
+    assert "2" not in state
+    # 不冲突的语言照常合并，冲突的语言保留数据库里的值
+    assert json.loads(names[2]) == {"de": "Kette", "en": "Necklace"}
+
+    with store.transaction() as tx:
+        strip_synced(tx, report.synced_keys)
+    assert list(store.data("de")["products"]) == ["2"]
+    assert list(store.data("en")["products"]) == ["2"]
+
+
+def test_prefer_locale_resolves_conflicts(tmp_path):
+    store = make_store(tmp_path, {"de": {"products": {"2": {"name": "Halskette"}}}})
+    url = make_db(tmp_path, [(2, "necklace", json.dumps({"de": "Kette"}))])
+    with Database(url) as db:
+        report = sync_products(store, db, {}, prefer_locale=True)
+        name = db.fetchall("SELECT name FROM products WHERE id = 2")[0][0]
+    assert report.synced_keys == ["2"]
+    assert report.conflicted_keys == []
+    assert json.loads(name) == {"de": "Halskette"}
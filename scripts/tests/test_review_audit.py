@@ -0,0 +1,94 @@
+import sqlite3
+
+from i18n_tools.db import Database
+from i18n_tools.review_audit import audit_chunk, audit_reviews, classify_review, latin_language, write_chunk
+from i18n_tools.script_detect import histograms
+
+REVIEWS = [
+    (1, "en", "Beautiful", "The bracelet arrived quickly and the quality is beautiful, I love it"),
+    (2, "de", "Wunderschön", "Das Armband ist wunderschön und die Qualität ist sehr gut"),
+    # 声明为英文，实际是德语
+    (3, "en", "Sehr schön", "Die Kette ist wunderschön und ich bin sehr zufrieden mit der Qualität"),
+    # 声明为日语，实际是中文
+    (4, "ja", "很好", "这个手链非常漂亮，质量很好，包装也很精美，物流很快，推荐购买"),
+    # 声明为泰语，文字和语言都推断不出来
+    (5, "th", "OK", "Great, thanks"),
+    (6, "xx", "Nice", "Nice bracelet"),
+    (7, "fr", "Magnifique", "Le bracelet est très beau, qualité magnifique"),
+]
+
+
+def test_latin_language():
+    assert latin_language("Das Armband ist wunderschön und die Qualität ist sehr gut") == "de"
+    assert latin_language("Sản phẩm rất đẹp và chất lượng tốt") == "vi"
+    # 词太少或没有明显领先时不下结论
+    assert latin_language("Nice bracelet") is None
+    assert latin_language("") is None
+
+
+def test_classify_review():
+    def classify(declared, text):
+        return classify_review(declared, text, histograms([text])[0])
+
+    assert classify("de", REVIEWS[1][3]) is None
+    assert classify("en", REVIEWS[2][3]) == ("wrong_language", "de", "latin", 1.0)
+    assert classify("th", REVIEWS[4][3]) == ("wrong_script", None, "latin", 1.0)
+    assert classify("ja", "这个手链非常漂亮，质量很好，包装也很精美，物流很快")[:2] == ("no_kana", "zh")
+    assert classify("ko", "这个手链非常漂亮")[:2] == ("wrong_script", "zh")
+
+
+def test_audit_chunk():
+    first_id, last_id, findings, unchecked = audit_chunk(REVIEWS)
+    assert (first_id, last_id, unchecked) == (1, 7, 1)
+    assert [(review_id, code, detected) for review_id, _, code, detected, _, _ in findings] == [
+        (3, "wrong_language", "de"),
+        (4, "no_kana", "zh"),
+        (5, "wrong_script", None),
+    ]
+
+
+def make_db(tmp_path):
+    path = tmp_path / "reviews.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE reviews (id integer primary key, language text, title text, comment text)")
+    conn.execute(
+        "CREATE TABLE review_language_audits (id integer primary key, reviewId integer, declared text, "
+        "detected text, code text, script text, share integer, fixed integer)"
+    )
+    conn.executemany("INSERT INTO reviews VALUES (?, ?, ?, ?)", REVIEWS)
+    conn.commit()
+    conn.close()
+    return f"sqlite:///{path}"
+
+
+def audits(db):
+    return db.fetchall("SELECT reviewId, code, detected, fixed FROM review_language_audits ORDER BY reviewId")
+
+
+def test_write_chunk_is_idempotent(tmp_path):
+    url = make_db(tmp_path)
+    first_id, last_id, findings, _ = audit_chunk(REVIEWS)
+    with Database(url) as db:
+        write_chunk(db, first_id, last_id, findings)
+        once = audits(db)
+        write_chunk(db, first_id, last_id, findings)
+        assert audits(db) == once
+        assert [row[0] for row in once] == [3, 4, 5]
+        # 没有 fix 时不改评价
+        assert db.fetchall("SELECT language FROM reviews WHERE id = 3") == [("en",)]
+
+
+def test_fix_rewrites_only_inferred_languages(tmp_path):
+    url = make_db(tmp_path)
+    with Database(url) as reader, Database(url) as writer:
+        stats = audit_reviews(reader, writer, workers=0, chunk_size=3, fix=True)
+        languages = dict(writer.fetchall("SELECT id, language FROM reviews"))
+        assert audits(writer) == [(3, "wrong_language", "de", 1), (4, "no_kana", "zh", 1), (5, "wrong_script", None, 0)]
+    assert (stats.rows, stats.chunks, stats.findings, stats.fixed, stats.unchecked) == (7, 3, 3, 2, 1)
+    assert languages == {1: "en", 2: "de", 3: "de", 4: "zh", 5: "th", 6: "xx", 7: "fr"}
+
+    # 修正后的评价下次审计时随区间清掉
+    with Database(url) as reader, Database(url) as writer:
+        stats = audit_reviews(reader, writer, workers=0, chunk_size=3, fix=True)
+        assert audits(writer) == [(5, "wrong_script", None, 0)]
+    assert stats.fixed == 0
@@ -0,0 +1,45 @@
+from i18n_tools.script_detect import HAN, LATIN, check_items, classify, histograms
+
+
+def test_histograms_count_letters_per_string_and_skip_markup():
+    texts = [
+        "{{count}} items <b>x</b> https://shop.example.com/cart mail me@shop.com",
+        "这个手链非常漂亮",
+        "",
+        "Москва 2024",
+    ]
+    assert histograms(texts) == [{LATIN: 10}, {HAN: 8}, {}, {"cyrillic": 6}]
+
+
+def test_histograms_do_not_leak_across_strings():
+    # 分隔符本身出现在文本里时不会把一个字符串拆成两段
+    assert histograms(["ab\x1fcd", "日本"]) == [{LATIN: 4}, {HAN: 2}]
+
+
+def test_classify_weights_han_over_latin():
+    assert classify("en", {LATIN: 6, HAN: 4}) == ("wrong_script", HAN, 4 * 3 / (6 + 4 * 3))
+    assert classify("zh", {LATIN: 6, HAN: 4}) is None
+
+
+def test_classify_ignores_short_and_unknown():
+    assert classify("ja", {LATIN: 3}) is None
+    assert classify("xx", {LATIN: 40}) is None
+    # 拉丁字母语言之间无法靠文字区分
+    assert classify("de", {LATIN: 40}) is None
+
+
+def test_classify_japanese_without_kana():
+    assert classify("ja", {HAN: 16}) == ("no_kana", HAN, 1.0)
+    # 纯汉字的短标题在日语里很常见
+    assert classify("ja", {HAN: 6}) is None
+    assert classify("ja", {HAN: 20, "kana": 2}) is None
+
+
+def test_check_items_reports_english_fallbacks():
+    findings = check_items([
+        ("locales", "th", "checkout.copy", "Copy account number"),
+        ("locales", "th", "checkout.title", "ชำระเงิน"),
+        ("locales", "zh", "checkout.paypal_desc", "PayPal 在线支付"),
+    ])
+    assert [(f.lang, f.key, f.code, f.script) for f in findings] == [("th", "checkout.copy", "wrong_script", LATIN)]
+    assert findings[0].message == "100% latin, expected thai"
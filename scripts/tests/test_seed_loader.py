@@ -0,0 +1,27 @@
+import sqlite3
+
+import pytest
+
+from i18n_tools import seed_loader
+from i18n_tools.db import Database
+from i18n_tools.seed_loader import SeedLoader
+
+
+def test_worker_keeps_draining_when_rollback_fails(tmp_path, monkeypatch, time_limit):
+    path = tmp_path / "seed.db"
+    sqlite3.connect(path).close()
+
+    def broken_rollback(self):
+        raise sqlite3.OperationalError("connection lost")
+
+    monkeypatch.setattr(Database, "rollback", broken_rollback)
+    monkeypatch.setattr(seed_loader, "QUEUE_DEPTH", 1)
+    loader = SeedLoader(f"sqlite:///{path}", batch_rows=1)
+    statements = [f"INSERT INTO `missing` (`id`) VALUES ({i});" for i in range(10)]
+    time_limit(5.0)
+    with pytest.raises(sqlite3.OperationalError, match="no such table"):
+        try:
+            for text in statements:
+                loader.feed(text)
+        finally:
+            loader.finish()
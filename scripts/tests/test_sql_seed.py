@@ -0,0 +1,63 @@
+import io
+
+import pytest
+
+from i18n_tools.sql_seed import InsertStatement, StatementReader, split_insert
+
+# 元组不完整匹配时旧的嵌套量词正则会指数级回溯
+BARRIERS = [
+    "INSERT INTO t (a) VALUES (100000, 100001, 100002, 100003, 100004, 'txt') ON DUPLICATE KEY UPDATE a=VALUES(a);",
+    "INSERT INTO t (a, b, c, d) VALUES (1, 2, 3, CONCAT('x','y'));",
+    "INSERT INTO t (a, b, c, d, e) VALUES (1000000, 2000000, 3000000, 4000000, CONCAT('x', 'y', 'z'));",
+]
+
+
+@pytest.mark.parametrize("sql", BARRIERS)
+def test_split_insert_rejects_barriers_quickly(sql, time_limit):
+    time_limit(1.0)
+    assert split_insert(sql) is None
+
+
+def test_split_insert_keeps_tuple_text():
+    sql = "INSERT IGNORE INTO `t` (`a`, `b`) VALUES (1, 'it''s; (x)'), (2, NOW()) ;\n"
+    head, table, columns, tuples = split_insert(sql)
+    assert head == "INSERT IGNORE INTO "
+    assert table == "t"
+    assert columns == ["a", "b"]
+    assert tuples == ["(1, 'it''s; (x)')", "(2, NOW())"]
+
+
+def test_insert_statement_round_trip():
+    sql = "INSERT INTO `products` (`id`, `name`) VALUES (1, 'a\\'b'), (2, NULL) ON DUPLICATE KEY UPDATE name=VALUES(name);"
+    stmt = InsertStatement.parse(sql)
+    first, second = stmt.rows
+    assert stmt.get(first, "name") == "a'b"
+    assert stmt.get(second, "name") is None
+    assert stmt.trailer.startswith("ON DUPLICATE KEY UPDATE")
+    stmt.set(second, "name", "c\nd")
+    again = InsertStatement.parse(stmt.render())
+    assert [again.get(row, "name") for row in again.rows] == ["a'b", "c\nd"]
+    assert again.trailer == stmt.trailer
+
+
+def test_statement_reader_splits_across_chunks():
+    sql = "-- note; here\nINSERT INTO t (a) VALUES ('x;y');\n/* ; */ SELECT 1;\nINSERT INTO t (a) VALUES (\"q\"\"\")"
+    statements = list(StatementReader(io.StringIO(sql), chunk_size=3))
+    assert "".join(statements) == sql
+    assert len(statements) == 3
+    assert statements[0].endswith("VALUES ('x;y');")
+
+
+def test_seed_transformer_rewrites_reviews_by_row_language():
+    from i18n_tools.compliance import Glossary
+    from i18n_tools.sql_seed import SeedTransformer
+
+    glossary = Glossary({"zh": {"开光": "启蕴"}, "en": {"temple": "heritage site"}})
+    sql = (
+        "INSERT INTO `reviews` (`id`, `language`, `title`, `comment`) VALUES "
+        "(1, 'en', 'Lovely temple', 'From the temple'), (2, 'fr', 'Le temple', '开光 ok'), (3, 'zh', '开光', NULL);"
+    )
+    stmt = InsertStatement.parse(SeedTransformer(rewriter=glossary).transform(sql))
+    rows = [[stmt.get(row, column) for column in ("title", "comment")] for row in stmt.rows]
+    # fr 不套用 en 表，zh 表对所有语言生效
+    assert rows == [["Lovely heritage site", "From the heritage site"], ["Le temple", "启蕴 ok"], ["启蕴", None]]
@@ -0,0 +1,55 @@
+from i18n_tools.batching import FanoutBatch, estimate_fanout
+from i18n_tools.telemetry import Telemetry, split_total
+
+
+def test_split_total_keeps_the_sum():
+    assert split_total(10, {"a": 1, "b": 1, "c": 1}) == {"a": 4, "b": 3, "c": 3}
+    assert split_total(7, {"a": 0, "b": 0}) == {"a": 4, "b": 3}
+    parts = split_total(1001, {"de": 1.4, "hi": 3.5, "th": 3.0})
+    assert sum(parts.values()) == 1001
+    assert parts["de"] < parts["th"] < parts["hi"]
+
+
+def test_fanout_request_is_reported_per_language(tmp_path):
+    batch = FanoutBatch(("de", "hi"))
+    for key, text in {"a": "Hello world", "b": "Add to cart"}.items():
+        batch.add(key, text, *estimate_fanout(key, text, batch.langs))
+    telemetry = Telemetry(model="gpt-4.1-mini")
+    telemetry.request(lang="de", latency=0.5, input_tokens=100, output_tokens=50)
+    telemetry.request(langs=list(batch.langs), latency=1.0, input_tokens=300, output_tokens=900,
+                      shares=batch.shares())
+
+    assert set(telemetry.langs) == {"de", "hi"}
+    de, hi = telemetry.langs["de"], telemetry.langs["hi"]
+    assert de.requests == 2 and hi.requests == 1
+    assert de.input_tokens - 100 + hi.input_tokens == 300
+    assert de.output_tokens - 50 + hi.output_tokens == 900
+    assert hi.output_tokens > de.output_tokens - 50
+    assert hi.latencies == [1.0]
+
+    total = telemetry.total()
+    assert total.requests == 2
+    assert (total.input_tokens, total.output_tokens) == (400, 950)
+    assert abs(total.cost(telemetry.prices) - de.cost(telemetry.prices) - hi.cost(telemetry.prices)) < 1e-12
+
+    path = tmp_path / "metrics.prom"
+    telemetry.write_prometheus(str(path))
+    metrics = path.read_text()
+    assert 'lang="fanout"' not in metrics
+    assert f'i18n_translate_tokens_total{{lang="hi",direction="output"}} {hi.output_tokens}' in metrics
+
+
+def test_failed_language_never_reports_negative_api_keys(tmp_path):
+    telemetry = Telemetry(model="gpt-4.1-mini")
+    # 记忆命中 3 个、检查点恢复 2 个，请求失败后整个语言没有写回
+    telemetry.language("de", keys=10, cache_hits=3, restored=2, translated=0, seconds=1.0, error="boom")
+    telemetry.language("fr", keys=10, cache_hits=3, restored=2, translated=9, seconds=1.0)
+    assert telemetry.langs["de"].api_keys == 0
+    assert telemetry.langs["fr"].api_keys == 4
+    assert telemetry.total().api_keys == 4
+
+    path = tmp_path / "metrics.prom"
+    telemetry.write_prometheus(str(path))
+    metrics = path.read_text()
+    assert 'i18n_translate_keys_total{lang="de",source="api"} 0' in metrics
+    assert 'i18n_translate_keys_total{lang="fr",source="api"} 4' in metrics
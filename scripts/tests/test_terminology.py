@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+from i18n_tools.batching import FanoutBatch, estimate_fanout
+from i18n_tools.engine import TranslationEngine
+from i18n_tools.terminology import Terminology
+from i18n_tools.transport import FakeTransport, apply_glossary
+
+ENTRIES = [
+    {"en": ["Qi-Yun Ceremony"], "de": ["Qi-Yun-Zeremonie"], "fr": ["cérémonie Qi-Yun"]},
+    {"en": ["Feng Shui"], "de": ["Feng-Shui"]},
+]
+TEXTS = {"a": "Book a Qi-Yun Ceremony", "b": "Feng Shui reading", "c": "Plain text"}
+
+
+def rule_json(rule):
+    return json.loads(rule[rule.index("{"):])
+
+
+def test_required_only_keeps_terms_with_target_forms():
+    terminology = Terminology(ENTRIES)
+    assert terminology.required(TEXTS, ("fr",)) == {"a": {0: "Qi-Yun Ceremony"}}
+    assert terminology.required(TEXTS, ("de",)) == {"a": {0: "Qi-Yun Ceremony"}, "b": {1: "Feng Shui"}}
+
+
+def test_prompt_rule_shape_follows_prompt_kind():
+    terminology = Terminology(ENTRIES)
+    required = terminology.required(TEXTS, ("de",))
+    terms = terminology.prompt_terms(required, ("de",))
+    assert rule_json(terminology.prompt_rule(terms, ("de",))) == {"Feng Shui": "Feng-Shui", "Qi-Yun Ceremony": "Qi-Yun-Zeremonie"}
+    # fan-out 批次只剩一个语言时仍按语言分组
+    assert rule_json(terminology.prompt_rule(terms, ("de",), fanout=True)) == {
+        "Feng Shui": {"de": "Feng-Shui"}, "Qi-Yun Ceremony": {"de": "Qi-Yun-Zeremonie"},
+    }
+
+
+def test_violations_accept_inflected_forms():
+    terminology = Terminology(ENTRIES)
+    required = terminology.required(TEXTS, ("de",))
+    translated = {"a": "Eine Qi-Yun-Zeremonien buchen", "b": "Lesung"}
+    assert terminology.violations(required, translated, "de") == {"b": ["Feng Shui"]}
+
+
+def test_apply_glossary_accepts_both_shapes():
+    assert apply_glossary("a feng shui room", {"Feng Shui": "Feng-Shui"}) == "a Feng-Shui room"
+    assert apply_glossary("a feng shui room", {"Feng Shui": {"de": "Feng-Shui"}}, "de") == "a Feng-Shui room"
+    assert apply_glossary("a feng shui room", {"Feng Shui": "Feng-Shui"}, "de") == "a Feng-Shui room"
+    assert apply_glossary("a feng shui room", {"Feng Shui": {"de": "Feng-Shui"}}, "fr") == "a feng shui room"
+
+
+class RecordingJob:
+    def __init__(self):
+        self.saved = {}
+
+    def save(self, translations):
+        self.saved.update(translations)
+
+
+def test_single_language_fanout_batch_with_glossary(translate_i18n):
+    terminology = Terminology(ENTRIES)
+    batch = FanoutBatch(("de",))
+    for key, text in TEXTS.items():
+        batch.add(key, text, *estimate_fanout(key, text, batch.langs))
+    jobs = {"de": RecordingJob()}
+
+    async def run():
+        async with TranslationEngine(transport=FakeTransport(latency=0, jitter=0)) as engine:
+            await translate_i18n.translate_fanout_batch(engine, batch, jobs, terminology=terminology)
+
+    asyncio.run(run())
+    assert jobs["de"].saved == {
+        "Book a Qi-Yun Ceremony": "[de] Book a Qi-Yun-Zeremonie",
+        "Feng Shui reading": "[de] Feng-Shui reading",
+        "Plain text": "[de] Plain text",
+    }
@@ -0,0 +1,112 @@
+"""translate-i18n.py 整条流水线：临时语言目录 + fake / record / replay transport，不联网"""
+import functools
+import json
+
+import pytest
+
+from i18n_tools import LocaleStore
+from i18n_tools import transport as transport_module
+from i18n_tools.checkpoint import Checkpoint
+from i18n_tools.manifest import MACHINE, Manifest
+
+EN = {
+    "cart": {"add": "Add to cart", "count": "{{count}} items", "again": "Add to cart"},
+    "ritual": {"title": "Book a Qi-Yun Ceremony"},
+    "brand": "Alipay",
+}
+GLOSSARY = [{"en": ["Qi-Yun Ceremony"], "de": ["Qi-Yun-Zeremonie"], "fr": ["cérémonie Qi-Yun"]}]
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch, translate_i18n):
+    locales = tmp_path / "locales"
+    locales.mkdir()
+    for lang in ["en", *translate_i18n.LANG_NAMES]:
+        # 其他语言只有品牌名，与英文相同但属于人工译文
+        data = EN if lang == "en" else {"brand": "Alipay"}
+        (locales / f"{lang}.json").write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    (tmp_path / "glossary.json").write_text(json.dumps(GLOSSARY, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(translate_i18n, "LocaleStore", functools.partial(LocaleStore, str(locales)))
+    monkeypatch.setattr(translate_i18n, "Checkpoint", functools.partial(Checkpoint, directory=str(tmp_path / "ckpt")))
+    monkeypatch.delenv("I18N_TRANSPORT", raising=False)
+    return tmp_path
+
+
+def run(translate_i18n, workspace, transport, *extra):
+    translate_i18n.main([
+        "--transport", transport, "--no-cache", "--manifest", str(workspace / "manifest.json"),
+        "--glossary", str(workspace / "glossary.json"), *extra,
+    ])
+    return {lang: LocaleStore(str(workspace / "locales")).data(lang) for lang in translate_i18n.LANG_NAMES}
+
+
+def test_fake_run_translates_every_language(translate_i18n, workspace):
+    result = run(translate_i18n, workspace, "fake:latency=0,jitter=0")
+    assert result["de"] == {
+        "brand": "Alipay",
+        "cart": {"add": "[German] Add to cart", "count": "[German] {{count}} items", "again": "[German] Add to cart"},
+        "ritual": {"title": "[German] Book a Qi-Yun-Zeremonie"},
+    }
+    # 术语表里没有泰语译法，原文不动
+    assert result["th"]["ritual"]["title"] == "[Thai] Book a Qi-Yun Ceremony"
+    manifest = Manifest.load(str(workspace / "manifest.json"))
+    assert manifest.entry("de", "cart.add")[1] == MACHINE
+    assert manifest.entry("de", "brand")[1] != MACHINE
+    assert not (workspace / "ckpt").exists() or not any((workspace / "ckpt").iterdir())
+
+
+def test_second_run_has_nothing_to_do(translate_i18n, workspace, capsys):
+    run(translate_i18n, workspace, "fake:latency=0,jitter=0")
+    capsys.readouterr()
+    run(translate_i18n, workspace, "fake:latency=0,jitter=0")
+    out = capsys.readouterr().out
+    assert out.count("无需翻译") == len(translate_i18n.LANG_NAMES)
+    assert "fake transport" not in out
+
+
+def test_faults_are_retried_until_complete(translate_i18n, workspace, capsys):
+    spec = "fake:latency=0,jitter=0,rate_limit=0.2,retry_after=0.001,truncate=0.2,malformed=0.2,glossary_miss=0.1,seed=7"
+    run(translate_i18n, workspace, spec)
+    assert "injected: none" not in capsys.readouterr().out
+    # 个别 key 重试次数用完时留给下一次运行（只请求剩下的 key）
+    result = run(translate_i18n, workspace, spec)
+    assert "失败" not in capsys.readouterr().out
+    assert all(result[lang]["cart"]["count"].endswith("{{count}} items") for lang in result)
+    assert result["de"]["ritual"]["title"] == "[German] Book a Qi-Yun-Zeremonie"
+    assert result["fr"]["ritual"]["title"] == "[French] Book a cérémonie Qi-Yun"
+
+
+@pytest.mark.parametrize("fanout", ["2", "4"])
+def test_fanout_run_translates_every_language(translate_i18n, workspace, fanout, capsys):
+    result = run(translate_i18n, workspace, "fake:latency=0,jitter=0", "--fanout", fanout,
+                 "--telemetry", str(workspace / "run.jsonl"))
+    assert "错误" not in capsys.readouterr().out
+    # fan-out 的假译文用语言代码做前缀
+    assert result["de"]["ritual"]["title"] == "[de] Book a Qi-Yun-Zeremonie"
+    assert result["vi"]["cart"]["count"] == "[vi] {{count}} items"
+    events = [json.loads(line) for line in open(workspace / "run.jsonl", encoding="utf-8")]
+    assert all(event.get("lang") != "fanout" for event in events)
+
+
+def test_record_then_replay_reproduces_the_run(translate_i18n, workspace, monkeypatch, capsys):
+    recording = workspace / "run.jsonl"
+    # record: 录下 live 的请求；这里把 live 换成本地 fake，整个录制 / 回放流程不联网
+    monkeypatch.setattr(transport_module, "LiveTransport", lambda **kwargs: transport_module.FakeTransport(latency=0, jitter=0))
+    recorded = run(translate_i18n, workspace, f"record:{recording}")
+    assert "📼 recorded" in capsys.readouterr().out
+
+    for lang in translate_i18n.LANG_NAMES:
+        (workspace / "locales" / f"{lang}.json").write_text(json.dumps({"brand": "Alipay"}), encoding="utf-8")
+    (workspace / "manifest.json").unlink()
+    replayed = run(translate_i18n, workspace, f"replay:{recording}")
+    assert ", 0 not in recording" in capsys.readouterr().out
+    assert replayed == recorded
+
+
+def test_dry_run_plans_migration_fallbacks(translate_i18n, tmp_path, capsys):
+    """没有清单时，迁移声明过的英文 fallback（ar 结算页 41 个 key）计入翻译计划"""
+    translate_i18n.main(["--dry-run", "--no-cache", "--manifest", str(tmp_path / "manifest.json")])
+    out = capsys.readouterr().out
+    planned = {line.split()[0]: int(line.split()[1]) for line in out.splitlines() if line.strip().endswith("tokens") and "keys" in line}
+    assert planned["ar"] > 41
+    assert planned["de"] < planned["ar"]
@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import openai
+import pytest
+
+from i18n_tools.engine import TranslationEngine
+from i18n_tools.transport import (
+    FakeTransport, RecordTransport, ReplayMiss, ReplayTransport, create_transport, fake_translate, make_error,
+    request_key,
+)
+
+PROMPT = "Translate the following JSON key-value pairs from English to German.\n" \
+         "English texts to translate:\n" + json.dumps({"a": "Hello {{name}}", "b": "Cart"})
+
+
+def messages(text=PROMPT):
+    return [{"role": "user", "content": text}]
+
+
+def test_fake_translate_prefixes_target_language():
+    assert json.loads(fake_translate(PROMPT)) == {"a": "[German] Hello {{name}}", "b": "[German] Cart"}
+
+
+def test_create_transport_parses_specs(tmp_path):
+    fake = create_transport("fake:latency=0.1,rate_limit=0.2,seed=3")
+    assert isinstance(fake, FakeTransport) and (fake.latency, fake.rate_limit) == (0.1, 0.2)
+    replay = create_transport(f"replay:{tmp_path / 'run.jsonl'},latency=recorded")
+    assert isinstance(replay, ReplayTransport) and replay.latency == "recorded"
+    with pytest.raises(ValueError):
+        create_transport("fake:bogus=1")
+    with pytest.raises(ValueError):
+        create_transport("replay:")
+
+
+class RateLimitedOnce(FakeTransport):
+    """第一个请求返回 429，之后正常翻译"""
+
+    async def create(self, model, messages, **params):
+        if self.requests == 0:
+            self.requests += 1
+            raise make_error("RateLimitError", headers={"retry-after": "0.001"})
+        return await super().create(model, messages, **params)
+
+
+def test_record_then_replay_round_trip(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+
+    async def record():
+        recorder = RecordTransport(RateLimitedOnce(latency=0, jitter=0), path)
+        async with TranslationEngine(transport=recorder) as engine:
+            response = await engine.complete(messages(), max_tokens=500)
+            other = await engine.complete(messages(PROMPT.replace("Cart", "Checkout")), max_tokens=500)
+        return recorder.recorded, response, other
+
+    recorded, response, other = asyncio.run(record())
+    assert recorded == 3
+
+    async def replay():
+        player = ReplayTransport(path)
+        async with TranslationEngine(transport=player) as engine:
+            again = await engine.complete(messages(), max_tokens=500)
+            other_again = await engine.complete(messages(PROMPT.replace("Cart", "Checkout")), max_tokens=500)
+            with pytest.raises(ReplayMiss):
+                await engine.complete(messages("not recorded"), max_tokens=500)
+        return player, again, other_again
+
+    player, again, other_again = asyncio.run(replay())
+    assert again.choices[0].message.content == response.choices[0].message.content
+    assert other_again.choices[0].message.content == other.choices[0].message.content
+    # 同一请求录到 429 和成功两条，回放时按录制顺序先 429 再成功
+    assert (player.hits, player.misses) == (3, 1)
+    entries = [json.loads(line) for line in open(path, encoding="utf-8")]
+    assert entries[0]["error"]["type"] == "RateLimitError"
+    assert entries[0]["error"]["headers"] == {"retry-after": "0.001"}
+
+
+def test_replay_reraises_recorded_errors(tmp_path):
+    path = tmp_path / "run.jsonl"
+    key = request_key("m", messages(), {})
+    path.write_text(json.dumps({"key": key, "error": {"type": "InternalServerError", "message": "boom"}}) + "\n")
+
+    async def run():
+        player = ReplayTransport(str(path))
+        await player.open()
+        await player.create("m", messages())
+
+    with pytest.raises(openai.InternalServerError):
+        asyncio.run(run())
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from i18n_tools import LocaleStore
+from i18n_tools.lint import lint_store
+from i18n_tools.watch import LintIndex, _Poller, changed_sections, issue_diff, value_edits
+
+EN = {
+    "cart": {"add": "Add to cart", "count": "{{count}} items", "title": "<strong>Cart</strong>"},
+    "nav": {"home": "Home", "shop": "Shop"},
+}
+DE = {
+    "cart": {"add": "In den Warenkorb", "count": "{{count}} Artikel", "title": "<strong>Warenkorb</strong>"},
+    "nav": {"home": "Start"},
+}
+FR = {"cart": {"add": "", "count": "{{n}} articles", "title": "Panier"}, "nav": {"home": "Accueil", "shop": "Boutique"}}
+
+
+def write(directory, lang, data):
+    (directory / f"{lang}.json").write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def locales(tmp_path):
+    for lang, data in (("en", EN), ("de", DE), ("fr", FR)):
+        write(tmp_path, lang, data)
+    return tmp_path
+
+
+def keys(issues):
+    return sorted((issue.lang, issue.key, issue.code, issue.message) for issue in issues)
+
+
+def edit(store, index, directory, lang, data):
+    old = store.flat(lang) if lang in store else None
+    write(directory, lang, data)
+    assert store.reload(lang)
+    return index.update(lang, old)
+
+
+def assert_matches_full_lint(index, directory):
+    assert keys(index.report().issues) == keys(lint_store(LocaleStore(str(directory))).issues)
+
+
+def test_initial_index_matches_lint_store(locales):
+    index = LintIndex(LocaleStore(str(locales)))
+    assert_matches_full_lint(index, locales)
+    assert {issue.code for issue in index.issues["fr"]} == {"empty_value", "placeholder_mismatch", "html_mismatch"}
+
+
+def test_value_edit_in_base_only_rechecks_edited_keys(locales):
+    store = LocaleStore(str(locales))
+    index = LintIndex(store)
+    untouched = index.issues["fr"][0]
+    en = json.loads(json.dumps(EN))
+    en["cart"]["count"] = "{{n}} items"
+    checked = edit(store, index, locales, "en", en)
+    assert checked == ["de", "en", "fr"]
+    assert_matches_full_lint(index, locales)
+    assert untouched in index.issues["fr"]
+
+
+def test_structure_edit_in_base_rebuilds(locales):
+    store = LocaleStore(str(locales))
+    index = LintIndex(store)
+    en = json.loads(json.dumps(EN))
+    en["nav"]["about"] = "About"
+    en["cart"]["title"] = {"short": "Cart"}
+    edit(store, index, locales, "en", en)
+    assert_matches_full_lint(index, locales)
+
+
+def test_other_language_edit_and_delete(locales):
+    store = LocaleStore(str(locales))
+    index = LintIndex(store)
+    before = list(index.issues["de"])
+    de = json.loads(json.dumps(DE))
+    de["nav"]["shop"] = "Laden"
+    assert edit(store, index, locales, "de", de) == ["de"]
+    added, resolved = issue_diff(before, index.issues["de"])
+    assert added == [] and [issue.code for issue in resolved] == ["missing_key"]
+    assert_matches_full_lint(index, locales)
+
+    (locales / "fr.json").unlink()
+    old = store.flat("fr")
+    assert store.reload("fr")
+    assert index.update("fr", old) == ["fr"]
+    assert "fr" not in index.issues
+    assert_matches_full_lint(index, locales)
+
+
+def test_value_edits_and_changed_sections():
+    from i18n_tools.flat_index import FlatLocale
+
+    old = FlatLocale.from_nested(EN)
+    changed = json.loads(json.dumps(EN))
+    changed["nav"]["home"] = "Start"
+    assert value_edits(old, FlatLocale.from_nested(changed)) == {"nav.home"}
+    changed["nav"]["home"] = ["Start"]
+    assert value_edits(old, FlatLocale.from_nested(changed)) is None
+    assert value_edits(None, old) is None
+
+    new = {"cart": EN["cart"], "footer": {"x": "y"}}
+    assert changed_sections(EN, new) == {"footer": {"x": "y"}, "nav": {}}
+
+
+def test_poller_reports_changed_locale_files(locales):
+    poller = _Poller(str(locales))
+    write(locales, "de", {"nav": {"home": "Start"}})
+    (locales / ".de.json.tmp").write_text("{}", encoding="utf-8")
+    assert poller.read(0) == {"de.json"}
+    assert poller.read(0) == set()
@@ -1,55 +1,144 @@
 """
 使用 OpenAI API 批量翻译 i18n fallback key
+
+需要翻译的 key 由 scripts/translation-manifest.json 决定：新增 key、英文原文
+已变化的 key，以及仍为英文 fallback 的 key。同一语言里英文相同的 key 只翻译一次，
+译文分发回每个 key；--fanout N 时同一段英文在一个请求里翻译成 N 个语言。
+所有语言和批次并发发送（共享连接池，并发数受限并随 429 自适应调整），总耗时接近最慢的单个批次。
+
+结束时按语言打印请求数、p50/p95 延迟、token 和费用；--telemetry 把每个请求、批次、
+语言的明细写成 JSON Lines，--prometheus 写出给任务看板采集的 textfile。
+
+术语表（translation-glossary.json）按批次注入：只把这一批英文里出现的术语和目标语言译法写进 prompt，
+返回后用同一套匹配器检查译文，缺了术语的 key 单独重新请求；--no-glossary 关闭。
+
+--transport（或环境变量 I18N_TRANSPORT）切换请求的去向，便于离线调试:
+    record:/tmp/run.jsonl                 正常请求 API，同时录下每个请求和响应
+    replay:/tmp/run.jsonl,latency=recorded  按录制结果回放，不联网
+    fake:latency=0.3,rate_limit=0.05,truncate=0.1   本地假模型，按比例注入限流、截断等故障
 """
+import argparse
+import asyncio
 import json
-import os
 import sys
-from openai import OpenAI
-
-client = OpenAI()
-
-LOCALES_DIR = os.path.join(os.path.dirname(__file__), "../client/src/i18n/locales")
-
-LANG_NAMES = {
-    "ar": "Arabic",
-    "de": "German",
-    "es": "Spanish",
-    "fr": "French",
-    "hi": "Hindi",
-    "id": "Indonesian",
-    "it": "Italian",
-    "pt": "Portuguese (Brazilian)",
-    "ru": "Russian",
-    "th": "Thai",
-    "tr": "Turkish",
-    "vi": "Vietnamese",
-}
-
-def get_all_keys(obj, prefix=""):
-    keys = {}
-    for k, v in obj.items():
-        full_key = f"{prefix}.{k}" if prefix else k
-        if isinstance(v, dict):
-            keys.update(get_all_keys(v, full_key))
+import time
+
+from i18n_tools import LocaleStore
+from i18n_tools.batching import (
+    MODEL_OUTPUT_LIMIT,
+    Batch,
+    FanoutBatch,
+    compact_json,
+    dedupe_texts,
+    describe_plan,
+    plan_batches,
+    plan_fanout_batches,
+    split_batch,
+)
+from i18n_tools.engine import DEFAULT_MODEL, TranslationEngine
+from i18n_tools.languages import LANGUAGE_NAMES
+from i18n_tools.manifest import MACHINE, MANIFEST_PATH, Manifest, text_hash
+from i18n_tools.migrations import MIGRATIONS_DIR, declared_fallbacks, discover
+from i18n_tools.memory import DEFAULT_PATH as MEMORY_PATH, TranslationMemory
+from i18n_tools.checkpoint import Checkpoint
+from i18n_tools.parsing import parse_fanout, parse_translation, strip_code_fence
+from i18n_tools.telemetry import PRICES_PER_MILLION, Telemetry
+from i18n_tools.terminology import GLOSSARY_PATH, Terminology
+from i18n_tools.transport import transport_arg
+
+# 修改 prompt 或输出约定时递增，翻译记忆按此版本隔离
+PROMPT_VERSION = "3"
+
+# 由这个脚本机器翻译的语言（zh / zh-Hant / ja / ko 为人工维护）
+TARGET_LANGS = ("ar", "de", "es", "fr", "hi", "id", "it", "pt", "ru", "th", "tr", "vi")
+LANG_NAMES = {lang: LANGUAGE_NAMES[lang] for lang in TARGET_LANGS}
+
+# 每个 key 因输出损坏/缺失/缺少术语而被单独重新请求的最大次数
+MAX_KEY_RETRIES = 3
+
+def glossary_prompt(terminology, required, langs, fanout=False):
+    """批次里用到的术语写成 prompt 规则；没有用到术语时为 None"""
+    if not required:
+        return None
+    return terminology.prompt_rule(terminology.prompt_terms(required, langs), langs, fanout)
+
+def numbered_rules(glossary_rule):
+    """术语规则作为第 5 条插在"只返回 JSON"之前；返回 (插入的文本, 最后一条的序号)"""
+    if not glossary_rule:
+        return "", 5
+    return f"5. {glossary_rule}\n", 6
+
+async def translate_batch(engine: TranslationEngine, batch: Batch, save=None, attempt: int = 0, telemetry=None,
+                          terminology=None) -> dict:
+    """
+    翻译一批文本，返回成功的 {key: 译文}
+
+    模型输出损坏时保留能解析出的有效译文，只重新请求缺失或无效的 key；
+    输出被截断时把剩下的 key 拆成两半重试。每拿到一部分结果就交给 save 落盘。
+    有术语表时，译文缺少原文用到的术语的 key 也算无效；重试次数用完时保留译文并提示。
+    重试次数用完仍失败的 key 不在返回值中。
+    """
+    target_lang = batch.lang
+    required = terminology.required(batch.texts, (target_lang,)) if terminology is not None else {}
+    result_text, truncated = await request_translation(
+        engine, batch.texts, target_lang, batch.max_tokens, tags={"lang": target_lang, "keys": len(batch.texts), "round": attempt},
+        glossary_rule=glossary_prompt(terminology, required, (target_lang,)),
+    )
+    translated, missing_keys = parse_translation(result_text, batch.texts)
+    violations = terminology.violations(required, translated, target_lang) if required else {}
+    if violations:
+        if attempt < MAX_KEY_RETRIES:
+            for key in violations:
+                del translated[key]
+            missing_keys |= set(violations)
         else:
-            keys[full_key] = v
-    return keys
-
-def set_nested_value(obj, dot_path, value):
-    parts = dot_path.split(".")
-    current = obj
-    for part in parts[:-1]:
-        if part not in current:
-            current[part] = {}
-        current = current[part]
-    current[parts[-1]] = value
-
-def translate_batch(en_texts: dict, target_lang: str) -> dict:
-    """使用 AI 翻译一批文本"""
+            for key, terms in violations.items():
+                print(f"⚠️  {target_lang}: {key} 的译文缺少术语 {', '.join(terms)}（已重试 {attempt} 次，保留译文）")
+    if telemetry is not None:
+        telemetry.emit(
+            "batch",
+            lang=target_lang,
+            round=attempt,
+            keys=len(batch.texts),
+            max_tokens=batch.max_tokens,
+            translated=len(translated),
+            missing=len(missing_keys),
+            glossary_keys=len(required),
+            glossary_violations=len(violations),
+            truncated=truncated,
+        )
+    if save is not None and translated:
+        save(batch.texts, translated)
+    if not missing_keys or attempt >= MAX_KEY_RETRIES:
+        return translated
+
+    missing = {key: text for key, text in batch.texts.items() if key in missing_keys}
+    if truncated and len(missing) == 1 and not translated:
+        # 单个 key 仍被截断：用模型允许的最大输出再试一次
+        if batch.max_tokens >= MODEL_OUTPUT_LIMIT:
+            return translated
+        retry = Batch.from_texts(missing, target_lang)
+        retry.output_tokens = MODEL_OUTPUT_LIMIT
+        parts = [retry]
+    elif truncated:
+        parts = [Batch.from_texts(half, target_lang) for half in split_batch(missing)]
+    else:
+        parts = [Batch.from_texts(missing, target_lang)]
+
+    for result in await asyncio.gather(
+        *(translate_batch(engine, part, save, attempt + 1, telemetry, terminology) for part in parts)
+    ):
+        translated.update(result)
+    return translated
+
+async def request_translation(engine: TranslationEngine, en_texts: dict, target_lang: str, max_tokens: int, tags=None,
+                              glossary_rule=None):
+    """使用 AI 翻译一批文本，返回 (模型输出, 是否因 max_tokens 被截断)"""
     lang_name = LANG_NAMES.get(target_lang, target_lang)
     
-    # 构建翻译请求
-    texts_json = json.dumps(en_texts, ensure_ascii=False, indent=2)
+    # 构建翻译请求（紧凑 JSON，节省输入 token）
+    texts_json = compact_json(en_texts)
+    glossary_line, last = numbered_rules(glossary_rule)
     
     prompt = f"""Translate the following JSON key-value pairs from English to {lang_name}.
 This is for a spiritual/cultural e-commerce website about Chinese traditional wisdom, Wutai Mountain Buddhist services, feng shui, palm reading, and face reading.
@@ -59,80 +148,399 @@ Important rules:
 2. Translate naturally and professionally for the target language
 3. Keep the same JSON structure with same keys
 4. For Buddhist/spiritual terms, use culturally appropriate translations
-5. Return ONLY valid JSON, no explanation
+{glossary_line}{last}. Return ONLY valid JSON, no explanation
 
 English texts to translate:
 {texts_json}"""
 
-    response = client.chat.completions.create(
-        model="gpt-4.1-mini",
+    response = await engine.complete(
         messages=[
             {"role": "system", "content": f"You are a professional translator specializing in {lang_name}. Return only valid JSON."},
             {"role": "user", "content": prompt}
         ],
         temperature=0.3,
-        max_tokens=4000,
+        max_tokens=max_tokens,
+        tags=tags,
     )
     
-    result_text = response.choices[0].message.content.strip()
-    # 清理可能的 markdown 代码块
-    if result_text.startswith("```"):
-        result_text = result_text.split("\n", 1)[1]
-        if result_text.endswith("```"):
-            result_text = result_text[:-3].strip()
-    
-    return json.loads(result_text)
+    choice = response.choices[0]
+    return strip_code_fence(choice.message.content or ""), choice.finish_reason == "length"
 
-def main():
-    # 读取英文文件
-    with open(os.path.join(LOCALES_DIR, "en.json"), "r") as f:
-        en = json.load(f)
-    en_flat = get_all_keys(en)
-    
+async def request_fanout(engine: TranslationEngine, en_texts: dict, langs, max_tokens: int, tags=None, glossary_rule=None):
+    """一个请求把同一批英文翻译成多个语言，返回 (模型输出, 是否因 max_tokens 被截断)"""
+    lang_list = ", ".join(f"{lang} ({LANG_NAMES.get(lang, lang)})" for lang in langs)
+    texts_json = compact_json(en_texts)
+    glossary_line, last = numbered_rules(glossary_rule)
+
+    prompt = f"""Translate the following JSON values from English into each of these languages: {lang_list}.
+This is for a spiritual/cultural e-commerce website about Chinese traditional wisdom, Wutai Mountain Buddhist services, feng shui, palm reading, and face reading.
+
+Important rules:
+1. Keep all {{{{variable}}}} placeholders exactly as they are (e.g., {{{{count}}}})
+2. Translate naturally and professionally for each target language
+3. Keep the same keys; replace each value with an object mapping every language code above to its translation, e.g. {{"key": {{"{langs[0]}": "..."}}}}
+4. For Buddhist/spiritual terms, use culturally appropriate translations
+{glossary_line}{last}. Return ONLY valid JSON, no explanation
+
+English texts to translate:
+{texts_json}"""
+
+    response = await engine.complete(
+        messages=[
+            {"role": "system", "content": "You are a professional multilingual translator. Return only valid JSON."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.3,
+        max_tokens=max_tokens,
+        tags=tags,
+    )
+
+    choice = response.choices[0]
+    return strip_code_fence(choice.message.content or ""), choice.finish_reason == "length"
+
+def is_product_text(key):
+    # 产品名称和描述保持英文，不参与翻译
+    return key.startswith("products.") and (".name" in key or ".description" in key or ".shortDesc" in key)
+
+def translatable_texts(en_flat):
+    return {
+        key: value
+        for key, value in en_flat.items()
+        if isinstance(value, str) and value and not is_product_text(key)
+    }
+
+def lookup_cached(memory, fallback_keys, lang):
+    """返回 (翻译记忆中已有的译文, 仍需请求的文本)"""
+    if memory is None:
+        return {}, dict(fallback_keys)
+    cached = memory.lookup(fallback_keys.values(), lang)
+    hits = {key: cached[text] for key, text in fallback_keys.items() if text in cached}
+    missing = {key: text for key, text in fallback_keys.items() if text not in cached}
+    return hits, missing
+
+class LanguageJob:
+    """
+    一个语言的翻译任务：先用翻译记忆和检查点补上能补的，剩下的 key 按英文原文去重后请求，
+    译文分发回同一原文的全部 key，最后一个事务写回语言文件
+    """
+
+    def __init__(self, lang, fallback_keys, memory=None, terminology=None):
+        self.lang = lang
+        self.fallback_keys = fallback_keys
+        self.memory = memory
+        self.terminology = terminology
+        self.checkpoint = Checkpoint(lang)
+        self.started = time.perf_counter()
+        self.errors = []
+        self.cache_hits = self.restored = 0
+        self.translated = {}
+        self.missing = {}
+        self.keys_by_text = {}
+
+    def prepare(self):
+        self.translated, missing = lookup_cached(self.memory, self.fallback_keys, self.lang)
+        self.cache_hits = len(self.translated)
+        restored = self.checkpoint.load(missing)
+        self.restored = len(restored)
+        self.translated.update(restored)
+        self.missing = {key: text for key, text in missing.items() if key not in restored}
+        _, self.keys_by_text = dedupe_texts(self.missing)
+
+    def save(self, by_text):
+        """by_text: {英文: 译文}；分发到同一原文的全部 key，立即写入检查点和翻译记忆，失败重跑不会丢失"""
+        en_texts = {}
+        translated = {}
+        for text, value in by_text.items():
+            for key in self.keys_by_text.get(text, ()):
+                en_texts[key] = text
+                translated[key] = value
+                self.missing.pop(key, None)
+        self.translated.update(translated)
+        self.checkpoint.write(en_texts, translated)
+        if self.memory is not None:
+            self.memory.store(by_text, self.lang)
+
+    def save_batch(self, en_texts, translated):
+        self.save({en_texts[key]: value for key, value in translated.items()})
+
+    async def translate(self, engine, telemetry=None):
+        """剩余的 key 按原文去重、按 token 预算分批并发发送；单个批次失败不影响其他批次"""
+        unique, _ = dedupe_texts(self.missing)
+        batches = plan_batches(unique, self.lang)
+        results = await asyncio.gather(
+            *(
+                translate_batch(engine, batch, self.save_batch, telemetry=telemetry, terminology=self.terminology)
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
+        self.errors += [result for result in results if isinstance(result, Exception)]
+
+    def commit(self, store, manifest, telemetry=None):
+        """写入翻译结果（每个语言一次事务，只有内容变化时才写文件）"""
+        lang = self.lang
+        with store.transaction() as tx:
+            for key, value in self.translated.items():
+                tx.set(lang, key, value)
+
+            def record_machine():
+                for key in self.translated:
+                    manifest.record(lang, key, self.fallback_keys[key], MACHINE)
+                manifest.save()
+
+            tx.on_commit(record_machine)
+            tx.on_commit(self.checkpoint.clear)
+
+        failed = len(self.fallback_keys) - len(self.translated)
+        status = f"✅ 完成 ({len(self.translated)} 个)"
+        if failed:
+            reason = f": {self.errors[0]}" if self.errors else ""
+            status += f" ⚠️  {failed} 个失败，下次运行会重试{reason}"
+        print(f"🔄 {lang} ({LANG_NAMES[lang]}): 翻译 {len(self.fallback_keys)} 个 key... {status}", flush=True)
+        self.report(telemetry, len(self.translated), str(self.errors[0]) if self.errors else None)
+
+    def fail(self, error, telemetry=None):
+        print(f"🔄 {self.lang} ({LANG_NAMES[self.lang]}): 翻译 {len(self.fallback_keys)} 个 key... ❌ 错误: {error}", flush=True)
+        self.report(telemetry, 0, str(error))
+
+    def report(self, telemetry, translated, error):
+        if telemetry is not None:
+            telemetry.language(
+                self.lang, len(self.fallback_keys), self.cache_hits, self.restored, translated,
+                time.perf_counter() - self.started, error=error,
+            )
+
+async def run_job(job, engine, store, manifest, telemetry=None, prepared=False):
+    try:
+        if not prepared:
+            job.prepare()
+        if job.missing:
+            await job.translate(engine, telemetry)
+        job.commit(store, manifest, telemetry)
+    except Exception as e:
+        job.fail(e, telemetry)
+
+async def translate_language(engine, store, manifest, lang, fallback_keys, memory=None, telemetry=None,
+                             terminology=None):
+    await run_job(LanguageJob(lang, fallback_keys, memory, terminology), engine, store, manifest, telemetry)
+
+def fanout_needs(jobs):
+    """{英文: (代表 key, [需要它的语言])}，语言按 jobs 的顺序"""
+    needs = {}
+    for lang, job in jobs.items():
+        for key, text in job.missing.items():
+            entry = needs.get(text)
+            if entry is None:
+                entry = needs[text] = (key, [])
+            if lang not in entry[1]:
+                entry[1].append(lang)
+    return needs
+
+async def translate_fanout_batch(engine, batch: FanoutBatch, jobs, telemetry=None, terminology=None):
+    """
+    一个合并请求：译文按语言分发给各自的 LanguageJob；缺失、无效或缺少术语的部分留给单语言请求
+    """
+    required = terminology.required(batch.texts, batch.langs) if terminology is not None else {}
+    result_text, truncated = await request_fanout(
+        engine, batch.texts, batch.langs, batch.max_tokens,
+        tags={"langs": list(batch.langs), "keys": len(batch.texts), "shares": batch.shares()},
+        glossary_rule=glossary_prompt(terminology, required, batch.langs, fanout=True),
+    )
+    per_lang, missing = parse_fanout(result_text, batch.texts, batch.langs)
+    violations = 0
+    for lang, translated in per_lang.items():
+        for key in terminology.violations(required, translated, lang) if required else ():
+            del translated[key]
+            violations += 1
+        if translated:
+            jobs[lang].save({batch.texts[key]: value for key, value in translated.items()})
+    if telemetry is not None:
+        telemetry.emit(
+            "batch",
+            langs=list(batch.langs),
+            keys=len(batch.texts),
+            max_tokens=batch.max_tokens,
+            translated=sum(len(translated) for translated in per_lang.values()),
+            translated_by_lang={lang: len(translated) for lang, translated in per_lang.items()},
+            missing=missing,
+            glossary_keys=len(required),
+            glossary_violations=violations,
+            truncated=truncated,
+        )
+
+async def translate_fanout(engine, store, manifest, pending, memory=None, telemetry=None, group_size=4,
+                           terminology=None):
+    """
+    多语言合并模式：同一段英文在一个请求里翻译成 group_size 个语言，结果分发回每个语言的全部 key；
+    合并请求没拿到的部分再按单语言请求补翻，然后每个语言各自写回
+    """
+    jobs = {}
+    for lang, fallback_keys in pending.items():
+        job = LanguageJob(lang, fallback_keys, memory, terminology)
+        try:
+            job.prepare()
+        except Exception as e:
+            job.fail(e, telemetry)
+            continue
+        jobs[lang] = job
+
+    batches = plan_fanout_batches(fanout_needs(jobs), group_size)
+    results = await asyncio.gather(
+        *(translate_fanout_batch(engine, batch, jobs, telemetry, terminology) for batch in batches),
+        return_exceptions=True,
+    )
+    for batch, result in zip(batches, results):
+        if isinstance(result, Exception):
+            for lang in batch.langs:
+                jobs[lang].errors.append(result)
+
+    await asyncio.gather(*(run_job(job, engine, store, manifest, telemetry, prepared=True) for job in jobs.values()))
+
+async def run(args, memory):
+    store = LocaleStore()
+    en_flat = store.flat("en")
+    en_texts = translatable_texts(en_flat)
+    en_hashes = {key: text_hash(value) for key, value in en_texts.items()}
+
+    manifest = Manifest.load(args.manifest)
+    manifest.prune(en_flat)
+
+    pending = {}
+    declared = None
     for lang in LANG_NAMES:
-        filepath = os.path.join(LOCALES_DIR, f"{lang}.json")
-        with open(filepath, "r") as f:
-            data = json.load(f)
-        
-        lang_flat = get_all_keys(data)
-        
-        # 找出使用了英文 fallback 的 key（值与英文完全相同的）
-        fallback_keys = {}
-        for key, value in lang_flat.items():
-            en_value = en_flat.get(key, "")
-            if value == en_value and en_value:
-                # 跳过产品名称和描述（这些保持英文）
-                if key.startswith("products.") and (".name" in key or ".description" in key or ".shortDesc" in key):
-                    continue
-                fallback_keys[key] = en_value
-        
-        if not fallback_keys:
+        if args.rebuild_manifest:
+            manifest.langs.pop(lang, None)
+            manifest.bootstrapped.discard(lang)
+        if lang not in manifest.bootstrapped:
+            # 语言迁移声明过的英文 fallback（如 0003 结算页支付方式）仍与英文相同时记为 fallback
+            if declared is None:
+                declared = declared_fallbacks(discover(args.migrations), store.langs)
+            fallback_keys = [*args.fallback_key, *declared.get(lang, ())]
+            manifest.bootstrap(lang, en_flat, store.flat(lang), fallback_keys)
+
+        # 只处理新增、英文已变化或仍为英文 fallback 的 key
+        keys, stale_human = manifest.delta(lang, en_hashes)
+        if stale_human:
+            action = "将重新翻译" if args.retranslate_human else "已跳过（--retranslate-human 可重新翻译）"
+            print(f"⚠️  {lang}: {len(stale_human)} 个人工译文的英文原文已变化，{action}")
+            if args.retranslate_human:
+                keys += stale_human
+
+        if not keys:
             print(f"✅ {lang}: 无需翻译")
             continue
-        
-        print(f"🔄 {lang} ({LANG_NAMES[lang]}): 翻译 {len(fallback_keys)} 个 key...", end=" ", flush=True)
-        
-        try:
-            # 分批翻译（每批最多 50 个）
-            keys_list = list(fallback_keys.items())
-            all_translated = {}
-            
-            for i in range(0, len(keys_list), 50):
-                batch = dict(keys_list[i:i+50])
-                translated = translate_batch(batch, lang)
-                all_translated.update(translated)
-            
-            # 写入翻译结果
-            for key, value in all_translated.items():
-                set_nested_value(data, key, value)
-            
-            with open(filepath, "w") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-                f.write("\n")
-            
-            print(f"✅ 完成 ({len(all_translated)} 个)")
-        except Exception as e:
-            print(f"❌ 错误: {e}")
+        pending[lang] = {key: en_texts[key] for key in keys}
+
+    if args.dry_run:
+        plans = {}
+        missing_by_lang = {}
+        for lang, keys in pending.items():
+            _, missing = lookup_cached(memory, keys, lang)
+            missing_by_lang[lang] = missing
+            plans[lang] = plan_batches(dedupe_texts(missing)[0], lang)
+        if args.fanout > 1:
+            needs = {}
+            for lang, missing in missing_by_lang.items():
+                for key, text in missing.items():
+                    needs.setdefault(text, (key, []))[1].append(lang)
+            plans = {"fanout": plan_fanout_batches(needs, args.fanout)}
+        print("📋 翻译计划（dry-run，不发送请求）:")
+        print("\n".join(describe_plan(plans, args.concurrency)))
+        return
+
+    if pending:
+        terminology = None if args.no_glossary else Terminology.load(args.glossary)
+        if terminology is not None:
+            print(f"📖 术语表: {len(terminology)} 个词条")
+        prices = None
+        if args.price_input is not None or args.price_output is not None:
+            default_in, default_out = PRICES_PER_MILLION.get(args.model, (0.0, 0.0))
+            prices = (
+                default_in if args.price_input is None else args.price_input,
+                default_out if args.price_output is None else args.price_output,
+            )
+        with Telemetry(args.telemetry, model=args.model, prices=prices) as telemetry:
+            telemetry.emit(
+                "run_start", model=args.model, concurrency=args.concurrency,
+                langs={lang: len(keys) for lang, keys in pending.items()},
+            )
+            async with TranslationEngine(
+                model=args.model,
+                concurrency=args.concurrency,
+                max_retries=args.max_retries,
+                base_url=args.base_url,
+                transport=args.transport,
+                telemetry=telemetry,
+            ) as engine:
+                if args.fanout > 1:
+                    await translate_fanout(
+                        engine, store, manifest, pending, memory, telemetry, args.fanout, terminology
+                    )
+                else:
+                    await asyncio.gather(*(
+                        translate_language(engine, store, manifest, lang, keys, memory, telemetry, terminology)
+                        for lang, keys in pending.items()
+                    ))
+            transport_summary = engine.transport.summary()
+            if transport_summary:
+                print(transport_summary)
+            telemetry.finish()
+            print("📊 翻译统计:")
+            print("\n".join(telemetry.summary()))
+            if telemetry.prices is None:
+                print(f"   （{args.model} 没有内置价格，--price-input / --price-output 可指定每百万 token 价格）")
+            if args.prometheus:
+                telemetry.write_prometheus(args.prometheus)
+                print(f"📈 Prometheus 指标: {args.prometheus}")
+    manifest.save()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="使用 OpenAI API 批量翻译 i18n fallback key")
+    parser.add_argument("--concurrency", type=int, default=8, help="同时进行的请求数上限")
+    parser.add_argument("--max-retries", type=int, default=5, help="单个批次的最大重试次数")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--base-url", default=None, help="覆盖 API 地址（默认读取 OPENAI_BASE_URL）")
+    parser.add_argument("--transport", type=transport_arg, default=None, help="翻译请求的传输方式：live / record:PATH / replay:PATH / fake:latency=0.3,rate_limit=0.05,...（默认读取 I18N_TRANSPORT）")
+    parser.add_argument("--dry-run", action="store_true", help="只打印分批计划（请求数、token、预计耗时）")
+    parser.add_argument(
+        "--fanout", type=int, default=1, metavar="N",
+        help="一个请求同时翻译成 N 个语言（默认 1，每个语言单独请求；大范围刷新时减少请求数和输入 token）",
+    )
+    parser.add_argument("--glossary", default=GLOSSARY_PATH, help="术语表 JSON（批次里出现的术语会写进 prompt 并校验译文）")
+    parser.add_argument("--no-glossary", action="store_true", help="不注入术语、不校验译文里的术语")
+    parser.add_argument("--manifest", default=MANIFEST_PATH, help="翻译来源清单路径")
+    parser.add_argument("--rebuild-manifest", action="store_true", help="按当前语言文件重新建立翻译来源清单")
+    parser.add_argument(
+        "--fallback-key", action="append", default=[], metavar="KEY",
+        help="建立清单时该 key 或 section 里与英文相同的值记为 fallback（需要翻译），可重复；迁移声明的 fallback 自动包含，其余已有译文均记为人工译文",
+    )
+    parser.add_argument("--migrations", default=MIGRATIONS_DIR, help="语言迁移目录（建立清单时从中读取声明的英文 fallback）")
+    parser.add_argument("--retranslate-human", action="store_true", help="英文变化后也重新翻译人工译文")
+    parser.add_argument("--cache", default=MEMORY_PATH, help="翻译记忆 SQLite 文件路径")
+    parser.add_argument("--no-cache", action="store_true", help="不读写翻译记忆")
+    parser.add_argument("--cache-stats", action="store_true", help="只打印翻译记忆统计后退出")
+    parser.add_argument("--prune-cache", action="store_true", help="删除其他 prompt 版本的翻译记忆")
+    parser.add_argument("--evict-days", type=float, default=None, help="删除超过 N 天未使用的翻译记忆")
+    parser.add_argument("--telemetry", default=None, help="把请求/批次/语言明细追加写入该 JSON Lines 文件")
+    parser.add_argument("--prometheus", default=None, help="运行结束后写出 Prometheus textfile（如 node_exporter 的 textfile 目录）")
+    parser.add_argument("--price-input", type=float, default=None, help="输入 token 价格（美元/百万 token），覆盖内置价格表")
+    parser.add_argument("--price-output", type=float, default=None, help="输出 token 价格（美元/百万 token），覆盖内置价格表")
+    args = parser.parse_args(argv)
+
+    if args.no_cache:
+        asyncio.run(run(args, None))
+        return
+
+    with TranslationMemory(args.model, PROMPT_VERSION, args.cache) as memory:
+        if args.prune_cache:
+            print(f"🧹 已删除 {memory.invalidate()} 条旧 prompt 版本的翻译记忆")
+        if args.evict_days is not None:
+            print(f"🧹 已删除 {memory.evict(args.evict_days)} 条过期翻译记忆")
+        if args.cache_stats:
+            print(json.dumps(memory.stats(), ensure_ascii=False, indent=2))
+            return
+        asyncio.run(run(args, memory))
+        print(f"💾 翻译记忆: 命中 {memory.hits} / 未命中 {memory.misses}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+常驻监视语言文件，每次保存后只重新解析改动的文件并增量重跑跨语言检查
+
+用法:
+    python3 scripts/watch-locales.py                             输出每次保存后新出现 / 已消失的问题
+    python3 scripts/watch-locales.py --push                      同时把改动的 section 推给开发服务器热更新
+    python3 scripts/watch-locales.py --push http://localhost:3001 --poll
+
+检查项与 lint-locales.py 相同（缺失/多余 key、类型、占位符、标签、空值），启动时完整检查一遍，
+之后其他语言的文件变化只重查该语言，en 只改了字符串值时只重查改动的 key。
+--push 只更新已打开页面里 i18next 的内存资源；刷新页面仍读取 public/locales 下的 chunk，
+需要时运行 pnpm i18n:chunks。Ctrl+C 退出。
+"""
+import argparse
+import os
+import sys
+import time
+
+from i18n_tools import LocaleStore
+from i18n_tools.lint import BASE_LANG
+from i18n_tools.watch import LintIndex, changed_sections, issue_diff, open_watcher, push_sections, watch_files
+
+DEV_SERVER = "http://localhost:3000"
+# 一批变化最多逐条列出的问题数（en 结构变化时可能有几百条）
+MAX_LINES = 40
+
+
+def print_issue(mark, issue):
+    print(f"  {mark} {issue.severity:7} {issue.lang:8} {issue.key}  [{issue.code}] {issue.message}")
+
+
+def print_counts(report):
+    for lang, by_code in sorted(report.counts().items()):
+        summary = ", ".join(f"{code} {count}" for code, count in sorted(by_code.items()))
+        print(f"  {lang:8} {summary}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="监视语言文件，增量检查并可推送到开发服务器热更新")
+    parser.add_argument("--push", nargs="?", const=DEV_SERVER, metavar="URL",
+                        help=f"把改动的 section 推给开发服务器（默认 {DEV_SERVER}）")
+    parser.add_argument("--poll", action="store_true", help="不用 inotify，按修改时间轮询")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    store = LocaleStore()
+    index = LintIndex(store)
+    report = index.report(time.perf_counter() - started)
+    print_counts(report)
+    print(f"{'❌' if report.errors else '✅'} {len(report.errors)} errors, {len(report.warnings)} warnings"
+          f" in {len(report.key_counts)} locales ({report.elapsed * 1000:.0f} ms)")
+
+    watcher, how = open_watcher(store.locales_dir, poll=args.poll)
+    print(f"👀 watching {os.path.relpath(store.locales_dir)} ({how})" + (f", pushing to {args.push}" if args.push else ""))
+    push_failed = False
+    try:
+        for first, names in watch_files(watcher):
+            # 先处理 en，其他语言随后对照新的 en 检查
+            langs = sorted((name[: -len(".json")] for name in names), key=lambda lang: (lang != BASE_LANG, lang))
+            before = {lang: list(issues) for lang, issues in index.issues.items()}
+            checked = set()
+            updates = []
+            for lang in langs:
+                if lang == BASE_LANG and not os.path.exists(store.path(lang)):
+                    print(f"⚠️  {lang}.json 已删除，等待重新创建")
+                    continue
+                old_flat = store.flat(lang) if lang in store else None
+                old_data = store.data(lang) if lang in store else None
+                try:
+                    if not store.reload(lang):
+                        continue
+                except ValueError as exc:
+                    print(f"❌ {lang}.json: {exc}（保留上一次的内容）")
+                    continue
+                checked.update(index.update(lang, old_flat))
+                if args.push and lang in store:
+                    updates.extend(
+                        {"lng": lang, "section": section, "data": data}
+                        for section, data in changed_sections(old_data, store.data(lang)).items()
+                    )
+            if not checked:
+                continue
+
+            added, resolved = issue_diff(
+                [issue for lang in checked for issue in before.get(lang, ())],
+                [issue for lang in checked for issue in index.issues.get(lang, ())],
+            )
+            report = index.report()
+            elapsed = (time.perf_counter() - first) * 1000
+            print(
+                f"\n{time.strftime('%H:%M:%S')} {', '.join(f'{lang}.json' for lang in langs)}  "
+                f"+{len(added)} −{len(resolved)}  {'❌' if report.errors else '✅'} {len(report.errors)} errors, "
+                f"{len(report.warnings)} warnings ({elapsed:.0f} ms)"
+            )
+            lines = [("+", issue) for issue in added] + [("−", issue) for issue in resolved]
+            for mark, issue in lines[:MAX_LINES]:
+                print_issue(mark, issue)
+            if len(lines) > MAX_LINES:
+                print(f"  … {len(lines) - MAX_LINES} more (pnpm i18n:lint 查看全部)")
+            sys.stdout.flush()
+
+            if updates:
+                try:
+                    clients = push_sections(args.push, updates)
+                    push_failed = False
+                    print(f"  🔥 {len(updates)} sections pushed to {clients} browser(s)", flush=True)
+                except (OSError, ValueError) as exc:
+                    if not push_failed:
+                        print(f"  ⚠️  推送失败（{exc}），开发服务器启动后自动恢复", flush=True)
+                    push_failed = True
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,10 +5,10 @@ SET NAMES utf8mb4;
 
 -- 分类数据
 INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (1, '命理服务', 'fortune-services', '专业的面相、手相、风水分析服务', NULL, 0, 0, NOW(), NOW());
-INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (6, '生肖守护', 'zodiac-guardian', '十二生肖守护吊坠，五台山古法开光加持，守护您的本命运势', NULL, 0, 0, NOW(), NOW());
+INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (6, '生肖守护', 'zodiac-guardian', '十二生肖守护吊坠，五台山古法启蕴，守护您的本命运势', NULL, 0, 0, NOW(), NOW());
 INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (7, '星座守护', 'constellation-guardian', '十二星座守护吊坠，融合东方能量仪式与西方星座智慧', NULL, 0, 0, NOW(), NOW());
-INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (60001, '代客祈福', 'prayer-services', '五台山代客祈福服务,包括供灯、供香等佛教仪式', NULL, 0, 0, NOW(), NOW());
-INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (90001, '生肖守护', 'zodiac-guardians', '根据您的出生年份,为您提供专属的生肖守护法物', 8, 0, 0, NOW(), NOW());
+INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (60001, '代客文化祝愿', 'prayer-services', '五台山代客文化祝愿服务,包括供灯、供香等东方文化仪式', NULL, 0, 0, NOW(), NOW());
+INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (90001, '生肖守护', 'zodiac-guardians', '根据您的出生年份,为您提供专属的生肖守护信物', 8, 0, 0, NOW(), NOW());
 INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (90002, '太阳星座守护', 'sun-sign-guardians', '根据您的出生日期,守护您的外在性格与人生方向', 8, 0, 0, NOW(), NOW());
 INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (90003, '月亮星座守护', 'moon-sign-guardians', '守护您的情感世界与内心需求,加强情感能量', 8, 0, 0, NOW(), NOW());
 INSERT IGNORE INTO categories (id, name, slug, description, parentId, sortOrder, isActive, createdAt, updatedAt) VALUES (90004, '招财旺运', 'wealth-fortune', '助力事业发展,招财纳福,提升财运', 8, 0, 0, NOW(), NOW());
@@ -90,18 +90,18 @@ INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrd
 INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (120004, 120004, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/photo-1611591437281-460bfbe1220a.jpg', 'products/photo-1611591437281-460bfbe1220a.jpg', NULL, 0, 1, NOW());
 INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (120005, 120005, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/photo-1535632066927-ab7c9ab60908.jpg', 'products/photo-1535632066927-ab7c9ab60908.jpg', NULL, 0, 1, NOW());
 INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (120007, 120007, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/photo-1518709268805-4e9042af9f23.jpg', 'products/photo-1518709268805-4e9042af9f23.jpg', NULL, 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510001, 510001, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/wyIKDxNOXjUDeWNc.jpg', 'products/wyIKDxNOXjUDeWNc.jpg', '五台山开光鼠守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510002, 510002, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/VKRhCulFqvSqAURX.jpg', 'products/VKRhCulFqvSqAURX.jpg', '五台山开光牛守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510003, 510003, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/yeERYtgUiAjMLkwY.jpg', 'products/yeERYtgUiAjMLkwY.jpg', '五台山开光虎守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510004, 510004, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/VrisgGvkgvKgWTYO.jpg', 'products/VrisgGvkgvKgWTYO.jpg', '五台山开光兔守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510005, 510005, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/wVGXIrfCHWaIFmsw.jpg', 'products/wVGXIrfCHWaIFmsw.jpg', '五台山开光龙守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510006, 510006, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/HxIKTykCIuxPbMYj.jpg', 'products/HxIKTykCIuxPbMYj.jpg', '五台山开光蛇守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510007, 510007, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/aXdRFtCdwRgjkReY.jpg', 'products/aXdRFtCdwRgjkReY.jpg', '五台山开光马守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510008, 510008, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/xhtdTuxmzzafNSET.jpg', 'products/xhtdTuxmzzafNSET.jpg', '五台山开光羊守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510009, 510009, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/VrisgGvkgvKgWTYO.jpg', 'products/VrisgGvkgvKgWTYO.jpg', '五台山开光猴守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510010, 510010, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/gogXfonFjYNDOpCu.jpg', 'products/gogXfonFjYNDOpCu.jpg', '五台山开光鸡守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510011, 510011, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/cbpUizLsSLARhcQz.jpg', 'products/cbpUizLsSLARhcQz.jpg', '五台山开光狗守护吊坠', 0, 1, NOW());
-INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510012, 510012, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/zWzDeZdXqQUTnvGj.jpg', 'products/zWzDeZdXqQUTnvGj.jpg', '五台山开光猪守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510001, 510001, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/wyIKDxNOXjUDeWNc.jpg', 'products/wyIKDxNOXjUDeWNc.jpg', '五台山启蕴鼠守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510002, 510002, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/VKRhCulFqvSqAURX.jpg', 'products/VKRhCulFqvSqAURX.jpg', '五台山启蕴牛守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510003, 510003, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/yeERYtgUiAjMLkwY.jpg', 'products/yeERYtgUiAjMLkwY.jpg', '五台山启蕴虎守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510004, 510004, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/VrisgGvkgvKgWTYO.jpg', 'products/VrisgGvkgvKgWTYO.jpg', '五台山启蕴兔守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510005, 510005, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/wVGXIrfCHWaIFmsw.jpg', 'products/wVGXIrfCHWaIFmsw.jpg', '五台山启蕴龙守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510006, 510006, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/HxIKTykCIuxPbMYj.jpg', 'products/HxIKTykCIuxPbMYj.jpg', '五台山启蕴蛇守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510007, 510007, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/aXdRFtCdwRgjkReY.jpg', 'products/aXdRFtCdwRgjkReY.jpg', '五台山启蕴马守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510008, 510008, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/xhtdTuxmzzafNSET.jpg', 'products/xhtdTuxmzzafNSET.jpg', '五台山启蕴羊守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510009, 510009, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/VrisgGvkgvKgWTYO.jpg', 'products/VrisgGvkgvKgWTYO.jpg', '五台山启蕴猴守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510010, 510010, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/gogXfonFjYNDOpCu.jpg', 'products/gogXfonFjYNDOpCu.jpg', '五台山启蕴鸡守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510011, 510011, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/cbpUizLsSLARhcQz.jpg', 'products/cbpUizLsSLARhcQz.jpg', '五台山启蕴狗守护吊坠', 0, 1, NOW());
+INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510012, 510012, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/zWzDeZdXqQUTnvGj.jpg', 'products/zWzDeZdXqQUTnvGj.jpg', '五台山启蕴猪守护吊坠', 0, 1, NOW());
 INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510015, 510015, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/nndEdYOMDaZPbtFJ.jpg', 'products/nndEdYOMDaZPbtFJ.jpg', NULL, 0, 1, NOW());
 INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510022, 510022, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/nCMCAruOULuVxZte.jpg', 'products/nCMCAruOULuVxZte.jpg', NULL, 0, 1, NOW());
 INSERT IGNORE INTO product_images (id, productId, url, fileKey, altText, sortOrder, isPrimary, createdAt) VALUES (510024, 510024, 'https://pub-fcd65df361fe4419b10617be62eec737.r2.dev/products/gqNLoGehcezjpCOf.jpg', 'products/gqNLoGehcezjpCOf.jpg', NULL, 0, 1, NOW());
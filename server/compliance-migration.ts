@@ -1,194 +1,94 @@
 /**
  * 合规化数据迁移脚本 v2
  * 将数据库中产品的敏感词替换为合规表述
- * 对所有字段同时应用中文和英文替换规则（因为某些字段存储了错误语言的文本）
+ * 多语言字段按语言选用词表，每个字段只扫描一遍（离线批量处理见 scripts/compliance-rewrite.py）
  */
-import { getDb } from "./db";
+import { getDb, refreshProductTexts } from "./db";
 import { products } from "../drizzle/schema";
 import { sql } from "drizzle-orm";
+import complianceTerms from "@shared/compliance-terms.json";
 
-// 中文敏感词替换 - 按长度降序
-const zhReplacements: [string, string][] = [
-  ["开光仪式", "启蕴仪式"],
-  ["开光法物", "启蕴信物"],
-  ["开光效用", "启蕴效用"],
-  ["开光", "启蕴"],
-  ["法物", "信物"],
-  ["法器", "信物"],
-  ["高僧大德", "文化传承人"],
-  ["高僧", "文化传承人"],
-  ["法师", "传承人"],
-  ["住持", "传承人"],
-  ["寺庙", "文化圣地"],
-  ["寺院", "文化圣地"],
-  ["古刹", "文化圣地"],
-  ["佛教", "东方文化"],
-  ["佛法", "东方智慧"],
-  ["净土宗", "东方文化传承"],
-  ["阿弥陀佛", "永恒之光"],
-  ["阿弥陀", "永恒之光"],
-  ["文殊菩萨", "文殊智慧"],
-  ["菩萨", "守护者"],
-  ["佛", "文化"],
-  ["诵经", "传承吟诵"],
-  ["念经", "传承吟诵"],
-  ["诵念", "吟诵"],
-  ["诵唱", "吟诵"],
-  ["经文", "传承典籍"],
-  ["圣典", "传承典籍"],
-  ["咒语", "传承吟诵"],
-  ["名咒", "传承吟诵"],
-  ["祈福", "文化祝愿"],
-  ["祈祷", "文化祝愿"],
-  ["加持仪式", "启蕴仪式"],
-  ["加持", "启蕴"],
-  ["灵验", "灵韵"],
-  ["灵修", "文化修行"],
-  ["灵性", "文化底蕴"],
-  ["灵气", "文化气韵"],
-  ["灵力", "文化能量"],
-  ["神圣", "庄严"],
-  ["护身符", "守护信物"],
-  ["心經", "心智慧"],
-  ["心经", "心智慧"],
-  ["大悲咒", "大悲传承吟诵"],
-  ["楞严咒", "英勇传承吟诵"],
-  ["财宝天王", "金色繁荣守护"],
-  ["法力", "文化能量"],
-  ["圣檀香", "传承檀香"],
-  ["大师", "传承人"],
-  ["大師", "傳承人"],
-  ["心灵圣地", "心灵净土"],
-];
+// 词表见 shared/compliance-terms.json（与 scripts/compliance-rewrite.py 共用，对照 compliance-glossary.md 维护）：
+// zh 表作用于所有语言字段（某些字段存储了错误语言的文本）；en 表作用于英文和非拉丁字母语言，
+// temple、spiritual 在法语、印尼语里是正常词汇，不套用；其他语言的表只作用于该语言，冲突时优先
+const termTables: Record<string, string[][]> = complianceTerms;
+const SHARED_TABLES = ["zh", "en"];
+const LATIN_LANGS = new Set(["de", "es", "fr", "id", "it", "pt", "tr", "vi"]);
 
-// 英文敏感词替换 - 按长度降序
-const enReplacements: [string, string][] = [
-  // Long phrases first
-  ["pulsating with centuries of spiritual devotion", "steeped in centuries of cultural heritage"],
-  ["Great Compassion Mantra", "Great Compassion Heritage Chant"],
-  ["Shurangama Mantra", "Heroic Heritage Chant"],
-  ["chanting of sacred texts", "heritage chanting"],
-  ["Yellow Jambhala", "Golden Prosperity"],
-  ["Manjushri Hall", "Wisdom Hall"],
-  ["venerable masters", "cultural lineage holders"],
-  ["Venerable Master", "Cultural Lineage Holder"],
-  ["venerable master", "cultural lineage holder"],
-  ["revered masters", "cultural lineage holders"],
-  ["Revered Master", "Cultural Lineage Holder"],
-  ["revered master", "cultural lineage holder"],
-  ["temple masters", "lineage holders"],
-  ["Temple Master", "Lineage Holder"],
-  ["temple master", "lineage holder"],
-  ["Sutra Chanting", "Heritage Chanting"],
-  ["sutra chanting", "heritage chanting"],
-  ["Heart Sutra", "Heart Wisdom"],
-  ["ancient temples", "heritage sites"],
-  ["Ancient Temple", "Heritage Site"],
-  ["ancient temple", "heritage site"],
-  ["high priest", "lineage holder"],
-  // Consecration
-  ["consecration ceremony", "imbuing ceremony"],
-  ["Consecration Ceremony", "Imbuing Ceremony"],
-  ["Consecration", "Imbuing Ceremony"],
-  ["consecration", "imbuing ceremony"],
-  ["Consecrating", "Imbuing"],
-  ["consecrating", "imbuing"],
-  ["Consecrated", "Imbued"],
-  ["consecrated", "imbued"],
-  ["Consecrate", "Imbue"],
-  ["consecrate", "imbue"],
-  // Blessing
-  ["Blessing Ritual", "Imbuing Ceremony"],
-  ["blessing ritual", "imbuing ceremony"],
-  ["Blessing", "Imbuing"],
-  ["blessing", "imbuing"],
-  ["Blessed", "Imbued"],
-  ["blessed", "imbued"],
-  // Adjectives
-  ["Spiritual", "Cultural"],
-  ["spiritual", "cultural"],
-  ["Sacred", "Cultural"],
-  ["sacred", "cultural"],
-  ["Holy", "Cultural"],
-  ["holy", "cultural"],
-  ["Divine", "Heritage"],
-  ["divine", "heritage"],
-  ["Religious", "Traditional"],
-  ["religious", "traditional"],
-  // People
-  ["Monks", "Lineage Holders"],
-  ["monks", "lineage holders"],
-  ["Monk", "Lineage Holder"],
-  ["monk", "lineage holder"],
-  // Places
-  ["Temples", "Heritage Sites"],
-  ["temples", "heritage sites"],
-  ["Temple", "Heritage Site"],
-  ["temple", "heritage site"],
-  ["Monasteries", "Heritage Sites"],
-  ["monasteries", "heritage sites"],
-  ["Monastery", "Heritage Site"],
-  ["monastery", "heritage site"],
-  ["Shrine", "Heritage Site"],
-  ["shrine", "heritage site"],
-  // Texts
-  ["Sutras", "Heritage Texts"],
-  ["sutras", "heritage texts"],
-  ["Sutra", "Heritage Text"],
-  ["sutra", "heritage text"],
-  ["Mantras", "Heritage Chants"],
-  ["mantras", "heritage chants"],
-  ["Mantra", "Heritage Chant"],
-  ["mantra", "heritage chant"],
-  ["incantation", "heritage chant"],
-  // Prayer
-  ["Prayers", "Cultural Intentions"],
-  ["prayers", "cultural intentions"],
-  ["Prayer", "Cultural Intention"],
-  ["prayer", "cultural intention"],
-  // Ritual
-  ["Rituals", "Ceremonies"],
-  ["rituals", "ceremonies"],
-  ["Ritual", "Ceremony"],
-  ["ritual", "ceremony"],
-  // Buddhist specific
-  ["Buddhist", "Eastern cultural"],
-  ["Buddhism", "Eastern culture"],
-  ["Bodhisattva", "Guardian"],
-  ["bodhisattva", "guardian"],
-  ["Buddha", "cultural heritage"],
-  ["Amitabha", "Eternal Light"],
-  ["Manjushri", "Wisdom"],
-  ["Jambhala", "Prosperity Guardian"],
-  // Objects
-  ["Amulets", "Guardian Tokens"],
-  ["amulets", "guardian tokens"],
-  ["Amulet", "Guardian Token"],
-  ["amulet", "guardian token"],
-  ["Talismans", "Guardian Tokens"],
-  ["talismans", "guardian tokens"],
-  ["Talisman", "Guardian Token"],
-  ["talisman", "guardian token"],
-  // Other
-  ["sanctity", "cultural integrity"],
-  ["devotion", "dedication"],
-  ["hallowed", "revered"],
-  ["Pure Land", "Eastern Heritage"],
-];
+// 拉丁字母开头/结尾的词按整词匹配（temple 不改 contemplate）
+const WORD_CLASS = "0-9A-Za-z\\u00c0-\\u024f";
+const WORD_CHAR = new RegExp(`[${WORD_CLASS}]`);
 
-function applyReplacements(text: string, replacements: [string, string][]): string {
-  let result = text;
-  for (const [find, replace] of replacements) {
-    result = result.split(find).join(replace);
+interface TrieNode {
+  children: Map<string, TrieNode>;
+  end: boolean;
+}
+
+interface TermMatcher {
+  pattern: RegExp | null;
+  replacements: Map<string, string>;
+}
+
+function escapeRegExp(text: string): string {
+  return text.replace(/[.*+?^${}()|[\]\\/]/g, "\\$&");
+}
+
+/**
+ * 把词表按前缀树编译成一个正则：同前缀的词共享分支，更长的延续排在前面（最长匹配优先），
+ * 一次扫描完成全部替换，不必对每个词各扫一遍全文
+ */
+function compileTerms(terms: Iterable<string>): RegExp | null {
+  const root: TrieNode = { children: new Map(), end: false };
+  for (const term of terms) {
+    let node = root;
+    for (const ch of term) {
+      let next = node.children.get(ch);
+      if (!next) {
+        next = { children: new Map(), end: false };
+        node.children.set(ch, next);
+      }
+      node = next;
+    }
+    node.end = true;
+  }
+  const build = (node: TrieNode, last: string): string => {
+    const alternatives = Array.from(node.children, ([ch, child]) => escapeRegExp(ch) + build(child, ch));
+    if (node.end) alternatives.push(WORD_CHAR.test(last) ? `(?![${WORD_CLASS}])` : "");
+    return alternatives.length === 1 ? alternatives[0] : `(?:${alternatives.join("|")})`;
+  };
+  const branches = Array.from(
+    root.children,
+    ([ch, child]) => (WORD_CHAR.test(ch) ? `(?<![${WORD_CLASS}])` : "") + escapeRegExp(ch) + build(child, ch),
+  );
+  return branches.length ? new RegExp(branches.join("|"), "gu") : null;
+}
+
+const matchers = new Map<string, TermMatcher>();
+
+function matcherFor(lang: string | null): TermMatcher {
+  // 没有专属词表的非拉丁字母语言与语言未知的文本共用 zh + en
+  const own =
+    lang !== null && !SHARED_TABLES.includes(lang) && (LATIN_LANGS.has(lang) || lang in termTables) ? lang : null;
+  const key = own ?? "*";
+  let matcher = matchers.get(key);
+  if (!matcher) {
+    // 先加入的优先：语言专属表 > zh > en，同一张表里重复的词以第一次出现为准
+    const names = own === null ? SHARED_TABLES : [own, "zh", ...(LATIN_LANGS.has(own) ? [] : ["en"])];
+    const replacements = new Map<string, string>();
+    for (const name of names) {
+      for (const [find, replace] of termTables[name] ?? []) {
+        if (!replacements.has(find)) replacements.set(find, replace);
+      }
+    }
+    matcher = { pattern: compileTerms(replacements.keys()), replacements };
+    matchers.set(key, matcher);
   }
-  return result;
+  return matcher;
 }
 
-function replaceAllSensitiveTerms(text: string): string {
-  // Apply Chinese replacements first, then English
-  let result = applyReplacements(text, zhReplacements);
-  result = applyReplacements(result, enReplacements);
-  return result;
+function replaceAllSensitiveTerms(text: string, lang: string | null = null): string {
+  const { pattern, replacements } = matcherFor(lang);
+  return pattern ? text.replace(pattern, (term) => replacements.get(term) ?? term) : text;
 }
 
 function replaceInMultiLangJson(jsonStr: string): string {
@@ -197,9 +97,7 @@ function replaceInMultiLangJson(jsonStr: string): string {
     if (typeof data === "object" && data !== null) {
       for (const lang of Object.keys(data)) {
         if (typeof data[lang] === "string") {
-          // Apply ALL replacements to ALL language fields
-          // because some fields have wrong-language content
-          data[lang] = replaceAllSensitiveTerms(data[lang]);
+          data[lang] = replaceAllSensitiveTerms(data[lang], lang);
         }
       }
       return JSON.stringify(data);
@@ -224,6 +122,7 @@ export async function runComplianceMigration() {
     console.log(`[Compliance Migration] Found ${allProducts.length} products to process`);
     
     let updatedCount = 0;
+    const updatedIds: number[] = [];
     
     for (const product of allProducts) {
       const updates: Record<string, any> = {};
@@ -274,11 +173,17 @@ export async function runComplianceMigration() {
           .set(updates)
           .where(sql`id = ${product.id}`);
         updatedCount++;
+        updatedIds.push(product.id);
         console.log(`[Compliance Migration] Updated product ID=${product.id} (${Object.keys(updates).join(", ")})`);
       }
     }
     
     console.log(`[Compliance Migration] Complete. Updated ${updatedCount}/${allProducts.length} products.`);
+    // 直接改了 products,重新生成这些产品的多语言投影(product_texts)
+    if (updatedIds.length > 0) {
+      const { updated } = await refreshProductTexts(updatedIds);
+      console.log(`[Compliance Migration] Refreshed product texts for ${updated} products.`);
+    }
     return true;
   } catch (error) {
     console.error("[Compliance Migration] Error:", error);
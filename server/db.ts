@@ -20,8 +20,10 @@ import {
   palmRules,
   fengshuiRules,
   fortuneServiceReviews,
+  productTexts,
   type Category,
   type Product,
+  type ProductText,
   type ProductImage,
   type CartItem,
   type Address,
@@ -31,6 +33,7 @@ import {
   type Review,
 } from "../drizzle/schema";
 import { ENV } from "./_core/env";
+import { LOCALIZED_PRODUCT_FIELDS, localizeProduct, productTextHash, projectProductTexts } from "./productText";
 
 let _db: ReturnType<typeof drizzle> | null = null;
 
@@ -1305,7 +1308,9 @@ export async function createProduct(productData: {
     blessingDescription: productData.blessingDescription,
   });
 
-  return Number(result.insertId);
+  const productId = Number(result.insertId);
+  await refreshProductTexts([productId]);
+  return productId;
 }
 
 export async function createProductImages(images: Array<{
@@ -1366,6 +1371,10 @@ export async function updateProduct(
     .update(products)
     .set(updateData)
     .where(eq(products.id, productId));
+
+  if (LOCALIZED_PRODUCT_FIELDS.some((field) => field in productData)) {
+    await refreshProductTexts([productId]);
+  }
 }
 
 export async function deleteProduct(productId: number): Promise<void> {
@@ -1373,6 +1382,123 @@ export async function deleteProduct(productId: number): Promise<void> {
   if (!db) throw new Error("Database not available");
 
   await db.delete(products).where(eq(products.id, productId));
+  await db.delete(productTexts).where(eq(productTexts.productId, productId));
+}
+
+// ============= 产品多语言文本投影 =============
+
+const PROJECTION_BATCH_SIZE = 200;
+const PROJECTION_SOURCE_COLUMNS = {
+  id: products.id,
+  name: products.name,
+  shortDescription: products.shortDescription,
+  description: products.description,
+  blessingDescription: products.blessingDescription,
+  suitableFor: products.suitableFor,
+  efficacy: products.efficacy,
+  wearingGuide: products.wearingGuide,
+};
+
+/**
+ * 重新生成产品的多语言投影(product_texts)
+ * 不传 productIds 时按 id 分页扫描全部产品;源字段哈希未变的产品跳过
+ */
+export async function refreshProductTexts(
+  productIds?: number[],
+  options?: { force?: boolean }
+): Promise<{ scanned: number; updated: number }> {
+  const db = await getDb();
+  if (!db) return { scanned: 0, updated: 0 };
+
+  let scanned = 0;
+  let updated = 0;
+  let lastId = 0;
+  const pending = productIds ? [...productIds] : null;
+
+  while (true) {
+    let batch;
+    if (pending) {
+      const ids = pending.splice(0, PROJECTION_BATCH_SIZE);
+      batch = ids.length
+        ? await db.select(PROJECTION_SOURCE_COLUMNS).from(products).where(inArray(products.id, ids))
+        : [];
+    } else {
+      batch = await db
+        .select(PROJECTION_SOURCE_COLUMNS)
+        .from(products)
+        .where(sql`${products.id} > ${lastId}`)
+        .orderBy(products.id)
+        .limit(PROJECTION_BATCH_SIZE);
+    }
+    if (batch.length === 0) break;
+    scanned += batch.length;
+    lastId = batch[batch.length - 1].id;
+
+    const existing = new Map<number, string>();
+    if (!options?.force) {
+      const rows = await db
+        .select({ productId: productTexts.productId, sourceHash: productTexts.sourceHash })
+        .from(productTexts)
+        .where(and(eq(productTexts.lang, "en"), inArray(productTexts.productId, batch.map((p) => p.id))));
+      for (const row of rows) existing.set(row.productId, row.sourceHash);
+    }
+
+    const stale = batch.filter((product) => existing.get(product.id) !== productTextHash(product));
+    if (stale.length === 0) continue;
+
+    const rows = stale.flatMap(projectProductTexts);
+    await db
+      .insert(productTexts)
+      .values(rows)
+      .onDuplicateKeyUpdate({
+        set: {
+          name: sql`values(${productTexts.name})`,
+          shortDescription: sql`values(${productTexts.shortDescription})`,
+          description: sql`values(${productTexts.description})`,
+          blessingDescription: sql`values(${productTexts.blessingDescription})`,
+          suitableFor: sql`values(${productTexts.suitableFor})`,
+          efficacy: sql`values(${productTexts.efficacy})`,
+          wearingGuide: sql`values(${productTexts.wearingGuide})`,
+          sourceHash: sql`values(${productTexts.sourceHash})`,
+        },
+      });
+    updated += stale.length;
+  }
+
+  return { scanned, updated };
+}
+
+/**
+ * 把产品列表的多语言字段替换为指定语言的纯文本(一次查询取全部投影行)
+ * products 也会被绕过 createProduct/updateProduct 的写入方改动(启动时的合规迁移、
+ * scripts/sync-product-translations.py、fill-product-translations.py),
+ * 源字段哈希对不上的投影行不用,现场解析,并在后台刷新这些产品的投影
+ */
+export async function localizeProducts<T extends Product>(productList: T[], lang: string): Promise<T[]> {
+  if (productList.length === 0) return productList;
+  const db = await getDb();
+  const texts = new Map<number, ProductText>();
+  const stale: number[] = [];
+  if (db) {
+    const rows = await db
+      .select()
+      .from(productTexts)
+      .where(and(eq(productTexts.lang, lang), inArray(productTexts.productId, productList.map((p) => p.id))));
+    for (const row of rows) texts.set(row.productId, row);
+    for (const product of productList) {
+      const text = texts.get(product.id);
+      if (text && text.sourceHash !== productTextHash(product)) {
+        texts.delete(product.id);
+        stale.push(product.id);
+      }
+    }
+  }
+  if (stale.length > 0) {
+    refreshProductTexts(stale).catch((error) => {
+      console.warn("[Database] Failed to refresh stale product texts:", error);
+    });
+  }
+  return productList.map((product) => localizeProduct(product, lang, texts.get(product.id)));
 }
 
 export async function deleteProductImages(productId: number): Promise<void> {
@@ -0,0 +1,49 @@
+import { describe, it, expect } from "vitest";
+import { SUPPORTED_LANGUAGES } from "../shared/const";
+import { localizeProduct, productTextHash, projectProductTexts, resolveLocalized } from "./productText";
+
+const product = {
+  id: 42,
+  name: JSON.stringify({ zh: "五台山开光手串", en: "Wutai Blessed Bracelet", ja: "五台山開光ブレスレット" }),
+  shortDescription: JSON.stringify({ zh: "开光", "zh-Hant": "開光" }),
+  description: "Plain legacy description",
+  blessingDescription: null,
+  suitableFor: JSON.stringify({ en: "Everyone", de: "" }),
+  efficacy: null,
+  wearingGuide: null,
+};
+
+describe("product text projection", () => {
+  it("resolves the fallback chain like getLocalized", () => {
+    expect(resolveLocalized(product.name, "ja")).toBe("五台山開光ブレスレット");
+    expect(resolveLocalized(product.name, "de")).toBe("Wutai Blessed Bracelet");
+    expect(resolveLocalized(product.shortDescription, "zh-Hant")).toBe("開光");
+    expect(resolveLocalized(product.shortDescription, "fr")).toBe("开光");
+    expect(resolveLocalized(product.suitableFor, "de")).toBe("Everyone");
+    expect(resolveLocalized(product.description, "ko")).toBe("Plain legacy description");
+    expect(resolveLocalized(null, "en")).toBeNull();
+  });
+
+  it("projects one plain-text row per supported language", () => {
+    const rows = projectProductTexts(product);
+    expect(rows).toHaveLength(SUPPORTED_LANGUAGES.length);
+    const ja = rows.find((row) => row.lang === "ja")!;
+    expect(ja.name).toBe("五台山開光ブレスレット");
+    expect(ja.blessingDescription).toBeNull();
+    expect(new Set(rows.map((row) => row.sourceHash))).toEqual(new Set([productTextHash(product)]));
+  });
+
+  it("changes the source hash only when a localized field changes", () => {
+    const hash = productTextHash(product);
+    expect(productTextHash({ ...product })).toBe(hash);
+    expect(productTextHash({ ...product, efficacy: "{}" })).not.toBe(hash);
+  });
+
+  it("localizes a product from its projection row or in place", () => {
+    const [row] = projectProductTexts(product).filter((r) => r.lang === "zh");
+    const fromRow = localizeProduct(product, "zh", row as any);
+    const inPlace = localizeProduct(product, "zh");
+    expect(fromRow.name).toBe("五台山开光手串");
+    expect(inPlace).toEqual(fromRow);
+  });
+});
@@ -0,0 +1,93 @@
+import { createHash } from "crypto";
+import { SUPPORTED_LANGUAGES } from "@shared/const";
+import type { InsertProductText, Product, ProductText } from "../drizzle/schema";
+
+/**
+ * 产品多语言文本投影
+ *
+ * products 的 name/description 等字段存的是 {"zh": "...", "en": "...", ...} 形式的 JSON 字符串。
+ * 这里按与前端 getLocalized 相同的回退链(语言 -> 基础语言 -> en -> zh -> 第一个可用值)
+ * 为每种语言预先解析出纯文本,写入 product_texts;API 按请求语言直接返回纯字符串。
+ */
+
+export const LOCALIZED_PRODUCT_FIELDS = [
+  "name",
+  "shortDescription",
+  "description",
+  "blessingDescription",
+  "suitableFor",
+  "efficacy",
+  "wearingGuide",
+] as const;
+
+export type LocalizedProductField = (typeof LOCALIZED_PRODUCT_FIELDS)[number];
+type LocalizedSource = Pick<Product, LocalizedProductField>;
+
+/** 解析多语言 JSON 字段;不是 JSON 对象时返回 null */
+export function parseLocalized(value: string | null | undefined): Record<string, string> | null {
+  if (!value || value[0] !== "{") return null;
+  try {
+    const obj = JSON.parse(value);
+    if (typeof obj === "object" && obj !== null && !Array.isArray(obj)) return obj;
+  } catch {
+    // 不是 JSON,按纯文本处理
+  }
+  return null;
+}
+
+export function resolveLocalized(value: string | null | undefined, lang: string): string | null {
+  if (value === null || value === undefined) return null;
+  const obj = parseLocalized(value);
+  if (!obj) return value;
+  if (obj[lang]) return obj[lang];
+  const baseLang = lang.split("-")[0];
+  if (obj[baseLang]) return obj[baseLang];
+  if (obj.en) return obj.en;
+  if (obj.zh) return obj.zh;
+  const first = Object.values(obj).find(Boolean);
+  return first ?? "";
+}
+
+/** 源字段哈希:源文本未变化时投影无需重写 */
+export function productTextHash(product: LocalizedSource): string {
+  const hash = createHash("sha256");
+  for (const field of LOCALIZED_PRODUCT_FIELDS) {
+    hash.update(product[field] ?? "\u0000");
+    hash.update("\u0001");
+  }
+  return hash.digest("hex");
+}
+
+/** 生成一个产品在全部支持语言下的投影行 */
+export function projectProductTexts(product: LocalizedSource & { id: number }): InsertProductText[] {
+  const sourceHash = productTextHash(product);
+  return SUPPORTED_LANGUAGES.map((lang) => {
+    const row: InsertProductText = {
+      productId: product.id,
+      lang,
+      name: resolveLocalized(product.name, lang) ?? "",
+      sourceHash,
+    };
+    for (const field of LOCALIZED_PRODUCT_FIELDS) {
+      if (field !== "name") row[field] = resolveLocalized(product[field], lang);
+    }
+    return row;
+  });
+}
+
+/**
+ * 用投影行替换产品的多语言字段,返回只含纯字符串的产品;
+ * 还没有投影行的产品(如刚由脚本直接写库)现场解析
+ */
+export function localizeProduct<T extends LocalizedSource>(
+  product: T,
+  lang: string,
+  text?: Pick<ProductText, LocalizedProductField>
+): T {
+  const localized = { ...product };
+  for (const field of LOCALIZED_PRODUCT_FIELDS) {
+    const value = text ? text[field] : resolveLocalized(product[field], lang);
+    (localized as LocalizedSource)[field] = field === "name" ? value ?? "" : value;
+  }
+  return localized;
+}
@@ -1,4 +1,4 @@
-import { COOKIE_NAME, ONE_YEAR_MS } from "@shared/const";
+import { COOKIE_NAME, ONE_YEAR_MS, SUPPORTED_LANGUAGES } from "@shared/const";
 import { TRPCError } from "@trpc/server";
 import { z } from "zod";
 import bcrypt from "bcryptjs";
@@ -7,6 +7,7 @@ import { sdk } from "./_core/sdk";
 import { systemRouter } from "./_core/systemRouter";
 import { publicProcedure, protectedProcedure, router } from "./_core/trpc";
 import * as db from "./db";
+import type { Product } from "../drizzle/schema";
 
 // 管理员权限中间件
 const adminProcedure = protectedProcedure.use(({ ctx, next }) => {
@@ -16,6 +17,13 @@ const adminProcedure = protectedProcedure.use(({ ctx, next }) => {
   return next({ ctx });
 });
 
+// 传入 lang 时产品文本字段返回该语言的纯字符串(来自 product_texts 投影),否则返回原始多语言 JSON
+const productLang = z.enum(SUPPORTED_LANGUAGES).optional();
+
+function localized<T extends Product>(list: T[], lang: string | undefined): Promise<T[]> {
+  return lang ? db.localizeProducts(list, lang) : Promise.resolve(list);
+}
+
 export const appRouter = router({
   system: systemRouter,
 
@@ -183,10 +191,11 @@ export const appRouter = router({
           blessedOnly: z.boolean().optional(), // 只显示启蕴信物
           limit: z.number().min(1).max(100).default(20),
           offset: z.number().min(0).default(0),
+          lang: productLang,
         })
       )
       .query(async ({ input }) => {
-        const products = await db.getPublishedProducts(input);
+        const products = await localized(await db.getPublishedProducts(input), input.lang);
         
         // 获取每个产品的图片
         const productsWithImages = await Promise.all(
@@ -201,12 +210,13 @@ export const appRouter = router({
 
     // 获取产品详情(公开)
     getBySlug: publicProcedure
-      .input(z.object({ slug: z.string() }))
+      .input(z.object({ slug: z.string(), lang: productLang }))
       .query(async ({ input }) => {
-        const product = await db.getProductBySlug(input.slug);
-        if (!product) {
+        const found = await db.getProductBySlug(input.slug);
+        if (!found) {
           throw new TRPCError({ code: "NOT_FOUND", message: "产品不存在" });
         }
+        const [product] = await localized([found], input.lang);
 
         const images = await db.getProductImages(product.id);
         let reviews: any[] = [];
@@ -240,16 +250,18 @@ export const appRouter = router({
       }),
 
     // 获取精选产品(公开)
-    featured: publicProcedure.query(async () => {
-      const products = await db.getPublishedProducts({ featured: true, limit: 6 });
-      const productsWithImages = await Promise.all(
-        products.map(async (product) => {
-          const images = await db.getProductImages(product.id);
-          return { ...product, images };
-        })
-      );
-      return productsWithImages;
-    }),
+    featured: publicProcedure
+      .input(z.object({ lang: productLang }).optional())
+      .query(async ({ input }) => {
+        const products = await localized(await db.getPublishedProducts({ featured: true, limit: 6 }), input?.lang);
+        const productsWithImages = await Promise.all(
+          products.map(async (product) => {
+            const images = await db.getProductImages(product.id);
+            return { ...product, images };
+          })
+        );
+        return productsWithImages;
+      }),
 
     // 提交评价(需要登录)
     submitReview: protectedProcedure
@@ -277,7 +289,7 @@ export const appRouter = router({
     
     // 根据生日推荐守护吊坠(公开)
     getGuardianRecommendations: publicProcedure
-      .input(z.object({ birthdate: z.string() })) // YYYY-MM-DD格式
+      .input(z.object({ birthdate: z.string(), lang: productLang })) // YYYY-MM-DD格式
       .query(async ({ input }) => {
         const date = new Date(input.birthdate);
         const year = date.getFullYear();
@@ -324,7 +336,7 @@ export const appRouter = router({
         }
 
         // 查询对应的生肖商品
-        const zodiacProducts = await db.getPublishedProducts({ search: zodiacSign, limit: 3 });
+        const zodiacProducts = await localized(await db.getPublishedProducts({ search: zodiacSign, limit: 3 }), input.lang);
         const zodiacWithImages = await Promise.all(
           zodiacProducts.map(async (product) => {
             const images = await db.getProductImages(product.id);
@@ -333,7 +345,7 @@ export const appRouter = router({
         );
 
         // 查询对应的星座商品
-        const constellationProducts = await db.getPublishedProducts({ search: constellationSign, limit: 3 });
+        const constellationProducts = await localized(await db.getPublishedProducts({ search: constellationSign, limit: 3 }), input.lang);
         const constellationWithImages = await Promise.all(
           constellationProducts.map(async (product) => {
             const images = await db.getProductImages(product.id);
@@ -3,3 +3,7 @@ export const ONE_YEAR_MS = 1000 * 60 * 60 * 24 * 365;
 export const AXIOS_TIMEOUT_MS = 30_000;
 export const UNAUTHED_ERR_MSG = 'Please login (10001)';
 export const NOT_ADMIN_ERR_MSG = 'You do not have required permission (10002)';
+
+// 前端支持的语言(与 client/src/i18n/locales 一一对应)
+export const SUPPORTED_LANGUAGES = ['en', 'zh', 'zh-Hant', 'de', 'fr', 'es', 'it', 'pt', 'ru', 'ja', 'ko', 'ar', 'hi', 'th', 'vi', 'id', 'tr'] as const;
+export type SupportedLanguage = (typeof SUPPORTED_LANGUAGES)[number];
@@ -150,7 +150,51 @@ function vitePluginManusDebugCollector(): Plugin {
   };
 }
 
-const plugins = [react(), tailwindcss(), jsxLocPlugin(), vitePluginManusRuntime(), vitePluginManusDebugCollector()];
+/**
+ * Dev-only locale hot reload
+ * - POST /__i18n/hot: scripts/watch-locales.py --push sends [{ lng, section, data }] for changed sections
+ * - Relayed over the HMR socket as the custom event "i18n:update" (handled in client/src/i18n/config.ts)
+ */
+function vitePluginLocaleHotReload(): Plugin {
+  return {
+    name: "locale-hot-reload",
+    apply: "serve",
+
+    configureServer(server: ViteDevServer) {
+      server.middlewares.use("/__i18n/hot", (req, res, next) => {
+        if (req.method !== "POST") {
+          return next();
+        }
+
+        let body = "";
+        req.on("data", (chunk) => {
+          body += chunk.toString();
+        });
+
+        req.on("end", () => {
+          try {
+            const updates = JSON.parse(body);
+            server.ws.send({ type: "custom", event: "i18n:update", data: updates });
+            res.writeHead(200, { "Content-Type": "application/json" });
+            res.end(JSON.stringify({ success: true, clients: server.ws.clients.size }));
+          } catch (e) {
+            res.writeHead(400, { "Content-Type": "application/json" });
+            res.end(JSON.stringify({ success: false, error: String(e) }));
+          }
+        });
+      });
+    },
+  };
+}
+
+const plugins = [
+  react(),
+  tailwindcss(),
+  jsxLocPlugin(),
+  vitePluginManusRuntime(),
+  vitePluginManusDebugCollector(),
+  vitePluginLocaleHotReload(),
+];
 
 export default defineConfig({
   plugins,